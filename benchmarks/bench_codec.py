@@ -0,0 +1,103 @@
+"""
+Compare the JSON codecs on realistic catalog and invoke payloads.
+
+Usage:
+    python benchmarks/bench_codec.py [--tools 2000] [--items 20000] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+# Run from a checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from obot.api.chat import _extract_message, _iter_items
+from obot.codec import CODECS
+from obot.exceptions import ObotConfigError
+
+
+def tool_references(count: int) -> dict:
+    """A ``/api/tool-references`` response with ``count`` tools."""
+    return {
+        "items": [
+            {
+                "id": f"tool-{i}",
+                "name": f"tool-{i}",
+                "description": "Searches the web and returns the top results. " * 3,
+                "type": "toolreference",
+                "toolType": "tool" if i % 10 else "modelProvider",
+                "reference": f"github.com/obot-platform/tools/tool-{i}",
+                "active": True,
+                "resolved": True,
+                "builtin": i % 3 == 0,
+                "created": "2025-03-07T15:04:27-08:00",
+                "revision": str(1000 + i),
+                "credential": [f"tool-{i}-credential"],
+                "params": {"query": "The search query", "limit": "Max results"},
+                "metadata": {"category": f"Category {i % 25}", "icon": "icon.svg"},
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def invoke_response(count: int) -> dict:
+    """An ``/api/invoke`` response with ``count`` progress items."""
+    return {
+        "items": [
+            {
+                "runID": "r1abc",
+                "time": "2025-03-08T18:26:23-08:00",
+                "contentID": f"c{i // 100}",
+                "content": "The quick brown fox jumps over the lazy dog. ",
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tools", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    catalog = tool_references(args.tools)
+    catalog_bytes = json.dumps(catalog).encode()
+    invoke_text = json.dumps(invoke_response(args.items))
+
+    catalog_mb = len(catalog_bytes) / 1e6
+    invoke_mb = len(invoke_text) / 1e6
+    print(f"catalog: {catalog_mb:.2f} MB, invoke: {invoke_mb:.2f} MB")
+    columns = ("decode catalog", "encode catalog", "decode reply", "extract reply")
+    print(f"{'codec':<10}" + "".join(f"{column:>16}" for column in columns))
+
+    def best(func) -> float:
+        return min(timeit.repeat(func, number=1, repeat=args.repeat))
+
+    for name, factory in CODECS.items():
+        try:
+            codec = factory()
+        except ObotConfigError:
+            print(f"{name:<10}{'not installed':>16}")
+            continue
+
+        timings = [
+            best(lambda: codec.loads(catalog_bytes)),
+            best(lambda: codec.dumps(catalog)),
+            best(lambda: codec.loads(invoke_text)),
+            best(lambda: _extract_message(invoke_text, codec.loads)),
+        ]
+        print(f"{name:<10}" + "".join(f"{t * 1000:>14.2f}ms" for t in timings))
+
+    # Replies above the streaming threshold are decoded item by item instead
+    streamed = best(lambda: sum(1 for _ in _iter_items(invoke_text)))
+    print(f"\nreply decoding item by item (large replies): {streamed * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Compare HTTP/1.1 pooling with HTTP/2 multiplexing for concurrent streams.
+
+Starts a local hypercorn server over TLS that streams invoke-like responses,
+then runs ``--streams`` concurrent ``chat`` streams plus ``--gets``
+``agents.get`` calls through ``AsyncObotClient`` with and without
+``http2=True``, and reports wall time, latency and the number of TCP
+connections the server saw. HTTP/2 is negotiated with ALPN exactly as it is
+against a real https deployment, using a throwaway self-signed certificate.
+
+Requires ``poetry install -E http2`` (hypercorn is a dev dependency) and the ``openssl`` CLI.
+
+Usage:
+    python benchmarks/bench_http2.py [--streams 500] [--gets 500] [--chunks 20]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+# Run from a checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from obot import AsyncObotClient
+
+
+def serve(port: int, cert: str, key: str, chunks: int, delay: float) -> None:
+    """Run the test server until the process is terminated."""
+    from hypercorn.asyncio import serve as hypercorn_serve
+    from hypercorn.config import Config
+
+    connections = set()
+
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        path = scope["path"]
+        if path == "/connections":
+            body = str(len(connections)).encode()
+            connections.clear()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": body})
+            return
+        connections.add(tuple(scope["client"]))
+        headers = [(b"content-type", b"application/json")]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        if path.startswith("/api/invoke"):
+            for i in range(chunks):
+                await asyncio.sleep(delay)
+                chunk = b'{"content": "The quick brown fox. "}\n'
+                await send(
+                    {"type": "http.response.body", "body": chunk, "more_body": True}
+                )
+        await send({"type": "http.response.body", "body": b'{"id": "a1", "name": "A"}'})
+
+    config = Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.certfile = cert
+    config.keyfile = key
+    config.accesslog = None
+    config.errorlog = None
+    config.backlog = 2048
+    asyncio.run(hypercorn_serve(app, config))
+
+
+def self_signed_certificate(directory: str) -> tuple:
+    """Create a certificate for localhost and return (cert, key) paths."""
+    cert = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", key, "-out", cert, "-days", "1", "-subj", "/CN=localhost",
+            "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )  # fmt: skip
+    return cert, key
+
+
+async def run(client: AsyncObotClient, base: str, streams: int, gets: int) -> dict:
+    latencies = []
+
+    async def stream(i: int) -> None:
+        started = time.perf_counter()
+        async for _ in await client.chat(f"a{i}", "hi", stream=True):
+            pass
+        latencies.append(time.perf_counter() - started)
+
+    async def get(i: int) -> None:
+        started = time.perf_counter()
+        await client.agents.get(f"a{i}")
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(stream(i) for i in range(streams)), *(get(i) for i in range(gets))
+    )
+    elapsed = time.perf_counter() - started
+    async with httpx.AsyncClient() as http:
+        connections = int((await http.get(f"{base}/connections")).text)
+    return {
+        "elapsed": elapsed,
+        "p50": statistics.median(latencies),
+        "p99": statistics.quantiles(latencies, n=100)[98],
+        "connections": connections,
+    }
+
+
+async def bench(base: str, streams: int, gets: int) -> None:
+    print(f"{'transport':<10} {'wall':>9} {'p50':>9} {'p99':>9} {'connections':>12}")
+    for name, http2 in (("HTTP/1.1", False), ("HTTP/2", True)):
+        async with AsyncObotClient(base_url=base, http2=http2) as client:
+            await run(client, base, 2, 0)  # warm up
+            result = await run(client, base, streams, gets)
+        print(
+            f"{name:<10} {result['elapsed'] * 1000:>7.0f}ms"
+            f" {result['p50'] * 1000:>7.0f}ms {result['p99'] * 1000:>7.0f}ms"
+            f" {result['connections']:>12}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--streams", type=int, default=500)
+    parser.add_argument("--gets", type=int, default=500)
+    parser.add_argument("--chunks", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.01)
+    args = parser.parse_args()
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = self_signed_certificate(directory)
+        # httpx trusts the certificate through SSL_CERT_FILE
+        os.environ["SSL_CERT_FILE"] = cert
+        server = multiprocessing.Process(
+            target=serve, args=(port, cert, key, args.chunks, args.delay), daemon=True
+        )
+        server.start()
+        try:
+            base = f"https://localhost:{port}"
+            for _ in range(100):
+                try:
+                    httpx.get(f"{base}/connections")
+                    break
+                except httpx.TransportError:
+                    time.sleep(0.05)
+            print(
+                f"{args.streams} streams x {args.chunks} chunks + {args.gets} GETs,"
+                f" {args.delay * 1000:.0f}ms between chunks\n"
+            )
+            asyncio.run(bench(base, args.streams, args.gets))
+        finally:
+            server.terminate()
+
+
+if __name__ == "__main__":
+    main()
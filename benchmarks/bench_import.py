@@ -0,0 +1,89 @@
+"""
+Measure cold import and client startup time with ``python -X importtime``.
+
+Exits non-zero when startup exceeds ``--max-ms`` or when constructing a client
+eagerly imports API modules, so it can gate changes in CI.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat 5] [--max-ms 600]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import obot": "import obot",
+    "client": "import obot; obot.ObotClient('http://localhost:8080')",
+    "client + chat": "import obot; obot.ObotClient('http://localhost:8080').chat",
+}
+
+# Modules that constructing a client must not import
+LAZY_MODULES = (
+    "obot.api.agents",
+    "obot.api.threads",
+    "obot.catalog",
+    "obot.models.agent",
+    "obot.models.tool",
+    "pydantic",
+)
+
+
+def run(code: str) -> tuple:
+    """Run ``code`` in a fresh interpreter; return (total µs, modules)."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    modules = set()
+    started = False
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line[12:]:
+            continue
+        _, cumulative, name = line[12:].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        if started and not name.startswith("  "):
+            # Top-level imports include everything they pulled in
+            total += int(cumulative)
+        # Everything up to ``site`` is interpreter startup
+        started = started or name.strip() == "site"
+        modules.add(name.strip())
+    return total, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=600.0)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<16}{'best':>12}{'obot modules':>16}")
+    failed = False
+    for label, code in SCENARIOS.items():
+        runs = [run(code) for _ in range(args.repeat)]
+        best = min(total for total, _ in runs) / 1000
+        modules = runs[0][1]
+        count = sum(1 for m in modules if m.startswith("obot"))
+        print(f"{label:<16}{best:>10.1f}ms{count:>16}")
+
+        eager = [m for m in LAZY_MODULES if m in modules]
+        if eager:
+            print(f"  eagerly imported: {', '.join(eager)}")
+            failed = True
+        if best > args.max_ms:
+            print(f"  exceeds {args.max_ms:.0f}ms")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Measure objects/sec for each validation mode, and for compact records, on
+catalog and agent payloads.
+
+Usage:
+    python benchmarks/bench_validation.py [--count 5000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+# Run from a checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from obot.models import Agent, Tool
+from obot.validation import VALIDATION_MODES, ModelBuilder
+
+
+def tool_items(count: int) -> list:
+    return [
+        {
+            "id": f"tool-{i}",
+            "name": f"tool-{i}",
+            "description": "Searches the web and returns the top results.",
+            "type": "toolreference",
+            "toolType": "tool",
+            "reference": f"github.com/obot-platform/tools/tool-{i}",
+            "active": True,
+            "resolved": True,
+            "builtin": False,
+            "created": "2025-03-07T15:04:27-08:00",
+            "revision": str(1000 + i),
+            "params": {"query": "The search query"},
+            "metadata": {"category": f"Category {i % 25}", "icon": "icon.svg"},
+        }
+        for i in range(count)
+    ]
+
+
+def agent_items(count: int) -> list:
+    return [
+        {
+            "name": f"Agent {i}",
+            "description": "A test agent",
+            "prompt": "You are a helpful assistant. " * 10,
+            "model": "m1-gpt-4o",
+            "tools": ["time", "knowledge", "workspace-files"],
+            "id": f"a{i}",
+            "created": "2025-03-07T15:04:27-08:00",
+            "revision": "10",
+            "links": {"invoke": f"http://localhost:8080/api/invoke/a{i}"},
+            "type": "agent",
+            "icons": {"icon": "/user/images/obot-icon-blue.svg"},
+            "alias": f"agent-{i}",
+            "defaultThreadTools": ["images-bundle", "google-search-bundle"],
+            "aliasAssigned": True,
+            "toolInfo": {
+                "time": {"authorized": True},
+                "knowledge": {"authorized": True},
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payloads = {Tool: tool_items(args.count), Agent: agent_items(args.count)}
+    print(f"{'mode':<10}" + "".join(f"{m.__name__ + '/s':>14}" for m in payloads))
+
+    builders = {mode: ModelBuilder(mode) for mode in VALIDATION_MODES}
+    builders["records"] = ModelBuilder(records=True)
+    for mode, builder in builders.items():
+        rates = []
+        for model, items in payloads.items():
+            best = min(
+                timeit.repeat(
+                    lambda: builder.build_list(model, items),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            rates.append(len(items) / best)
+        print(f"{mode:<10}" + "".join(f"{rate:>14,.0f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
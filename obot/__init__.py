@@ -0,0 +1,42 @@
+"""Python client for the Obot platform."""
+
+from typing import TYPE_CHECKING
+from .lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .sync_client import ObotClient
+    from .async_client import AsyncObotClient
+    from .exceptions import (
+        ObotError,
+        ObotAPIError,
+        ObotAuthError,
+        ObotConfigError,
+        AgentNotFoundError,
+        AgentConflictError,
+        CircuitOpenError,
+        DeadlineExceededError,
+    )
+    from .deadlines import deadline, remaining
+    from .response import ResponseMeta, last_response
+
+# Client modules (and httpx/pydantic) are imported on first use of their names
+_EXPORTS = {
+    "ObotClient": ".sync_client",
+    "AsyncObotClient": ".async_client",
+    "ObotError": ".exceptions",
+    "ObotAPIError": ".exceptions",
+    "ObotAuthError": ".exceptions",
+    "ObotConfigError": ".exceptions",
+    "AgentNotFoundError": ".exceptions",
+    "AgentConflictError": ".exceptions",
+    "CircuitOpenError": ".exceptions",
+    "DeadlineExceededError": ".exceptions",
+    "deadline": ".deadlines",
+    "remaining": ".deadlines",
+    "ResponseMeta": ".response",
+    "last_response": ".response",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -1,7 +1,137 @@
-from typing import List, Optional, Dict, Any, Union
+from typing import (
+    List,
+    Optional,
+    Dict,
+    Any,
+    Union,
+    Iterable,
+    Tuple,
+    AsyncIterator,
+    Iterator,
+)
 from httpx import Response
 from .base import BaseAPI
-from ..models import Agent, Model, Tool
+from ..batch import BatchResult, run_batch, run_batch_sync
+from ..exceptions import AgentConflictError, ObotAPIError
+from ..models import Agent, Model
+from ..records import AgentRecord
+from ..validation import ModelBuilder
+
+# A bulk update item: the agent (or its ID) and the fields to change
+AgentUpdate = Tuple[Union[str, Agent], Dict[str, Any]]
+
+
+def _active_model_ids(resp: Dict[str, Any], builder: ModelBuilder) -> Dict[str, str]:
+    """Map active model names to their IDs from a ``/api/models`` response."""
+    model_ids: Dict[str, str] = {}
+    for model in builder.build_list(Model, resp.get("items", [])):
+        if model.active:
+            model_ids.setdefault(model.name, model.id)
+    return model_ids
+
+
+def _model_ids(api: BaseAPI, resp: Dict[str, Any]) -> Dict[str, str]:
+    """Return the active model IDs of a cached ``/api/models`` response."""
+    return api._derived(
+        "/api/models",
+        resp,
+        "active_model_ids",
+        lambda resp: _active_model_ids(resp, api._builder()),
+    )
+
+
+def _lookup_model_id(model_ids: Dict[str, str], model_name: str) -> str:
+    """
+    Convert a model name to its ID using a name to ID map of active models.
+
+    Raises:
+        ValueError: If the model name doesn't exist or isn't active
+    """
+    model_id = model_ids.get(model_name)
+    if model_id is None:
+        raise ValueError(
+            f"Model '{model_name}' not found or not active. Available active models: "
+            f"{', '.join(model_ids)}"
+        )
+    return model_id
+
+
+def _check_tool_ids(valid_ids: Iterable[str], tool_ids: List[str]) -> None:
+    """
+    Validate tool IDs against the set of known tool IDs.
+
+    Raises:
+        ValueError: If any tool ID doesn't exist
+    """
+    invalid_ids = [tid for tid in tool_ids if tid not in valid_ids]
+
+    if invalid_ids:
+        raise ValueError(
+            f"Invalid tool IDs: {', '.join(invalid_ids)}. "
+            f"Available tool IDs: {', '.join(valid_ids)}"
+        )
+
+
+def _resolve_fields(
+    fields: Dict[str, Any],
+    model_ids: Optional[Dict[str, str]],
+    valid_tool_ids: Optional[Iterable[str]],
+) -> Optional[Exception]:
+    """
+    Resolve the model name and validate the tool IDs of one batch item in place.
+
+    Returns:
+        The validation error for this item, or None
+    """
+    try:
+        if "model" in fields:
+            fields["model"] = _lookup_model_id(model_ids, fields["model"])
+        if "tools" in fields:
+            _check_tool_ids(valid_tool_ids, fields["tools"])
+    except ValueError as e:
+        return e
+    return None
+
+
+def _prepare_update(
+    current: Agent, changes: Dict[str, Any], revision: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    """
+    Build the PUT body for an update of an already-held agent.
+
+    Args:
+        current: The agent state held by the caller
+        changes: Resolved field updates
+        revision: Expected revision (defaults to the held agent's revision)
+
+    Returns:
+        The request body, or None if no field actually changes
+    """
+    changed = {
+        key: value
+        for key, value in changes.items()
+        if getattr(current, key, None) != value
+    }
+    if not changed:
+        return None
+
+    update_data = current.model_dump(exclude_unset=True)
+    update_data.update(changed)
+    expected = revision if revision is not None else current.revision
+    if expected is not None:
+        update_data["revision"] = expected
+    return update_data
+
+
+def _raise_conflict(
+    error: ObotAPIError, agent_id: str, revision: Optional[str]
+) -> None:
+    """Translate a 409 response into an AgentConflictError."""
+    if error.status_code == 409:
+        raise AgentConflictError(
+            agent_id, revision, response_text=error.response_text
+        ) from error
+    raise error
 
 
 class AgentsAPI(BaseAPI):
@@ -14,8 +144,8 @@ class AgentsAPI(BaseAPI):
 
     async def __call__(self) -> List[Agent]:
         """List all agents."""
-        resp = await self.get("/api/agents")
-        return [Agent(**item) for item in resp.get("items", [])]
+        resp = await super().get("/api/agents")
+        return self._builder().build_list(Agent, resp.get("items", []))
 
     async def get(self, agent_id: str) -> Agent:
         """
@@ -23,9 +153,11 @@ class AgentsAPI(BaseAPI):
 
         Args:
             agent_id: The ID of the agent to retrieve
+
+        Concurrent calls for the same agent share one request and return the
+        same ``Agent``.
         """
-        resp = await self.get(f"/api/agents/{agent_id}")
-        return Agent(**resp)
+        return await super().get(f"/api/agents/{agent_id}", model=Agent)
 
     async def _get_model_id(self, model_name: str) -> str:
         """
@@ -37,18 +169,8 @@ class AgentsAPI(BaseAPI):
         Raises:
             ValueError: If the model name doesn't exist or isn't active
         """
-        resp = await self.get("/api/models")
-        models = [Model(**item) for item in resp.get("items", [])]
-        active_models = [m for m in models if m.active]
-
-        for model in active_models:
-            if model.name == model_name:
-                return model.id
-
-        raise ValueError(
-            f"Model '{model_name}' not found or not active. Available active models: "
-            f"{', '.join(m.name for m in active_models)}"
-        )
+        resp = await self.get_cached("/api/models")
+        return _lookup_model_id(_model_ids(self, resp), model_name)
 
     async def _get_tool_ids(self, tool_names: List[str]) -> List[str]:
         """
@@ -63,23 +185,19 @@ class AgentsAPI(BaseAPI):
         Raises:
             ValueError: If any tool name doesn't exist
         """
-        resp = await self.get("/api/tool-references")
-        tools = [
-            Tool(**item)
-            for item in resp.get("items", [])
-            if item.get("toolType") == "tool"
+        catalog = await self.tool_catalog()
+        tool_ids = [catalog.id_for_name(name) for name in tool_names]
+        invalid_tools = [
+            name for name, tool_id in zip(tool_names, tool_ids) if tool_id is None
         ]
 
-        tool_map = {tool.name: tool.id for tool in tools}
-        invalid_tools = [name for name in tool_names if name not in tool_map]
-
         if invalid_tools:
             raise ValueError(
                 f"Invalid tool names: {', '.join(invalid_tools)}. "
-                f"Available tools: {', '.join(tool_map.keys())}"
+                f"Available tools: {', '.join(catalog.names())}"
             )
 
-        return [tool_map[name] for name in tool_names]
+        return tool_ids
 
     async def _validate_tool_ids(self, tool_ids: List[str]) -> None:
         """
@@ -91,21 +209,59 @@ class AgentsAPI(BaseAPI):
         Raises:
             ValueError: If any tool ID doesn't exist
         """
-        resp = await self.get("/api/tool-references")
-        tools = [
-            Tool(**item)
-            for item in resp.get("items", [])
-            if item.get("toolType") == "tool"
-        ]
+        catalog = await self.tool_catalog()
+        _check_tool_ids(catalog.ids(), tool_ids)
 
-        valid_ids = {tool.id for tool in tools}
-        invalid_ids = [tid for tid in tool_ids if tid not in valid_ids]
+    async def _resolve_batch(
+        self, batch: List[Dict[str, Any]]
+    ) -> List[Optional[Exception]]:
+        """
+        Resolve model names and validate tool IDs for a whole batch in place.
 
-        if invalid_ids:
-            raise ValueError(
-                f"Invalid tool IDs: {', '.join(invalid_ids)}. "
-                f"Available tool IDs: {', '.join(valid_ids)}"
-            )
+        Each catalog is fetched at most once for the batch.
+
+        Returns:
+            The validation error of each item (None for valid items)
+        """
+        model_ids = valid_tool_ids = None
+        if any("model" in fields for fields in batch):
+            model_ids = _model_ids(self, await self.get_cached("/api/models"))
+        if any("tools" in fields for fields in batch):
+            valid_tool_ids = (await self.tool_catalog()).ids()
+        return [_resolve_fields(fields, model_ids, valid_tool_ids) for fields in batch]
+
+    async def _create(self, data: Dict[str, Any]) -> Agent:
+        """Create an agent from an already-resolved request body."""
+        resp = await self.post("/api/agents", json=data)
+        return self._builder().build(Agent, resp)
+
+    async def _update(
+        self,
+        agent_id: Union[str, Agent],
+        changes: Dict[str, Any],
+        revision: Optional[str] = None,
+    ) -> Agent:
+        """Apply already-resolved changes to an agent."""
+        if isinstance(agent_id, AgentRecord):
+            agent_id = agent_id.to_model()
+        if isinstance(agent_id, Agent):
+            current_agent = agent_id
+            agent_id = current_agent.id
+        else:
+            # Get current agent state
+            current_agent = await self.get(agent_id)
+            if revision is not None and current_agent.revision != revision:
+                raise AgentConflictError(agent_id, revision, current_agent.revision)
+
+        update_data = _prepare_update(current_agent, changes, revision)
+        if update_data is None:
+            return current_agent
+
+        try:
+            resp = await self.put(f"/api/agents/{agent_id}", json=update_data)
+        except ObotAPIError as e:
+            _raise_conflict(e, agent_id, update_data.get("revision"))
+        return self._builder().build(Agent, resp)
 
     async def create(self, **kwargs) -> Agent:
         """
@@ -127,15 +283,29 @@ class AgentsAPI(BaseAPI):
         if "tools" in kwargs:
             await self._validate_tool_ids(kwargs["tools"])
 
-        resp = await self.post("/api/agents", json=kwargs)
-        return Agent(**resp)
+        return await self._create(kwargs)
 
-    async def update(self, agent_id: str, **kwargs) -> Agent:
+    async def update(
+        self,
+        agent_id: Union[str, Agent],
+        *,
+        revision: Optional[str] = None,
+        **kwargs,
+    ) -> Agent:
         """
         Update specific fields of an existing agent.
 
+        Passing an already-held ``Agent`` instead of its ID skips the read of the
+        current state, so the update is a single PUT (model and tool catalogs are
+        served from the catalog cache). Only fields whose value differs from the
+        held agent are changed; if nothing differs no request is made.
+
         Args:
-            agent_id: The ID of the agent to update
+            agent_id: The ID of the agent to update, or the current ``Agent``
+                (or ``AgentRecord``)
+            revision: Expected revision of the agent. Defaults to the revision of
+                the held ``Agent``; with an ID it is checked against the fetched
+                state before writing.
             **kwargs: Fields to update (only specified fields will be modified), including:
                 name: Agent name
                 description: Agent description
@@ -145,11 +315,8 @@ class AgentsAPI(BaseAPI):
 
         Raises:
             ValueError: If the model doesn't exist or any tool IDs are invalid
+            AgentConflictError: If the agent's revision no longer matches
         """
-        # Get current agent state
-        current_agent = await self.get(agent_id)
-        update_data = current_agent.model_dump(exclude_unset=True)
-
         # Only update fields that were passed
         if "model" in kwargs:
             kwargs["model"] = await self._get_model_id(kwargs["model"])
@@ -157,9 +324,99 @@ class AgentsAPI(BaseAPI):
         if "tools" in kwargs:
             await self._validate_tool_ids(kwargs["tools"])
 
-        update_data.update(kwargs)
-        resp = await self.put(f"/api/agents/{agent_id}", json=update_data)
-        return Agent(**resp)
+        return await self._update(agent_id, kwargs, revision)
+
+    async def create_many(
+        self,
+        specs: Iterable[Dict[str, Any]],
+        *,
+        concurrency: int = 8,
+        fail_fast: bool = False,
+    ) -> List[BatchResult[Agent]]:
+        """
+        Create many agents concurrently.
+
+        Model names and tool IDs are resolved once for the whole batch, then
+        the creates are dispatched concurrently over the client's shared
+        connection pool.
+
+        Args:
+            specs: Keyword arguments for ``create`` of each agent
+            concurrency: Maximum number of creates in flight
+            fail_fast: Raise on the first error instead of collecting every
+                error in the results
+
+        Returns:
+            One BatchResult per spec, in input order
+        """
+        specs = list(specs)
+        batch = [dict(spec) for spec in specs]
+        errors = await self._resolve_batch(batch)
+        results = await run_batch(
+            self._create,
+            batch,
+            concurrency=concurrency,
+            fail_fast=fail_fast,
+            errors=errors,
+        )
+        for result, spec in zip(results, specs):
+            result.input = spec
+        return results
+
+    async def update_many(
+        self,
+        updates: Iterable[AgentUpdate],
+        *,
+        concurrency: int = 8,
+        fail_fast: bool = False,
+    ) -> List[BatchResult[Agent]]:
+        """
+        Update many agents concurrently.
+
+        Model names and tool IDs are resolved once for the whole batch, then
+        the updates are dispatched concurrently over the client's shared
+        connection pool.
+
+        Args:
+            updates: ``(agent_or_id, fields)`` pairs, where ``fields`` are the
+                keyword arguments for ``update`` (including ``revision``)
+            concurrency: Maximum number of updates in flight
+            fail_fast: Raise on the first error instead of collecting every
+                error in the results
+
+        Returns:
+            One BatchResult per update, in input order
+        """
+        updates = list(updates)
+        batch = [dict(fields) for _, fields in updates]
+        errors = await self._resolve_batch(batch)
+
+        async def apply(item: Tuple[Union[str, Agent], Dict[str, Any]]) -> Agent:
+            agent_id, changes = item
+            revision = changes.pop("revision", None)
+            return await self._update(agent_id, changes, revision)
+
+        results = await run_batch(
+            apply,
+            [(agent_id, fields) for (agent_id, _), fields in zip(updates, batch)],
+            concurrency=concurrency,
+            fail_fast=fail_fast,
+            errors=errors,
+        )
+        for result, update in zip(results, updates):
+            result.input = update
+        return results
+
+    def iter(self, page_size: int = 100) -> AsyncIterator[Agent]:
+        """
+        Lazily iterate over all agents, fetching pages as they are consumed.
+
+        Args:
+            page_size: Number of agents requested per page
+        """
+        return self.paginate(
+            "/api/agents", self._builder().factory(Agent), page_size=page_size
+        )
 
 
 class SyncAgentsAPI(BaseAPI):
@@ -173,7 +430,7 @@ class SyncAgentsAPI(BaseAPI):
     def __call__(self) -> List[Agent]:
         """List all agents."""
         resp = self.get_sync("/api/agents")
-        return [Agent(**item) for item in resp.get("items", [])]
+        return self._builder().build_list(Agent, resp.get("items", []))
 
     def get(self, agent_id: str) -> Agent:
         """
@@ -181,9 +438,11 @@ class SyncAgentsAPI(BaseAPI):
 
         Args:
             agent_id: The ID of the agent to retrieve
+
+        Concurrent calls for the same agent share one request and return the
+        same ``Agent``.
         """
-        resp = self.get_sync(f"/api/agents/{agent_id}")
-        return Agent(**resp)
+        return self.get_sync(f"/api/agents/{agent_id}", model=Agent)
 
     def _get_model_id(self, model_name: str) -> str:
         """
@@ -195,18 +454,8 @@ class SyncAgentsAPI(BaseAPI):
         Raises:
             ValueError: If the model name doesn't exist or isn't active
         """
-        resp = self.get_sync("/api/models")
-        models = [Model(**item) for item in resp.get("items", [])]
-        active_models = [m for m in models if m.active]
-
-        for model in active_models:
-            if model.name == model_name:
-                return model.id
-
-        raise ValueError(
-            f"Model '{model_name}' not found or not active. Available active models: "
-            f"{', '.join(m.name for m in active_models)}"
-        )
+        resp = self.get_cached_sync("/api/models")
+        return _lookup_model_id(_model_ids(self, resp), model_name)
 
     def _get_tool_ids(self, tool_names: List[str]) -> List[str]:
         """
@@ -221,23 +470,19 @@ class SyncAgentsAPI(BaseAPI):
         Raises:
             ValueError: If any tool name doesn't exist
         """
-        resp = self.get_sync("/api/tool-references")
-        tools = [
-            Tool(**item)
-            for item in resp.get("items", [])
-            if item.get("toolType") == "tool"
+        catalog = self.tool_catalog_sync()
+        tool_ids = [catalog.id_for_name(name) for name in tool_names]
+        invalid_tools = [
+            name for name, tool_id in zip(tool_names, tool_ids) if tool_id is None
         ]
 
-        tool_map = {tool.name: tool.id for tool in tools}
-        invalid_tools = [name for name in tool_names if name not in tool_map]
-
         if invalid_tools:
             raise ValueError(
                 f"Invalid tool names: {', '.join(invalid_tools)}. "
-                f"Available tools: {', '.join(tool_map.keys())}"
+                f"Available tools: {', '.join(catalog.names())}"
             )
 
-        return [tool_map[name] for name in tool_names]
+        return tool_ids
 
     def _validate_tool_ids(self, tool_ids: List[str]) -> None:
         """
@@ -249,21 +494,57 @@ class SyncAgentsAPI(BaseAPI):
         Raises:
             ValueError: If any tool ID doesn't exist
         """
-        resp = self.get_sync("/api/tool-references")
-        tools = [
-            Tool(**item)
-            for item in resp.get("items", [])
-            if item.get("toolType") == "tool"
-        ]
+        catalog = self.tool_catalog_sync()
+        _check_tool_ids(catalog.ids(), tool_ids)
+
+    def _resolve_batch(self, batch: List[Dict[str, Any]]) -> List[Optional[Exception]]:
+        """
+        Resolve model names and validate tool IDs for a whole batch in place.
 
-        valid_ids = {tool.id for tool in tools}
-        invalid_ids = [tid for tid in tool_ids if tid not in valid_ids]
+        Each catalog is fetched at most once for the batch.
 
-        if invalid_ids:
-            raise ValueError(
-                f"Invalid tool IDs: {', '.join(invalid_ids)}. "
-                f"Available tool IDs: {', '.join(valid_ids)}"
-            )
+        Returns:
+            The validation error of each item (None for valid items)
+        """
+        model_ids = valid_tool_ids = None
+        if any("model" in fields for fields in batch):
+            model_ids = _model_ids(self, self.get_cached_sync("/api/models"))
+        if any("tools" in fields for fields in batch):
+            valid_tool_ids = (self.tool_catalog_sync()).ids()
+        return [_resolve_fields(fields, model_ids, valid_tool_ids) for fields in batch]
+
+    def _create(self, data: Dict[str, Any]) -> Agent:
+        """Create an agent from an already-resolved request body."""
+        resp = self.post_sync("/api/agents", json=data)
+        return self._builder().build(Agent, resp)
+
+    def _update(
+        self,
+        agent_id: Union[str, Agent],
+        changes: Dict[str, Any],
+        revision: Optional[str] = None,
+    ) -> Agent:
+        """Apply already-resolved changes to an agent."""
+        if isinstance(agent_id, AgentRecord):
+            agent_id = agent_id.to_model()
+        if isinstance(agent_id, Agent):
+            current_agent = agent_id
+            agent_id = current_agent.id
+        else:
+            # Get current agent state
+            current_agent = self.get(agent_id)
+            if revision is not None and current_agent.revision != revision:
+                raise AgentConflictError(agent_id, revision, current_agent.revision)
+
+        update_data = _prepare_update(current_agent, changes, revision)
+        if update_data is None:
+            return current_agent
+
+        try:
+            resp = self.put_sync(f"/api/agents/{agent_id}", json=update_data)
+        except ObotAPIError as e:
+            _raise_conflict(e, agent_id, update_data.get("revision"))
+        return self._builder().build(Agent, resp)
 
     def create(self, **kwargs) -> Agent:
         """
@@ -285,15 +566,29 @@ class SyncAgentsAPI(BaseAPI):
         if "tools" in kwargs:
             self._validate_tool_ids(kwargs["tools"])
 
-        resp = self.post_sync("/api/agents", json=kwargs)
-        return Agent(**resp)
+        return self._create(kwargs)
 
-    def update(self, agent_id: str, **kwargs) -> Agent:
+    def update(
+        self,
+        agent_id: Union[str, Agent],
+        *,
+        revision: Optional[str] = None,
+        **kwargs,
+    ) -> Agent:
         """
         Update specific fields of an existing agent.
 
+        Passing an already-held ``Agent`` instead of its ID skips the read of the
+        current state, so the update is a single PUT (model and tool catalogs are
+        served from the catalog cache). Only fields whose value differs from the
+        held agent are changed; if nothing differs no request is made.
+
         Args:
-            agent_id: The ID of the agent to update
+            agent_id: The ID of the agent to update, or the current ``Agent``
+                (or ``AgentRecord``)
+            revision: Expected revision of the agent. Defaults to the revision of
+                the held ``Agent``; with an ID it is checked against the fetched
+                state before writing.
             **kwargs: Fields to update (only specified fields will be modified), including:
                 name: Agent name
                 description: Agent description
@@ -303,11 +598,8 @@ class SyncAgentsAPI(BaseAPI):
 
         Raises:
             ValueError: If the model doesn't exist or any tool IDs are invalid
+            AgentConflictError: If the agent's revision no longer matches
         """
-        # Get current agent state
-        current_agent = self.get(agent_id)
-        update_data = current_agent.model_dump(exclude_unset=True)
-
         # Only update fields that were passed
         if "model" in kwargs:
             kwargs["model"] = self._get_model_id(kwargs["model"])
@@ -315,6 +607,96 @@ class SyncAgentsAPI(BaseAPI):
         if "tools" in kwargs:
             self._validate_tool_ids(kwargs["tools"])
 
-        update_data.update(kwargs)
-        resp = self.put_sync(f"/api/agents/{agent_id}", json=update_data)
-        return Agent(**resp)
+        return self._update(agent_id, kwargs, revision)
+
+    def create_many(
+        self,
+        specs: Iterable[Dict[str, Any]],
+        *,
+        concurrency: int = 8,
+        fail_fast: bool = False,
+    ) -> List[BatchResult[Agent]]:
+        """
+        Create many agents concurrently.
+
+        Model names and tool IDs are resolved once for the whole batch, then
+        the creates are dispatched from a thread pool over the client's shared
+        connection pool.
+
+        Args:
+            specs: Keyword arguments for ``create`` of each agent
+            concurrency: Maximum number of creates in flight
+            fail_fast: Raise on the first error instead of collecting every
+                error in the results
+
+        Returns:
+            One BatchResult per spec, in input order
+        """
+        specs = list(specs)
+        batch = [dict(spec) for spec in specs]
+        errors = self._resolve_batch(batch)
+        results = run_batch_sync(
+            self._create,
+            batch,
+            concurrency=concurrency,
+            fail_fast=fail_fast,
+            errors=errors,
+        )
+        for result, spec in zip(results, specs):
+            result.input = spec
+        return results
+
+    def update_many(
+        self,
+        updates: Iterable[AgentUpdate],
+        *,
+        concurrency: int = 8,
+        fail_fast: bool = False,
+    ) -> List[BatchResult[Agent]]:
+        """
+        Update many agents concurrently.
+
+        Model names and tool IDs are resolved once for the whole batch, then
+        the updates are dispatched from a thread pool over the client's shared
+        connection pool.
+
+        Args:
+            updates: ``(agent_or_id, fields)`` pairs, where ``fields`` are the
+                keyword arguments for ``update`` (including ``revision``)
+            concurrency: Maximum number of updates in flight
+            fail_fast: Raise on the first error instead of collecting every
+                error in the results
+
+        Returns:
+            One BatchResult per update, in input order
+        """
+        updates = list(updates)
+        batch = [dict(fields) for _, fields in updates]
+        errors = self._resolve_batch(batch)
+
+        def apply(item: Tuple[Union[str, Agent], Dict[str, Any]]) -> Agent:
+            agent_id, changes = item
+            revision = changes.pop("revision", None)
+            return self._update(agent_id, changes, revision)
+
+        results = run_batch_sync(
+            apply,
+            [(agent_id, fields) for (agent_id, _), fields in zip(updates, batch)],
+            concurrency=concurrency,
+            fail_fast=fail_fast,
+            errors=errors,
+        )
+        for result, update in zip(results, updates):
+            result.input = update
+        return results
+
+    def iter(self, page_size: int = 100) -> Iterator[Agent]:
+        """
+        Lazily iterate over all agents, fetching pages as they are consumed.
+
+        Args:
+            page_size: Number of agents requested per page
+        """
+        return self.paginate_sync(
+            "/api/agents", self._builder().factory(Agent), page_size=page_size
+        )
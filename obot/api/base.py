@@ -1,5 +1,7 @@
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Optional,
     Union,
@@ -8,28 +10,98 @@ from typing import (
     Generic,
     Iterator,
     AsyncIterator,
+    Awaitable,
+    Set,
     Tuple,
+    Type,
+    Hashable,
 )
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+import asyncio
 import httpx
 import logging
+import threading
+import time
 from ..exceptions import (
     ObotAPIError,
     ObotAuthError,
     ObotConfigError,
     AgentNotFoundError,
+    DeadlineExceededError,
 )
+from ..cache import CatalogCache
+from ..deadlines import (
+    bounded_timeout,
+    check_deadline,
+    current_deadline,
+    deadline_exceeded,
+    remaining,
+)
+from ..hedge import HedgePolicy
+from ..httpcache import CachedResponse, ResponseCache, copy_value
+from ..codec import JSONCodec
+from ..response import ResponseMeta, _record, _share, last_response
+from ..retry import RetryPolicy
+from ..circuit import CircuitBreaker
+from ..endpoints import endpoint_group
+from ..ratelimit import RateLimiter
+from ..singleflight import SingleFlight
+from ..snapshot import CatalogSnapshot, SnapshotEntry
+from ..transport import create_http_client
+from ..validation import ModelBuilder
 from urllib.parse import urljoin
 from httpx import HTTPStatusError
 
+if TYPE_CHECKING:
+    from ..catalog import ToolCatalog
+
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
+# Snapshot revalidations in flight, referenced so they aren't garbage collected
+_BACKGROUND_TASKS: Set["asyncio.Task[None]"] = set()
+
+
+def _raise_if_deadline(error: Optional[BaseException]) -> None:
+    """Raise DeadlineExceededError if ``error`` is a timeout past the deadline."""
+    if isinstance(error, DeadlineExceededError):
+        return
+    if isinstance(error, (httpx.TimeoutException, TimeoutError)):
+        left = remaining()
+        if left is not None and left <= 0:
+            raise deadline_exceeded() from error
+
+
+# Codec, model builder and retry policy used by APIs constructed without a parent client
+_DEFAULT_CODEC = JSONCodec()
+_DEFAULT_BUILDER = ModelBuilder()
+_DEFAULT_RETRY = RetryPolicy()
+
 
 class PaginatedResponse(Dict[str, Any]):
     """Helper class to handle paginated responses."""
 
+    @classmethod
+    def from_response(cls, resp: Any) -> "PaginatedResponse":
+        """Wrap a list response, accepting either an object or a bare array."""
+        return cls(resp) if isinstance(resp, dict) else cls(items=resp or [])
+
     @property
     def items(self) -> List[Any]:
-        return self.get("items", [])
+        return self.get("items") or []
+
+    @property
+    def continue_token(self) -> Optional[str]:
+        """Token for the next page, if the server returned one."""
+        return self.get("continue") or (self.get("metadata") or {}).get("continue")
+
+
+def _copy_body(shared: Tuple[Any, ResponseMeta]) -> Tuple[Any, ResponseMeta]:
+    """Give a coalesced caller its own copy of a shared GET result."""
+    body, meta = shared
+    return copy_value(body), meta
 
 
 class BaseAPI:
@@ -49,7 +121,105 @@ class BaseAPI:
         self._timeout = timeout
         self._is_async = is_async
         self._client = client
-        self._last_response_headers = {}
+        # Pool owned by this API when it is used without a parent client
+        self._own_http: Optional[Union[httpx.Client, httpx.AsyncClient]] = None
+
+    def _http(self) -> Union[httpx.Client, httpx.AsyncClient]:
+        """Return the pooled HTTP client shared with the parent client."""
+        shared = getattr(self._client, "_http", None)
+        if shared is not None:
+            return shared
+        if self._own_http is None:
+            self._own_http = create_http_client(
+                is_async=self._is_async, timeout=self._timeout
+            )
+        return self._own_http
+
+    def _catalog_cache(self) -> Optional[CatalogCache]:
+        """Return the parent client's catalog cache, if any."""
+        return getattr(self._client, "catalog_cache", None)
+
+    def _derived(
+        self, path: str, resp: Any, name: str, compute: Callable[[Any], Any]
+    ) -> Any:
+        """
+        Return ``compute(resp)`` for a catalog response from ``get_cached``,
+        computed once per catalog cache entry.
+        """
+        cache = self._catalog_cache()
+        if cache is None:
+            return compute(resp)
+        return cache.derive(path, resp, name, compute)
+
+    def _codec(self) -> JSONCodec:
+        """Return the JSON codec configured on the parent client."""
+        return getattr(self._client, "json_codec", None) or _DEFAULT_CODEC
+
+    def _builder(self) -> ModelBuilder:
+        """Return the model builder configured on the parent client."""
+        return getattr(self._client, "model_builder", None) or _DEFAULT_BUILDER
+
+    def _encode_body(
+        self,
+        json: Optional[Dict[str, Any]],
+        data: Optional[Union[str, bytes]],
+        headers: Optional[Dict[str, str]],
+    ) -> Tuple[Optional[Union[str, bytes]], Optional[Dict[str, str]]]:
+        """Encode a JSON body with the configured codec."""
+        if json is None:
+            return data, headers
+        headers = dict(headers or {})
+        headers.setdefault("Content-Type", "application/json")
+        return self._codec().dumps(json), headers
+
+    def _decode(self, resp: httpx.Response) -> Any:
+        """Decode a JSON response body with the configured codec."""
+        return self._codec().loads(resp.content)
+
+    def _parse(self, resp: httpx.Response, model: Optional[Type[Any]]) -> Any:
+        """Decode a response body and optionally build a model from it."""
+        body = self._decode(resp)
+        return self._builder().build(model, body) if model is not None else body
+
+    def _single_flight(self) -> Optional[SingleFlight]:
+        """Return the parent client's in-flight GET registry, if any."""
+        return getattr(self._client, "single_flight", None)
+
+    def _hedge_policy(self) -> Optional[HedgePolicy]:
+        """Return the hedging policy for GET requests configured on the client."""
+        return getattr(self._client, "hedge_policy", None)
+
+    def _response_cache(self) -> Optional[ResponseCache]:
+        """Return the parent client's conditional GET cache, if any."""
+        return getattr(self._client, "response_cache", None)
+
+    def _get_key(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        model: Optional[Type[Any]],
+    ) -> Hashable:
+        """Return the key under which identical GETs are coalesced and cached."""
+        url = httpx.URL(urljoin(self._base_url, path.lstrip("/")), params=params)
+        return str(url), self._token, model
+
+    def _revalidated(
+        self,
+        key: Hashable,
+        entry: Optional[CachedResponse],
+        resp: httpx.Response,
+        model: Optional[Type[Any]],
+    ) -> Any:
+        """Parse a GET response, answering ``304 Not Modified`` from the cache."""
+        cache = self._response_cache()
+        if resp.status_code == 304 and entry is not None:
+            cache.update(key, entry, resp, entry.value)
+            return entry.fresh_value()
+        value = self._parse(resp, model)
+        if cache is not None and cache.update(key, entry, resp, value):
+            # The cache keeps the parsed value, so the caller gets its own copy
+            return copy_value(value)
+        return value
 
     def _get_headers(
         self, additional_headers: Optional[Dict[str, str]] = None
@@ -62,22 +232,381 @@ class BaseAPI:
             headers.update(additional_headers)
         return headers
 
-    def _store_headers(self, headers: httpx.Headers) -> None:
-        """Store response headers."""
-        self._last_response_headers = dict(headers.items())
+    def _send_sync(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[Union[str, bytes]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> Tuple[httpx.Response, ResponseMeta]:
+        """
+        Send a request, retrying transient failures, and capture its metadata.
+
+        With ``stream`` the body is left unread for the caller to consume and
+        close (releasing its rate limiter slot with ``_release_stream``);
+        retries only happen before the response is returned, so a stream is
+        never retried once the caller has read from it.
+
+        Inside a ``deadline`` block each attempt's timeout is capped at the
+        time remaining, and no attempt or retry starts once it has run out.
+
+        Raises:
+            CircuitOpenError: If the endpoint group's circuit is open
+            DeadlineExceededError: If the current deadline passes first
+            ObotAPIError: If the request fails or returns an error status
+        """
+        http = self._http()
+        policy = self._retry_policy()
+        group = endpoint_group(path)
+        breaker = self._circuit_breaker(group)
+        limiter = self._rate_limiter()
+        request = http.build_request(
+            method,
+            urljoin(self._base_url, path.lstrip("/")),
+            params=params,
+            content=content,
+            headers=self._get_headers(headers),
+        )
+        attempt = 0
+        while True:
+            attempt += 1
+            left = check_deadline()
+            if breaker is not None:
+                breaker.acquire()
+            try:
+                queue_wait = (
+                    limiter.acquire_sync(group, timeout=left)
+                    if limiter is not None
+                    else 0.0
+                )
+            except BaseException as e:
+                if breaker is not None:
+                    breaker.release()
+                if isinstance(e, TimeoutError):
+                    raise deadline_exceeded() from e
+                raise
+            keep_slot = False
+            resp = error = None
+            try:
+                started = time.perf_counter()
+                try:
+                    left = check_deadline()
+                    if left is not None:
+                        request.extensions["timeout"] = bounded_timeout(
+                            http.timeout, left
+                        )
+                    resp = http.send(request, stream=stream)
+                except httpx.RequestError as e:
+                    error = e
+                except BaseException:
+                    if breaker is not None:
+                        breaker.release()
+                    raise
+
+                if resp is not None:
+                    meta = _record(resp, time.perf_counter() - started, queue_wait)
+                    self._record_outcome(breaker, limiter, group, resp, meta.elapsed)
+                    if resp.is_success or resp.status_code == 304:
+                        if policy is not None:
+                            policy.on_success()
+                        keep_slot = stream
+                        return resp, meta
+                    resp.read()
+                    resp.close()
+                else:
+                    if breaker is not None:
+                        breaker.record_failure()
+                    if limiter is not None:
+                        elapsed = time.perf_counter() - started
+                        limiter.record(group, elapsed, overloaded=True)
+            finally:
+                if limiter is not None and not keep_slot:
+                    limiter.release(group, is_async=False)
+
+            delay = self._retry_delay(policy, method, path, attempt, resp, error)
+            if delay is None:
+                self._raise_failure(resp, error)
+            left = remaining()
+            if left is not None and delay >= left:
+                raise deadline_exceeded() from error
+            time.sleep(delay)
 
     def get_sync(
-        self, path: str, params: Optional[Dict[str, Any]] = None
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        model: Optional[Type[Any]] = None,
+    ) -> Any:
+        """
+        Make a synchronous GET request.
+
+        Identical GETs made concurrently under the same ``deadline`` (or
+        none) share one request. Their callers receive the same decoded body
+        or error, and each gets its own copy of the ``model`` built from it.
+        With a hedging policy, a slow request is raced against a second copy.
+
+        Args:
+            path: The endpoint
+            params: Query parameters
+            model: Model to build from the response body, once per request
+        """
+        key = self._get_key(path, params, model)
+
+        def fetch() -> Tuple[Any, ResponseMeta]:
+            cache = self._response_cache()
+            entry = cache.get(key) if cache is not None else None
+            headers = entry.conditional_headers() if entry is not None else None
+            hedge = self._hedge_policy()
+
+            def send() -> Tuple[httpx.Response, ResponseMeta]:
+                return self._send_sync("GET", path, params=params, headers=headers)
+
+            if hedge is None:
+                resp, meta = send()
+            else:
+                resp, meta = hedge.run_sync(endpoint_group(path), send)
+            return self._revalidated(key, entry, resp, model), meta
+
+        flight = self._single_flight()
+        if flight is None:
+            body, meta = fetch()
+        else:
+            # Only callers under the same deadline (or none) share a request,
+            # since the shared request runs under the first caller's deadline
+            body, meta = flight.do_sync(
+                (key, current_deadline()), fetch, copy=_copy_body
+            )
+        _share(meta)
+        return body
+
+    def get_cached_sync(self, path: str) -> Dict[str, Any]:
+        """
+        Make a synchronous GET request served from the catalog cache.
+
+        On a cache miss the on-disk catalog snapshot, if configured, is served
+        instead and revalidated on a background thread.
+        """
+        cache = self._catalog_cache()
+        resp = cache.get(path) if cache is not None else None
+        if resp is None:
+            snapshot = self._catalog_snapshot()
+            if snapshot is not None:
+                resp = self._load_snapshot(snapshot.load(self._base_url, path), path)
+            if resp is None:
+                resp = BaseAPI.get_sync(self, path)
+                if snapshot is not None:
+                    self._save_snapshot(snapshot, path, None, resp)
+            elif snapshot.claim(self._base_url, path):
+                threading.Thread(
+                    target=self._revalidate_snapshot_sync,
+                    args=(snapshot, path, resp),
+                    daemon=True,
+                ).start()
+            if cache is not None:
+                cache.set(path, resp)
+        return resp
+
+    def _catalog_snapshot(self) -> Optional[CatalogSnapshot]:
+        """Return the parent client's on-disk catalog snapshot, if any."""
+        return getattr(self._client, "catalog_snapshot", None)
+
+    def _load_snapshot(self, entry: Optional[SnapshotEntry], path: str) -> Any:
+        """
+        Decode a stored catalog, seeding the response cache with its ETag so
+        that revalidating it is a conditional request.
+        """
+        if entry is None:
+            return None
+        try:
+            resp = self._codec().loads(entry.body)
+        except ValueError:
+            logger.debug("Ignoring undecodable catalog snapshot %s", path)
+            return None
+        cache = self._response_cache()
+        if cache is not None and entry.etag is not None:
+            cache.put(
+                self._get_key(path, None, None),
+                CachedResponse(entry.etag, None, resp, len(entry.body)),
+            )
+        return resp
+
+    def _save_snapshot(
+        self, snapshot: CatalogSnapshot, path: str, previous: Any, resp: Any
+    ) -> None:
+        """Store a downloaded catalog, or mark an unchanged one as confirmed."""
+        if resp is previous:
+            snapshot.touch(self._base_url, path)
+            return
+        meta = last_response()
+        etag = meta.headers.get("etag") if meta is not None else None
+        snapshot.store(self._base_url, path, self._codec().dumps(resp), etag)
+
+    def _revalidate_snapshot_sync(
+        self, snapshot: CatalogSnapshot, path: str, previous: Any
+    ) -> None:
+        """Revalidate a catalog served from the snapshot."""
+        try:
+            resp = BaseAPI.get_sync(self, path)
+            self._save_snapshot(snapshot, path, previous, resp)
+        except Exception:
+            # The snapshot keeps being served until it is revalidated or expires
+            logger.debug("Revalidating catalog %s failed", path, exc_info=True)
+            return
+        cache = self._catalog_cache()
+        if cache is not None:
+            cache.set(path, resp)
+
+    def _refresh_tool_catalog(self, resp: Dict[str, Any]) -> "ToolCatalog":
+        """Refresh the shared tool catalog from a tool references response."""
+        owner = self._client if self._client is not None else self
+        catalog = getattr(owner, "_tool_catalog", None)
+        if catalog is None:
+            # Built on first use so creating a client doesn't load pydantic
+            from ..catalog import ToolCatalog
+            from ..models.tool import Tool
+
+            catalog = owner._tool_catalog = ToolCatalog(
+                factory=self._builder().factory(Tool)
+            )
+        catalog.refresh(resp)
+        return catalog
+
+    def tool_catalog_sync(self) -> "ToolCatalog":
+        """Return the indexed tool catalog, refreshed from the catalog cache."""
+        return self._refresh_tool_catalog(self.get_cached_sync("/api/tool-references"))
+
+    def _page_params(
+        self, params: Optional[Dict[str, Any]], page_size: int, token: Optional[str]
     ) -> Dict[str, Any]:
-        """Make a synchronous GET request."""
-        with httpx.Client(timeout=self._timeout) as client:
-            resp = client.get(
-                urljoin(self._base_url, path.lstrip("/")),
-                params=params,
-                headers=self._get_headers(),
+        page_params = dict(params or {}, limit=page_size)
+        if token:
+            page_params["continue"] = token
+        return page_params
+
+    def paginate_sync(
+        self,
+        path: str,
+        factory: Callable[[Dict[str, Any]], T],
+        *,
+        page_size: int = 100,
+        params: Optional[Dict[str, Any]] = None,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Iterator[T]:
+        """
+        Lazily iterate over a list endpoint page by page.
+
+        The next page is fetched on a background thread while the current one
+        is consumed, and objects are only built as they are yielded.
+
+        Args:
+            path: The list endpoint
+            factory: Builds an object from a raw item
+            page_size: Number of items requested per page
+            params: Additional query parameters
+            where: Optional filter applied to raw items before building them
+        """
+
+        def fetch(token: Optional[str]) -> PaginatedResponse:
+            resp = BaseAPI.get_sync(
+                self, path, params=self._page_params(params, page_size, token)
             )
+            return PaginatedResponse.from_response(resp)
+
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            page = fetch(None)
+            while True:
+                token = page.continue_token
+                pending = None
+                if token:
+                    pending = prefetcher.submit(copy_context().run, fetch, token)
+                for item in page.items:
+                    if where is None or where(item):
+                        yield factory(item)
+                if pending is None:
+                    return
+                page = pending.result()
+
+    def _retry_policy(self) -> Optional[RetryPolicy]:
+        """Return the retry policy configured on the parent client."""
+        if self._client is None:
+            return _DEFAULT_RETRY
+        return getattr(self._client, "retry_policy", None)
+
+    def _circuit_breaker(self, group: str) -> Optional[CircuitBreaker]:
+        """Return the circuit breaker guarding an endpoint group."""
+        breakers = getattr(self._client, "circuit_breakers", None)
+        return breakers[group] if breakers is not None else None
+
+    def _rate_limiter(self) -> Optional[RateLimiter]:
+        """Return the rate limiter shared by the parent client's sub-APIs."""
+        return getattr(self._client, "rate_limiter", None)
+
+    def _release_stream(self, path: str) -> None:
+        """Release the rate limiter slot held by a finished stream."""
+        limiter = self._rate_limiter()
+        if limiter is not None:
+            limiter.release(endpoint_group(path), is_async=self._is_async)
+
+    @staticmethod
+    def _record_outcome(
+        breaker: Optional[CircuitBreaker],
+        limiter: Optional[RateLimiter],
+        group: str,
+        resp: httpx.Response,
+        elapsed: float,
+    ) -> None:
+        """Count a response towards the circuit breaker and adaptive limits."""
+        if breaker is not None:
+            if resp.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        if limiter is not None:
+            overloaded = resp.status_code == 429 or resp.status_code >= 500
+            limiter.record(group, elapsed, overloaded)
+
+    @staticmethod
+    def _retry_delay(
+        policy: Optional[RetryPolicy],
+        method: str,
+        path: str,
+        attempt: int,
+        resp: Optional[httpx.Response],
+        error: Optional[Exception],
+    ) -> Optional[float]:
+        """Return the delay before retrying a failed attempt, or None."""
+        if policy is None:
+            return None
+        if resp is None:
+            return policy.retry_delay(method, path, attempt, error=error)
+        return policy.retry_delay(
+            method,
+            path,
+            attempt,
+            status=resp.status_code,
+            retry_after=resp.headers.get("retry-after"),
+        )
+
+    def _raise_failure(
+        self, resp: Optional[httpx.Response], error: Optional[Exception]
+    ) -> None:
+        """Raise the ObotAPIError for a failed attempt."""
+        if resp is None:
+            _raise_if_deadline(error)
+            raise ObotAPIError(
+                f"Request failed: {str(error)}", status_code=0
+            ) from error
+        self._raise_for_status(resp)
+
+    def _raise_for_status(self, resp: httpx.Response) -> None:
+        """Raise the ObotAPIError matching an error response."""
+        try:
             resp.raise_for_status()
-            return resp.json()
+        except HTTPStatusError as e:
+            self._handle_error(e)
 
     def _handle_error(self, error: HTTPStatusError, context: str = "") -> None:
         """Handle HTTP errors and raise appropriate exceptions."""
@@ -100,21 +629,19 @@ class BaseAPI:
         headers: Optional[Dict[str, str]] = None,
     ) -> Any:
         """Make a synchronous POST request."""
-        try:
-            with httpx.Client(timeout=self._timeout) as client:
-                resp = client.post(
-                    urljoin(self._base_url, path.lstrip("/")),
-                    json=json,
-                    data=data,
-                    headers=self._get_headers(headers),
-                )
-                resp.raise_for_status()
-                self._store_headers(resp.headers)
-                return resp.text if data else resp.json()
-        except httpx.HTTPStatusError as e:
-            self._handle_error(e)
-        except httpx.RequestError as e:
-            raise ObotAPIError(f"Request failed: {str(e)}", status_code=0)
+        return self._post_sync(path, json=json, data=data, headers=headers)[0]
+
+    def _post_sync(
+        self,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[str, bytes]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Any, ResponseMeta]:
+        """Make a synchronous POST request, returning the body and metadata."""
+        content, headers = self._encode_body(json, data, headers)
+        resp, meta = self._send_sync("POST", path, content=content, headers=headers)
+        return (resp.text if data else self._decode(resp)), meta
 
     def put_sync(
         self,
@@ -124,15 +651,9 @@ class BaseAPI:
         headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """Make a synchronous PUT request."""
-        with httpx.Client(timeout=self._timeout) as client:
-            resp = client.put(
-                urljoin(self._base_url, path.lstrip("/")),
-                json=json,
-                data=data,
-                headers=self._get_headers(headers),
-            )
-            resp.raise_for_status()
-            return resp.json()
+        content, headers = self._encode_body(json, data, headers)
+        resp, _ = self._send_sync("PUT", path, content=content, headers=headers)
+        return self._decode(resp)
 
     def post_stream_sync(
         self,
@@ -141,29 +662,262 @@ class BaseAPI:
         headers: Optional[Dict[str, str]] = None,
     ) -> Iterator[str]:
         """Make a synchronous streaming POST request."""
-        with httpx.Client(timeout=self._timeout) as client:
-            with client.stream(
-                "POST",
-                urljoin(self._base_url, path.lstrip("/")),
-                data=data,
-                headers=self._get_headers(headers),
-            ) as resp:
-                resp.raise_for_status()
-                for chunk in resp.iter_text():
-                    yield chunk
+        resp, _ = self._send_sync(
+            "POST", path, content=data, headers=headers, stream=True
+        )
+        try:
+            for chunk in resp.iter_text():
+                check_deadline()
+                yield chunk
+        except httpx.RequestError as e:
+            _raise_if_deadline(e)
+            raise ObotAPIError(f"Stream failed: {str(e)}", status_code=0) from e
+        finally:
+            resp.close()
+            self._release_stream(path)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[Union[str, bytes]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> Tuple[httpx.Response, ResponseMeta]:
+        """
+        Send a request, retrying transient failures, and capture its metadata.
+
+        With ``stream`` the body is left unread for the caller to consume and
+        close (releasing its rate limiter slot with ``_release_stream``);
+        retries only happen before the response is returned, so a stream is
+        never retried once the caller has read from it.
+
+        Inside a ``deadline`` block each attempt's timeout is capped at the
+        time remaining, and no attempt or retry starts once it has run out.
+
+        Raises:
+            CircuitOpenError: If the endpoint group's circuit is open
+            DeadlineExceededError: If the current deadline passes first
+            ObotAPIError: If the request fails or returns an error status
+        """
+        http = self._http()
+        policy = self._retry_policy()
+        group = endpoint_group(path)
+        breaker = self._circuit_breaker(group)
+        limiter = self._rate_limiter()
+        request = http.build_request(
+            method,
+            urljoin(self._base_url, path.lstrip("/")),
+            params=params,
+            content=content,
+            headers=self._get_headers(headers),
+        )
+        attempt = 0
+        while True:
+            attempt += 1
+            left = check_deadline()
+            if breaker is not None:
+                breaker.acquire()
+            try:
+                queue_wait = (
+                    await limiter.acquire(group, timeout=left)
+                    if limiter is not None
+                    else 0.0
+                )
+            except BaseException as e:
+                if breaker is not None:
+                    breaker.release()
+                if isinstance(e, TimeoutError):
+                    raise deadline_exceeded() from e
+                raise
+            keep_slot = False
+            resp = error = None
+            try:
+                started = time.perf_counter()
+                try:
+                    left = check_deadline()
+                    if left is not None:
+                        request.extensions["timeout"] = bounded_timeout(
+                            http.timeout, left
+                        )
+                    resp = await http.send(request, stream=stream)
+                except httpx.RequestError as e:
+                    error = e
+                except BaseException:
+                    if breaker is not None:
+                        breaker.release()
+                    raise
+
+                if resp is not None:
+                    meta = _record(resp, time.perf_counter() - started, queue_wait)
+                    self._record_outcome(breaker, limiter, group, resp, meta.elapsed)
+                    if resp.is_success or resp.status_code == 304:
+                        if policy is not None:
+                            policy.on_success()
+                        keep_slot = stream
+                        return resp, meta
+                    await resp.aread()
+                    await resp.aclose()
+                else:
+                    if breaker is not None:
+                        breaker.record_failure()
+                    if limiter is not None:
+                        elapsed = time.perf_counter() - started
+                        limiter.record(group, elapsed, overloaded=True)
+            finally:
+                if limiter is not None and not keep_slot:
+                    limiter.release(group, is_async=True)
+
+            delay = self._retry_delay(policy, method, path, attempt, resp, error)
+            if delay is None:
+                self._raise_failure(resp, error)
+            left = remaining()
+            if left is not None and delay >= left:
+                raise deadline_exceeded() from error
+            await asyncio.sleep(delay)
 
     async def get(
-        self, path: str, params: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        """Make an asynchronous GET request."""
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            resp = await client.get(
-                urljoin(self._base_url, path.lstrip("/")),
-                params=params,
-                headers=self._get_headers(),
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        model: Optional[Type[Any]] = None,
+    ) -> Any:
+        """
+        Make an asynchronous GET request.
+
+        Identical GETs made concurrently under the same ``deadline`` (or
+        none) share one request. Their callers receive the same decoded body
+        or error, and each gets its own copy of the ``model`` built from it.
+        With a hedging policy, a slow request is raced against a second copy.
+
+        Args:
+            path: The endpoint
+            params: Query parameters
+            model: Model to build from the response body, once per request
+        """
+        key = self._get_key(path, params, model)
+
+        async def fetch() -> Tuple[Any, ResponseMeta]:
+            cache = self._response_cache()
+            entry = cache.get(key) if cache is not None else None
+            headers = entry.conditional_headers() if entry is not None else None
+            hedge = self._hedge_policy()
+
+            def send() -> Awaitable[Tuple[httpx.Response, ResponseMeta]]:
+                return self._send("GET", path, params=params, headers=headers)
+
+            if hedge is None:
+                resp, meta = await send()
+            else:
+                resp, meta = await hedge.run(endpoint_group(path), send)
+            return self._revalidated(key, entry, resp, model), meta
+
+        flight = self._single_flight()
+        if flight is None:
+            body, meta = await fetch()
+        else:
+            body, meta = await flight.do(
+                (key, current_deadline()), fetch, copy=_copy_body
             )
-            resp.raise_for_status()
-            return resp.json()
+        _share(meta)
+        return body
+
+    async def get_cached(self, path: str) -> Dict[str, Any]:
+        """
+        Make an asynchronous GET request served from the catalog cache.
+
+        On a cache miss the on-disk catalog snapshot, if configured, is served
+        instead and revalidated in a background task.
+        """
+        cache = self._catalog_cache()
+        resp = cache.get(path) if cache is not None else None
+        if resp is None:
+            snapshot = self._catalog_snapshot()
+            if snapshot is not None:
+                entry = await asyncio.to_thread(snapshot.load, self._base_url, path)
+                resp = self._load_snapshot(entry, path)
+            if resp is None:
+                resp = await BaseAPI.get(self, path)
+                if snapshot is not None:
+                    await asyncio.to_thread(
+                        self._save_snapshot, snapshot, path, None, resp
+                    )
+            elif await asyncio.to_thread(snapshot.claim, self._base_url, path):
+                task = asyncio.ensure_future(
+                    self._revalidate_snapshot(snapshot, path, resp)
+                )
+                _BACKGROUND_TASKS.add(task)
+                task.add_done_callback(_BACKGROUND_TASKS.discard)
+            if cache is not None:
+                cache.set(path, resp)
+        return resp
+
+    async def _revalidate_snapshot(
+        self, snapshot: CatalogSnapshot, path: str, previous: Any
+    ) -> None:
+        """Revalidate a catalog served from the snapshot."""
+        try:
+            resp = await BaseAPI.get(self, path)
+            await asyncio.to_thread(self._save_snapshot, snapshot, path, previous, resp)
+        except Exception:
+            # The snapshot keeps being served until it is revalidated or expires
+            logger.debug("Revalidating catalog %s failed", path, exc_info=True)
+            return
+        cache = self._catalog_cache()
+        if cache is not None:
+            cache.set(path, resp)
+
+    async def paginate(
+        self,
+        path: str,
+        factory: Callable[[Dict[str, Any]], T],
+        *,
+        page_size: int = 100,
+        params: Optional[Dict[str, Any]] = None,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> AsyncIterator[T]:
+        """
+        Lazily iterate over a list endpoint page by page.
+
+        The next page is fetched concurrently while the current one is
+        consumed, and objects are only built as they are yielded.
+
+        Args:
+            path: The list endpoint
+            factory: Builds an object from a raw item
+            page_size: Number of items requested per page
+            params: Additional query parameters
+            where: Optional filter applied to raw items before building them
+        """
+
+        async def fetch(token: Optional[str]) -> PaginatedResponse:
+            resp = await BaseAPI.get(
+                self, path, params=self._page_params(params, page_size, token)
+            )
+            return PaginatedResponse.from_response(resp)
+
+        page = await fetch(None)
+        while True:
+            token = page.continue_token
+            pending = asyncio.ensure_future(fetch(token)) if token else None
+            try:
+                for item in page.items:
+                    if where is None or where(item):
+                        yield factory(item)
+            except BaseException:
+                # Closed early or cancelled: drop the prefetched page
+                if pending is not None:
+                    pending.cancel()
+                raise
+            if pending is None:
+                return
+            page = await pending
+
+    async def tool_catalog(self) -> "ToolCatalog":
+        """Return the indexed tool catalog, refreshed from the catalog cache."""
+        return self._refresh_tool_catalog(await self.get_cached("/api/tool-references"))
 
     async def post(
         self,
@@ -173,21 +927,19 @@ class BaseAPI:
         headers: Optional[Dict[str, str]] = None,
     ) -> Any:
         """Make an asynchronous POST request."""
-        try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                resp = await client.post(
-                    urljoin(self._base_url, path.lstrip("/")),
-                    json=json,
-                    data=data,
-                    headers=self._get_headers(headers),
-                )
-                resp.raise_for_status()
-                self._store_headers(resp.headers)
-                return resp.text if data else resp.json()
-        except httpx.HTTPStatusError as e:
-            self._handle_error(e)
-        except httpx.RequestError as e:
-            raise ObotAPIError(f"Request failed: {str(e)}", status_code=0)
+        return (await self._post(path, json=json, data=data, headers=headers))[0]
+
+    async def _post(
+        self,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[str, bytes]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Any, ResponseMeta]:
+        """Make an asynchronous POST request, returning the body and metadata."""
+        content, headers = self._encode_body(json, data, headers)
+        resp, meta = await self._send("POST", path, content=content, headers=headers)
+        return (resp.text if data else self._decode(resp)), meta
 
     async def put(
         self,
@@ -197,15 +949,9 @@ class BaseAPI:
         headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """Make an asynchronous PUT request."""
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            resp = await client.put(
-                urljoin(self._base_url, path.lstrip("/")),
-                json=json,
-                data=data,
-                headers=self._get_headers(headers),
-            )
-            resp.raise_for_status()
-            return resp.json()
+        content, headers = self._encode_body(json, data, headers)
+        resp, _ = await self._send("PUT", path, content=content, headers=headers)
+        return self._decode(resp)
 
     def post_stream(
         self,
@@ -216,31 +962,47 @@ class BaseAPI:
         """Make an asynchronous streaming POST request."""
 
         async def stream():
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                async with client.stream(
-                    "POST",
-                    urljoin(self._base_url, path.lstrip("/")),
-                    data=data,
-                    headers=self._get_headers(headers),
-                ) as resp:
-                    resp.raise_for_status()
-                    self._store_headers(resp.headers)
-                    async for chunk in resp.aiter_text():
-                        yield chunk
+            resp, _ = await self._send(
+                "POST", path, content=data, headers=headers, stream=True
+            )
+            try:
+                async for chunk in resp.aiter_text():
+                    check_deadline()
+                    yield chunk
+            except httpx.RequestError as e:
+                _raise_if_deadline(e)
+                raise ObotAPIError(f"Stream failed: {str(e)}", status_code=0) from e
+            finally:
+                await resp.aclose()
+                self._release_stream(path)
 
         return stream()
 
     def close_sync(self) -> None:
-        """Close the HTTP client session synchronously."""
+        """
+        Close the HTTP client session synchronously.
+
+        Only a pool created by this API itself is closed; a pool shared with a
+        parent client is released by that client's ``close()``.
+        """
         if self._is_async:
             raise RuntimeError("Cannot use sync methods on async client")
-        self._client.close()
+        if self._own_http is not None:
+            self._own_http.close()
+            self._own_http = None
 
     async def close(self) -> None:
-        """Close the HTTP client session asynchronously."""
+        """
+        Close the HTTP client session asynchronously.
+
+        Only a pool created by this API itself is closed; a pool shared with a
+        parent client is released by that client's ``close()``.
+        """
         if not self._is_async:
             raise RuntimeError("Cannot use async methods on sync client")
-        await self._client.aclose()
+        if self._own_http is not None:
+            await self._own_http.aclose()
+            self._own_http = None
 
     def __enter__(self):
         if self._is_async:
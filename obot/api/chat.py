@@ -1,36 +1,171 @@
-from typing import Optional, Union, Iterator, AsyncIterator
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    Iterator,
+    AsyncIterator,
+)
 import json
+import re
 from .base import BaseAPI
+from ..batch import BatchResult, iter_batch, iter_batch_sync
 from ..models.conversation import Conversation
+from ..streaming import StreamEvent, aparse_stream, parse_stream
 
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_WHITESPACE_CHARS = frozenset(" \t\n\r")
+_DECODER = json.JSONDecoder()
 
-def _extract_message(response: str) -> str:
+# Replies larger than this many characters are decoded item by item, which is
+# slower than the codec but never materializes the whole document
+_STREAM_THRESHOLD = 16 * 1024 * 1024
+
+# (agent_id, message), (agent_id, message, thread_id) or a dict of those keys
+ChatRequest = Union[Tuple[str, str], Tuple[str, str, Optional[str]], Dict[str, Any]]
+
+
+def _iter_items(response: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the entries of the top-level ``items`` array one at a time.
+
+    Only one item is decoded at a time, so the full document tree is never
+    materialized.
+
+    Raises:
+        ValueError: If the response is not a well-formed JSON object
+    """
+    decode = _DECODER.raw_decode
+    skip = _WHITESPACE.match
+
+    pos = skip(response, 0).end()
+    if response[pos : pos + 1] != "{":
+        raise ValueError("Expected a JSON object")
+    pos = skip(response, pos + 1).end()
+    if response[pos : pos + 1] == "}":
+        return
+
+    while True:
+        key, pos = decode(response, pos)
+        pos = skip(response, pos).end()
+        if response[pos : pos + 1] != ":":
+            raise ValueError(f"Expected ':' at position {pos}")
+        pos = skip(response, pos + 1).end()
+
+        if key == "items" and response[pos : pos + 1] == "[":
+            pos = skip(response, pos + 1).end()
+            if response[pos : pos + 1] == "]":
+                pos += 1
+            else:
+                while True:
+                    item, pos = decode(response, pos)
+                    yield item
+                    # Compact JSON has no whitespace, so avoid the regex if we can
+                    if response[pos : pos + 1] in _WHITESPACE_CHARS:
+                        pos = skip(response, pos).end()
+                    sep = response[pos : pos + 1]
+                    pos += 1
+                    if sep == "]":
+                        break
+                    if sep != ",":
+                        raise ValueError(f"Expected ',' or ']' at position {pos}")
+                    if response[pos : pos + 1] in _WHITESPACE_CHARS:
+                        pos = skip(response, pos).end()
+        else:
+            _, pos = decode(response, pos)
+
+        pos = skip(response, pos).end()
+        sep = response[pos : pos + 1]
+        pos = skip(response, pos + 1).end()
+        if sep == "}":
+            return
+        if sep != ",":
+            raise ValueError(f"Expected ',' or '}}' at position {pos}")
+
+
+def _reply_items(
+    response: str, loads: Callable[[str], Any] = json.loads
+) -> Iterable[Any]:
+    """
+    Return the entries of a reply's ``items`` array.
+
+    Replies up to ``_STREAM_THRESHOLD`` characters are decoded whole with
+    ``loads``; larger ones are decoded one item at a time so the full document
+    tree is never held in memory.
+
+    Raises:
+        ValueError: If the response is not a well-formed JSON object
+    """
+    if len(response) > _STREAM_THRESHOLD:
+        return _iter_items(response)
+    data = loads(response)
+    if not isinstance(data, dict):
+        raise ValueError("Expected a JSON object")
+    return data.get("items", [])
+
+
+def _extract_message(response: str, loads: Callable[[str], Any] = json.loads) -> str:
     """
     Extract the complete message from the response JSON.
 
     Args:
         response: JSON string containing the response items
+        loads: JSON decoder for replies below the streaming threshold
 
     Returns:
         The complete message from the model
     """
     try:
-        data = json.loads(response)
-        message = ""
-
         # Combine all content chunks that aren't system messages
-        for item in data.get("items", []):
-            if "content" in item and "contentID" in item:
-                message += item["content"]
-
-        return message.strip()
-    except json.JSONDecodeError:
+        parts = [
+            item["content"]
+            for item in _reply_items(response, loads)
+            if "content" in item and "contentID" in item
+        ]
+        return "".join(parts).strip()
+    except ValueError:
         return response.strip()
 
 
+def _extract_segments(
+    response: str, loads: Callable[[str], Any] = json.loads
+) -> Dict[str, str]:
+    """
+    Extract the message from the response JSON grouped by content ID.
+
+    Args:
+        response: JSON string containing the response items
+        loads: JSON decoder for replies below the streaming threshold
+
+    Returns:
+        A mapping of content ID to its joined content, in order of first
+        appearance
+    """
+    segments: Dict[str, List[str]] = {}
+    for item in _reply_items(response, loads):
+        if "content" in item and "contentID" in item:
+            segments.setdefault(item["contentID"], []).append(item["content"])
+    return {content_id: "".join(parts) for content_id, parts in segments.items()}
+
+
+def _chat_request(request: ChatRequest) -> Tuple[str, str, Optional[str]]:
+    """Normalize a ``map`` request to (agent_id, message, thread_id)."""
+    if isinstance(request, dict):
+        return request["agent_id"], request["message"], request.get("thread_id")
+    agent_id, message, *rest = request
+    return agent_id, message, rest[0] if rest else None
+
+
 class ChatAPI(BaseAPI):
     """Async Chat API endpoints."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, is_async=True, **kwargs)
+
     async def __call__(
         self,
         agent_id: str,
@@ -67,22 +202,18 @@ class ChatAPI(BaseAPI):
                 f"/api/invoke/{agent_id}", data=message, headers=headers
             )
 
-        resp = await self.post(f"/api/invoke/{agent_id}", data=message, headers=headers)
-        response_text = _extract_message(resp)
+        resp, meta = await self._post(
+            f"/api/invoke/{agent_id}", data=message, headers=headers
+        )
+        response_text = _extract_message(resp, self._codec().loads)
 
         if return_conversation:
-            # Get thread ID from response headers (case-insensitive)
-            header_keys = {k.lower(): k for k in self._last_response_headers.keys()}
-            thread_header = header_keys.get("x-obot-thread-id")
-            new_thread_id = thread_id or (
-                self._last_response_headers.get(thread_header)
-                if thread_header
-                else None
-            )
+            # Thread ID comes from this request's own response headers
+            new_thread_id = thread_id or meta.thread_id
 
             if not new_thread_id:
                 raise ValueError(
-                    f"No thread ID found in response headers. Headers: {dict(self._last_response_headers)}"
+                    f"No thread ID found in response headers. Headers: {dict(meta.headers)}"
                 )
 
             return Conversation(
@@ -90,14 +221,111 @@ class ChatAPI(BaseAPI):
                 thread_id=new_thread_id,
                 _client=self._client,
                 last_response=response_text,
+                response=meta,
             )
 
         return response_text
 
+    async def segments(
+        self, agent_id: str, message: str, *, thread_id: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Send a message to an agent and get its reply grouped by content ID.
+
+        Args:
+            agent_id: The ID of the agent to chat with
+            message: The message to send
+            thread_id: Optional thread ID to continue a conversation
+
+        Returns:
+            A mapping of content ID to its joined content, in order of first
+            appearance
+
+        Raises:
+            ValueError: If the reply is not a JSON document of items
+        """
+        headers = {
+            "Content-Type": "text/plain",
+        }
+
+        if thread_id:
+            headers["X-Obot-Thread-Id"] = thread_id
+
+        resp = await self.post(f"/api/invoke/{agent_id}", data=message, headers=headers)
+        return _extract_segments(resp, self._codec().loads)
+
+    def stream_events(
+        self, agent_id: str, message: str, *, thread_id: Optional[str] = None
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Send a message to an agent and stream the reply as typed events.
+
+        Args:
+            agent_id: The ID of the agent to chat with
+            message: The message to send
+            thread_id: Optional thread ID to continue a conversation
+
+        Returns:
+            An async iterator of ContentEvent, ToolCallEvent, RunStatusEvent
+            and a final DoneEvent
+        """
+        headers = {
+            "Content-Type": "text/plain",
+        }
+
+        if thread_id:
+            headers["X-Obot-Thread-Id"] = thread_id
+
+        return aparse_stream(
+            self.post_stream(f"/api/invoke/{agent_id}", data=message, headers=headers),
+            self._codec().loads,
+        )
+
+    def map(
+        self,
+        requests: Iterable[ChatRequest],
+        *,
+        concurrency: int = 8,
+        ordered: bool = True,
+        return_conversation: bool = False,
+    ) -> AsyncIterator[BatchResult[Union[str, Conversation]]]:
+        """
+        Send many messages concurrently, yielding each reply as a BatchResult.
+
+        Requests are dispatched with at most ``concurrency`` invocations in
+        flight. A failed request is reported on its result (``error``) and
+        does not stop the others; ``elapsed`` holds each request's latency.
+
+        Args:
+            requests: ``(agent_id, message)`` or ``(agent_id, message,
+                thread_id)`` tuples, or dicts with those keys
+            concurrency: Maximum number of concurrent invocations
+            ordered: Yield results in input order instead of as they complete
+            return_conversation: Return Conversation objects instead of the
+                reply text
+
+        Returns:
+            An async iterator of BatchResult, one per request
+        """
+
+        async def send(request: ChatRequest) -> Union[str, Conversation]:
+            agent_id, message, thread_id = _chat_request(request)
+            return await self(
+                agent_id,
+                message,
+                thread_id=thread_id,
+                return_conversation=return_conversation,
+            )
+
+        return iter_batch(send, requests, concurrency=concurrency, ordered=ordered)
+
 
 class SyncChatAPI(BaseAPI):
     """Synchronous Chat API endpoints."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, is_async=False, **kwargs)
+
     def __call__(
         self,
         agent_id: str,
@@ -134,22 +362,18 @@ class SyncChatAPI(BaseAPI):
                 f"/api/invoke/{agent_id}", data=message, headers=headers
             )
 
-        resp = self.post_sync(f"/api/invoke/{agent_id}", data=message, headers=headers)
-        response_text = _extract_message(resp)
+        resp, meta = self._post_sync(
+            f"/api/invoke/{agent_id}", data=message, headers=headers
+        )
+        response_text = _extract_message(resp, self._codec().loads)
 
         if return_conversation:
-            # Get thread ID from response headers (case-insensitive)
-            header_keys = {k.lower(): k for k in self._last_response_headers.keys()}
-            thread_header = header_keys.get("x-obot-thread-id")
-            new_thread_id = thread_id or (
-                self._last_response_headers.get(thread_header)
-                if thread_header
-                else None
-            )
+            # Thread ID comes from this request's own response headers
+            new_thread_id = thread_id or meta.thread_id
 
             if not new_thread_id:
                 raise ValueError(
-                    f"No thread ID found in response headers. Headers: {dict(self._last_response_headers)}"
+                    f"No thread ID found in response headers. Headers: {dict(meta.headers)}"
                 )
 
             return Conversation(
@@ -157,6 +381,103 @@ class SyncChatAPI(BaseAPI):
                 thread_id=new_thread_id,
                 _client=self._client,
                 last_response=response_text,
+                response=meta,
             )
 
         return response_text
+
+    def segments(
+        self, agent_id: str, message: str, *, thread_id: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Send a message to an agent and get its reply grouped by content ID.
+
+        Args:
+            agent_id: The ID of the agent to chat with
+            message: The message to send
+            thread_id: Optional thread ID to continue a conversation
+
+        Returns:
+            A mapping of content ID to its joined content, in order of first
+            appearance
+
+        Raises:
+            ValueError: If the reply is not a JSON document of items
+        """
+        headers = {
+            "Content-Type": "text/plain",
+        }
+
+        if thread_id:
+            headers["X-Obot-Thread-Id"] = thread_id
+
+        resp = self.post_sync(f"/api/invoke/{agent_id}", data=message, headers=headers)
+        return _extract_segments(resp, self._codec().loads)
+
+    def stream_events(
+        self, agent_id: str, message: str, *, thread_id: Optional[str] = None
+    ) -> Iterator[StreamEvent]:
+        """
+        Send a message to an agent and stream the reply as typed events.
+
+        Args:
+            agent_id: The ID of the agent to chat with
+            message: The message to send
+            thread_id: Optional thread ID to continue a conversation
+
+        Returns:
+            An iterator of ContentEvent, ToolCallEvent, RunStatusEvent and a
+            final DoneEvent
+        """
+        headers = {
+            "Content-Type": "text/plain",
+        }
+
+        if thread_id:
+            headers["X-Obot-Thread-Id"] = thread_id
+
+        return parse_stream(
+            self.post_stream_sync(
+                f"/api/invoke/{agent_id}", data=message, headers=headers
+            ),
+            self._codec().loads,
+        )
+
+    def map(
+        self,
+        requests: Iterable[ChatRequest],
+        *,
+        concurrency: int = 8,
+        ordered: bool = True,
+        return_conversation: bool = False,
+    ) -> Iterator[BatchResult[Union[str, Conversation]]]:
+        """
+        Send many messages concurrently, yielding each reply as a BatchResult.
+
+        Requests are dispatched on a pool of ``concurrency`` threads sharing
+        the client's connection pool. A failed request is reported on its
+        result (``error``) and does not stop the others; ``elapsed`` holds
+        each request's latency.
+
+        Args:
+            requests: ``(agent_id, message)`` or ``(agent_id, message,
+                thread_id)`` tuples, or dicts with those keys
+            concurrency: Maximum number of concurrent invocations
+            ordered: Yield results in input order instead of as they complete
+            return_conversation: Return Conversation objects instead of the
+                reply text
+
+        Returns:
+            An iterator of BatchResult, one per request
+        """
+
+        def send(request: ChatRequest) -> Union[str, Conversation]:
+            agent_id, message, thread_id = _chat_request(request)
+            return self(
+                agent_id,
+                message,
+                thread_id=thread_id,
+                return_conversation=return_conversation,
+            )
+
+        return iter_batch_sync(send, requests, concurrency=concurrency, ordered=ordered)
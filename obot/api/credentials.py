@@ -1,5 +1,4 @@
-from typing import List, Dict
-from pydantic import parse_obj_as
+from typing import List, Dict, AsyncIterator, Iterator
 from .base import BaseAPI
 from ..models.credential import Credential, CredentialCreate
 
@@ -12,15 +11,20 @@ class CredentialsAPI(BaseAPI):
 
     async def list_credentials(self) -> List[Credential]:
         resp = await self.get("/credentials")
-        return parse_obj_as(List[Credential], resp)
+        return self._builder().build_list(Credential, resp)
 
     async def create_credential(self, cred_data: CredentialCreate) -> Credential:
         resp = await self.post("/credentials", json=cred_data.dict())
-        return Credential(**resp)
+        return self._builder().build(Credential, resp)
 
     async def delete_credential(self, credential_id: str) -> Dict[str, str]:
         return await self.delete(f"/credentials/{credential_id}")
 
+    def iter_credentials(self, page_size: int = 100) -> AsyncIterator[Credential]:
+        return self.paginate(
+            "/credentials", self._builder().factory(Credential), page_size=page_size
+        )
+
 
 class SyncCredentialsAPI(BaseAPI):
     """Synchronous API endpoints related to Credentials."""
@@ -30,11 +34,16 @@ class SyncCredentialsAPI(BaseAPI):
 
     def list_credentials(self) -> List[Credential]:
         resp = self.get_sync("/credentials")
-        return parse_obj_as(List[Credential], resp)
+        return self._builder().build_list(Credential, resp)
 
     def create_credential(self, cred_data: CredentialCreate) -> Credential:
         resp = self.post_sync("/credentials", json=cred_data.dict())
-        return Credential(**resp)
+        return self._builder().build(Credential, resp)
 
     def delete_credential(self, credential_id: str) -> Dict[str, str]:
         return self.delete_sync(f"/credentials/{credential_id}")
+
+    def iter_credentials(self, page_size: int = 100) -> Iterator[Credential]:
+        return self.paginate_sync(
+            "/credentials", self._builder().factory(Credential), page_size=page_size
+        )
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, AsyncIterator, Iterator, Dict, Any
 from .base import BaseAPI
 from ..models.model_provider import ModelProvider
 from ..models.model import Model
@@ -19,8 +19,8 @@ class ModelsAPI(BaseAPI):
                       If False, only return unconfigured providers.
                       If None, return all providers.
         """
-        resp = await self.get("/api/model-providers")
-        providers = [ModelProvider(**item) for item in resp.get("items", [])]
+        resp = await self.get_cached("/api/model-providers")
+        providers = self._builder().build_list(ModelProvider, resp.get("items", []))
 
         if configured is not None:
             providers = [p for p in providers if p.configured == configured]
@@ -37,8 +37,8 @@ class ModelsAPI(BaseAPI):
             model_provider: Filter models by provider
             active: Filter models by active status
         """
-        resp = await self.get("/api/models")
-        models = [Model(**item) for item in resp.get("items", [])]
+        resp = await self.get_cached("/api/models")
+        models = self._builder().build_list(Model, resp.get("items", []))
 
         if model_provider:
             models = [m for m in models if m.modelProvider == model_provider]
@@ -48,6 +48,35 @@ class ModelsAPI(BaseAPI):
 
         return models
 
+    def iter(
+        self,
+        model_provider: Optional[str] = None,
+        active: Optional[bool] = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[Model]:
+        """
+        Lazily iterate over models with optional filters, page by page.
+
+        Unlike ``__call__`` this bypasses the catalog cache.
+
+        Args:
+            model_provider: Filter models by provider
+            active: Filter models by active status
+            page_size: Number of models requested per page
+        """
+
+        def where(item: Dict[str, Any]) -> bool:
+            return (
+                not model_provider or item.get("modelProvider") == model_provider
+            ) and (active is None or item.get("active") == active)
+
+        return self.paginate(
+            "/api/models",
+            self._builder().factory(Model),
+            page_size=page_size,
+            where=where,
+        )
+
 
 class SyncModelsAPI(BaseAPI):
     """Synchronous Models API endpoints."""
@@ -64,8 +93,8 @@ class SyncModelsAPI(BaseAPI):
                       If False, only return unconfigured providers.
                       If None, return all providers.
         """
-        resp = self.get_sync("/api/model-providers")
-        providers = [ModelProvider(**item) for item in resp.get("items", [])]
+        resp = self.get_cached_sync("/api/model-providers")
+        providers = self._builder().build_list(ModelProvider, resp.get("items", []))
 
         if configured is not None:
             providers = [p for p in providers if p.configured == configured]
@@ -82,8 +111,8 @@ class SyncModelsAPI(BaseAPI):
             model_provider: Filter models by provider
             active: Filter models by active status
         """
-        resp = self.get_sync("/api/models")
-        models = [Model(**item) for item in resp.get("items", [])]
+        resp = self.get_cached_sync("/api/models")
+        models = self._builder().build_list(Model, resp.get("items", []))
 
         if model_provider:
             models = [m for m in models if m.modelProvider == model_provider]
@@ -92,3 +121,32 @@ class SyncModelsAPI(BaseAPI):
             models = [m for m in models if m.active == active]
 
         return models
+
+    def iter(
+        self,
+        model_provider: Optional[str] = None,
+        active: Optional[bool] = None,
+        page_size: int = 100,
+    ) -> Iterator[Model]:
+        """
+        Lazily iterate over models with optional filters, page by page.
+
+        Unlike ``__call__`` this bypasses the catalog cache.
+
+        Args:
+            model_provider: Filter models by provider
+            active: Filter models by active status
+            page_size: Number of models requested per page
+        """
+
+        def where(item: Dict[str, Any]) -> bool:
+            return (
+                not model_provider or item.get("modelProvider") == model_provider
+            ) and (active is None or item.get("active") == active)
+
+        return self.paginate_sync(
+            "/api/models",
+            self._builder().factory(Model),
+            page_size=page_size,
+            where=where,
+        )
@@ -1,5 +1,4 @@
-from typing import List
-from pydantic import parse_obj_as
+from typing import List, AsyncIterator, Iterator
 from .base import BaseAPI
 from ..models.run import Run
 
@@ -12,7 +11,10 @@ class RunsAPI(BaseAPI):
 
     async def list_runs(self) -> List[Run]:
         resp = await self.get("/runs")
-        return parse_obj_as(List[Run], resp)
+        return self._builder().build_list(Run, resp)
+
+    def iter_runs(self, page_size: int = 100) -> AsyncIterator[Run]:
+        return self.paginate("/runs", self._builder().factory(Run), page_size=page_size)
 
 
 class SyncRunsAPI(BaseAPI):
@@ -23,4 +25,9 @@ class SyncRunsAPI(BaseAPI):
 
     def list_runs(self) -> List[Run]:
         resp = self.get_sync("/runs")
-        return parse_obj_as(List[Run], resp)
+        return self._builder().build_list(Run, resp)
+
+    def iter_runs(self, page_size: int = 100) -> Iterator[Run]:
+        return self.paginate_sync(
+            "/runs", self._builder().factory(Run), page_size=page_size
+        )
@@ -1,5 +1,4 @@
 from typing import Optional, AsyncIterator, Iterator, List, Dict
-from pydantic import parse_obj_as
 from .base import BaseAPI
 from ..models.thread import Thread, ThreadMessage, ThreadCreateMessage
 
@@ -12,13 +11,12 @@ class ThreadsAPI(BaseAPI):
 
     async def __call__(self) -> List[Thread]:
         """List all threads."""
-        resp = await self.get("/api/threads")
-        return [Thread(**item) for item in resp.get("items", [])]
+        resp = await super().get("/api/threads")
+        return self._builder().build_list(Thread, resp.get("items", []))
 
     async def get(self, thread_id: str) -> Thread:
         """Get a specific thread."""
-        resp = await self.get(f"/api/threads/{thread_id}")
-        return Thread(**resp)
+        return await super().get(f"/api/threads/{thread_id}", model=Thread)
 
     async def chat(
         self,
@@ -59,7 +57,18 @@ class ThreadsAPI(BaseAPI):
         resp = await self.post(
             f"/threads/{thread_id}/messages", json=message_data.dict()
         )
-        return ThreadMessage(**resp)
+        return self._builder().build(ThreadMessage, resp)
+
+    def iter(self, page_size: int = 100) -> AsyncIterator[Thread]:
+        """
+        Lazily iterate over all threads, fetching pages as they are consumed.
+
+        Args:
+            page_size: Number of threads requested per page
+        """
+        return self.paginate(
+            "/api/threads", self._builder().factory(Thread), page_size=page_size
+        )
 
 
 class SyncThreadsAPI(BaseAPI):
@@ -71,12 +80,11 @@ class SyncThreadsAPI(BaseAPI):
     def __call__(self) -> List[Thread]:
         """List all threads."""
         resp = self.get_sync("/api/threads")
-        return [Thread(**item) for item in resp.get("items", [])]
+        return self._builder().build_list(Thread, resp.get("items", []))
 
     def get(self, thread_id: str) -> Thread:
         """Get a specific thread."""
-        resp = self.get_sync(f"/api/threads/{thread_id}")
-        return Thread(**resp)
+        return self.get_sync(f"/api/threads/{thread_id}", model=Thread)
 
     def chat(
         self,
@@ -117,4 +125,15 @@ class SyncThreadsAPI(BaseAPI):
         resp = self.post_sync(
             f"/threads/{thread_id}/messages", json=message_data.dict()
         )
-        return ThreadMessage(**resp)
+        return self._builder().build(ThreadMessage, resp)
+
+    def iter(self, page_size: int = 100) -> Iterator[Thread]:
+        """
+        Lazily iterate over all threads, fetching pages as they are consumed.
+
+        Args:
+            page_size: Number of threads requested per page
+        """
+        return self.paginate_sync(
+            "/api/threads", self._builder().factory(Thread), page_size=page_size
+        )
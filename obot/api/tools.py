@@ -1,5 +1,6 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator, Iterator
 from .base import BaseAPI
+from ..catalog import ToolCatalog
 from ..models.tool import Tool
 
 
@@ -16,34 +17,42 @@ class ToolsAPI(BaseAPI):
         Args:
             category: Optional category to filter tools by
         """
-        resp = await self.get("/api/tool-references")
-        tools = []
-
-        for item in resp.get("items", []):
-            # Only include items where toolType is "tool"
-            if item.get("toolType") == "tool":
-                # If category is specified, filter by it
-                if category:
-                    item_category = item.get("metadata", {}).get("category")
-                    if item_category != category:
-                        continue
-                tools.append(Tool(**item))
-
-        return tools
+        catalog = await self.tool_catalog()
+        return catalog.tools(category=category)
 
     async def categories(self) -> List[str]:
         """List all available tool categories."""
-        resp = await self.get("/api/tool-references")
-        categories = set()
+        catalog = await self.tool_catalog()
+        return catalog.categories()
+
+    async def catalog(self) -> ToolCatalog:
+        """Return the indexed tool catalog shared by this client."""
+        return await self.tool_catalog()
+
+    def iter(
+        self, category: Optional[str] = None, page_size: int = 100
+    ) -> AsyncIterator[Tool]:
+        """
+        Lazily iterate over tools (excluding model providers), page by page.
+
+        Unlike ``__call__`` this bypasses the catalog cache.
+
+        Args:
+            category: Optional category to filter tools by
+            page_size: Number of tool references requested per page
+        """
 
-        for item in resp.get("items", []):
-            # Only include categories from actual tools
-            if item.get("toolType") == "tool":
-                category = item.get("metadata", {}).get("category")
-                if category:
-                    categories.add(category)
+        def where(item: Dict[str, Any]) -> bool:
+            return item.get("toolType") == "tool" and (
+                not category or (item.get("metadata") or {}).get("category") == category
+            )
 
-        return sorted(list(categories))
+        return self.paginate(
+            "/api/tool-references",
+            self._builder().factory(Tool),
+            page_size=page_size,
+            where=where,
+        )
 
 
 class SyncToolsAPI(BaseAPI):
@@ -59,31 +68,37 @@ class SyncToolsAPI(BaseAPI):
         Args:
             category: Optional category to filter tools by
         """
-        resp = self.get_sync("/api/tool-references")
-        tools = []
-
-        for item in resp.get("items", []):
-            # Only include items where toolType is "tool"
-            if item.get("toolType") == "tool":
-                # If category is specified, filter by it
-                if category:
-                    item_category = item.get("metadata", {}).get("category")
-                    if item_category != category:
-                        continue
-                tools.append(Tool(**item))
-
-        return tools
+        return self.tool_catalog_sync().tools(category=category)
 
     def categories(self) -> List[str]:
         """List all available tool categories."""
-        resp = self.get_sync("/api/tool-references")
-        categories = set()
+        return self.tool_catalog_sync().categories()
+
+    def catalog(self) -> ToolCatalog:
+        """Return the indexed tool catalog shared by this client."""
+        return self.tool_catalog_sync()
+
+    def iter(
+        self, category: Optional[str] = None, page_size: int = 100
+    ) -> Iterator[Tool]:
+        """
+        Lazily iterate over tools (excluding model providers), page by page.
 
-        for item in resp.get("items", []):
-            # Only include categories from actual tools
-            if item.get("toolType") == "tool":
-                category = item.get("metadata", {}).get("category")
-                if category:
-                    categories.add(category)
+        Unlike ``__call__`` this bypasses the catalog cache.
+
+        Args:
+            category: Optional category to filter tools by
+            page_size: Number of tool references requested per page
+        """
 
-        return sorted(list(categories))
+        def where(item: Dict[str, Any]) -> bool:
+            return item.get("toolType") == "tool" and (
+                not category or (item.get("metadata") or {}).get("category") == category
+            )
+
+        return self.paginate_sync(
+            "/api/tool-references",
+            self._builder().factory(Tool),
+            page_size=page_size,
+            where=where,
+        )
@@ -1,5 +1,4 @@
-from typing import List
-from pydantic import parse_obj_as
+from typing import List, AsyncIterator, Iterator
 from .base import BaseAPI
 from ..models.webhook import Webhook, WebhookCreate
 
@@ -12,15 +11,20 @@ class WebhooksAPI(BaseAPI):
 
     async def list_webhooks(self) -> List[Webhook]:
         resp = await self.get("/webhooks")
-        return parse_obj_as(List[Webhook], resp)
+        return self._builder().build_list(Webhook, resp)
 
     async def create_webhook(self, webhook_data: WebhookCreate) -> Webhook:
         resp = await self.post("/webhooks", json=webhook_data.dict())
-        return Webhook(**resp)
+        return self._builder().build(Webhook, resp)
 
     async def delete_webhook(self, webhook_id: str) -> None:
         await self.delete(f"/webhooks/{webhook_id}")
 
+    def iter_webhooks(self, page_size: int = 100) -> AsyncIterator[Webhook]:
+        return self.paginate(
+            "/webhooks", self._builder().factory(Webhook), page_size=page_size
+        )
+
 
 class SyncWebhooksAPI(BaseAPI):
     """Synchronous API endpoints related to Webhooks."""
@@ -30,11 +34,16 @@ class SyncWebhooksAPI(BaseAPI):
 
     def list_webhooks(self) -> List[Webhook]:
         resp = self.get_sync("/webhooks")
-        return parse_obj_as(List[Webhook], resp)
+        return self._builder().build_list(Webhook, resp)
 
     def create_webhook(self, webhook_data: WebhookCreate) -> Webhook:
         resp = self.post_sync("/webhooks", json=webhook_data.dict())
-        return Webhook(**resp)
+        return self._builder().build(Webhook, resp)
 
     def delete_webhook(self, webhook_id: str) -> None:
         self.delete_sync(f"/webhooks/{webhook_id}")
+
+    def iter_webhooks(self, page_size: int = 100) -> Iterator[Webhook]:
+        return self.paginate_sync(
+            "/webhooks", self._builder().factory(Webhook), page_size=page_size
+        )
@@ -1,5 +1,4 @@
-from typing import Any, Dict, List
-from pydantic import parse_obj_as
+from typing import Any, Dict, List, AsyncIterator, Iterator
 from .base import BaseAPI
 from ..models.workflow import Workflow, WorkflowCreate
 
@@ -12,19 +11,23 @@ class WorkflowsAPI(BaseAPI):
 
     async def list_workflows(self) -> List[Workflow]:
         resp = await self.get("/workflows")
-        return parse_obj_as(List[Workflow], resp)
+        return self._builder().build_list(Workflow, resp)
 
     async def get_workflow(self, workflow_id: str) -> Workflow:
-        resp = await self.get(f"/workflows/{workflow_id}")
-        return Workflow(**resp)
+        return await self.get(f"/workflows/{workflow_id}", model=Workflow)
 
     async def create_workflow(self, data: WorkflowCreate) -> Workflow:
         resp = await self.post("/workflows", json=data.dict())
-        return Workflow(**resp)
+        return self._builder().build(Workflow, resp)
 
     async def delete_workflow(self, workflow_id: str) -> Dict[str, Any]:
         return await self.delete(f"/workflows/{workflow_id}")
 
+    def iter_workflows(self, page_size: int = 100) -> AsyncIterator[Workflow]:
+        return self.paginate(
+            "/workflows", self._builder().factory(Workflow), page_size=page_size
+        )
+
 
 class SyncWorkflowsAPI(BaseAPI):
     """Synchronous Workflows API endpoints."""
@@ -34,15 +37,19 @@ class SyncWorkflowsAPI(BaseAPI):
 
     def list_workflows(self) -> List[Workflow]:
         resp = self.get_sync("/workflows")
-        return parse_obj_as(List[Workflow], resp)
+        return self._builder().build_list(Workflow, resp)
 
     def get_workflow(self, workflow_id: str) -> Workflow:
-        resp = self.get_sync(f"/workflows/{workflow_id}")
-        return Workflow(**resp)
+        return self.get_sync(f"/workflows/{workflow_id}", model=Workflow)
 
     def create_workflow(self, data: WorkflowCreate) -> Workflow:
         resp = self.post_sync("/workflows", json=data.dict())
-        return Workflow(**resp)
+        return self._builder().build(Workflow, resp)
 
     def delete_workflow(self, workflow_id: str) -> Dict[str, Any]:
         return self.delete_sync(f"/workflows/{workflow_id}")
+
+    def iter_workflows(self, page_size: int = 100) -> Iterator[Workflow]:
+        return self.paginate_sync(
+            "/workflows", self._builder().factory(Workflow), page_size=page_size
+        )
@@ -1,39 +1,135 @@
-from typing import Optional
+from typing import Optional, Union
 from urllib.parse import urljoin
-from .api.agents import AgentsAPI
-from .api.workflows import WorkflowsAPI
-from .api.threads import ThreadsAPI
-from .api.tools import ToolsAPI
-from .api.models import ModelsAPI
-from .api.credentials import CredentialsAPI
-from .api.webhooks import WebhooksAPI
-from .api.chat import ChatAPI
+import httpx
+from .cache import CatalogCache
+from .hedge import HedgePolicy
+from .httpcache import ResponseCache
+from .circuit import CircuitBreakers, get_circuit_breakers
+from .codec import JSONCodec, get_codec
+from .transport import Transport, create_http_client
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, get_retry_policy
+from .singleflight import SingleFlight
+from .snapshot import CatalogSnapshot
+from .validation import ModelBuilder
+from .lazy import LazyAPI
 
 
 class AsyncObotClient:
     """Asynchronous client for the Obot API."""
 
+    # Sub-APIs are imported and created on first access
+    agents = LazyAPI(".api.agents", "AgentsAPI")
+    workflows = LazyAPI(".api.workflows", "WorkflowsAPI")
+    threads = LazyAPI(".api.threads", "ThreadsAPI")
+    tools = LazyAPI(".api.tools", "ToolsAPI")
+    models = LazyAPI(".api.models", "ModelsAPI")
+    credentials = LazyAPI(".api.credentials", "CredentialsAPI")
+    webhooks = LazyAPI(".api.webhooks", "WebhooksAPI")
+    chat = LazyAPI(".api.chat", "ChatAPI")
+
     def __init__(
         self,
         base_url: str,
         token: Optional[str] = None,
         timeout: Optional[float] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        uds: Optional[str] = None,
+        transport: Optional[Transport] = None,
+        catalog_cache: Optional[CatalogCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        catalog_snapshot: Optional[CatalogSnapshot] = None,
+        json_codec: Union[str, JSONCodec, None] = "auto",
+        validation: str = "default",
+        records: bool = False,
+        retry: Union[RetryPolicy, bool] = True,
+        circuit_breaker: Union[CircuitBreakers, bool] = False,
+        rate_limit: Optional[RateLimiter] = None,
+        coalesce: bool = True,
+        hedge: Optional[HedgePolicy] = None,
     ):
-        """Initialize the client."""
+        """
+        Initialize the client.
+
+        Args:
+            base_url: Base URL of the Obot server
+            token: Optional bearer token
+            timeout: Default request timeout in seconds
+            limits: Connection pool limits shared by all sub-APIs
+            http2: Multiplex concurrent requests and streams over a few
+                HTTP/2 connections (https only; requires ``httpx[http2]``)
+            uds: Unix domain socket of a co-located Obot server; ``base_url``
+                then only sets the Host header
+            transport: Custom httpx transport shared by all sub-APIs, e.g.
+                ``httpx.ASGITransport(app)`` to call an app in-process
+            catalog_cache: Cache for tool reference and model catalogs
+                (defaults to a ``CatalogCache`` with a 60 second TTL)
+            response_cache: Cache of GET responses revalidated with ETag and
+                Last-Modified (defaults to a ``ResponseCache`` of 256 entries)
+            catalog_snapshot: On-disk catalog store shared across processes
+                for warm starts; catalogs are served from it and revalidated
+                in the background
+            json_codec: JSON codec for request and response bodies: "auto"
+                (orjson or msgspec when installed, else the stdlib), "json",
+                "orjson", "msgspec" or a ``JSONCodec`` instance
+            validation: How response models are validated: "default", or
+                "strict" to reject type coercion for debugging
+            records: Return list results and catalogs as compact, immutable
+                records (``obot.records``) instead of pydantic models
+            retry: Retry policy for transient failures; True uses the default
+                ``RetryPolicy`` and False disables retries
+            circuit_breaker: Fail fast while an endpoint group (invoke,
+                catalog, CRUD) keeps failing; True uses the default
+                ``CircuitBreakers`` settings
+            rate_limit: Rate and concurrency limits shared by all sub-APIs
+            coalesce: Share one request among identical concurrent GETs
+            hedge: Send a second copy of slow GET requests and use whichever
+                response arrives first
+        """
         self._base_url = base_url.rstrip("/") + "/"
         self._token = token
         self._timeout = timeout
 
-        # Initialize API clients with self reference
-        self.agents = AgentsAPI(base_url, token=token, timeout=timeout, client=self)
-        self.workflows = WorkflowsAPI(
-            base_url, token=token, timeout=timeout, client=self
+        # Single keep-alive pool shared by every sub-API
+        self._http = create_http_client(
+            is_async=True,
+            base_url=base_url,
+            timeout=timeout,
+            limits=limits,
+            http2=http2,
+            uds=uds,
+            transport=transport,
+        )
+        self.catalog_cache = (
+            catalog_cache if catalog_cache is not None else CatalogCache()
+        )
+        self.response_cache = (
+            response_cache if response_cache is not None else ResponseCache()
         )
-        self.threads = ThreadsAPI(base_url, token=token, timeout=timeout, client=self)
-        self.tools = ToolsAPI(base_url, token=token, timeout=timeout, client=self)
-        self.models = ModelsAPI(base_url, token=token, timeout=timeout, client=self)
-        self.credentials = CredentialsAPI(
-            base_url, token=token, timeout=timeout, client=self
+        self.catalog_snapshot = catalog_snapshot
+        self.json_codec = get_codec(json_codec)
+        self.model_builder = ModelBuilder(validation, records=records)
+        self.retry_policy = get_retry_policy(retry)
+        self.circuit_breakers = get_circuit_breakers(circuit_breaker)
+        self.rate_limiter = rate_limit
+        self.single_flight = SingleFlight() if coalesce else None
+        self.hedge_policy = hedge
+
+    def _make_api(self, api_class):
+        """Create a sub-API sharing this client's pool and settings."""
+        return api_class(
+            self._base_url, token=self._token, timeout=self._timeout, client=self
         )
-        self.webhooks = WebhooksAPI(base_url, token=token, timeout=timeout, client=self)
-        self.chat = ChatAPI(base_url, token=token, timeout=timeout, client=self)
+
+    async def close(self) -> None:
+        """Close the shared connection pool and hedging threads."""
+        await self._http.aclose()
+        if self.hedge_policy is not None:
+            self.hedge_policy.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
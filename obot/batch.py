@@ -0,0 +1,296 @@
+"""
+Helpers for running many API calls with bounded concurrency.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import as_completed, wait
+from contextvars import copy_context
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
+import asyncio
+import time
+
+T = TypeVar("T")
+
+
+@dataclass
+class BatchResult(Generic[T]):
+    """The outcome of one item of a batch."""
+
+    index: int
+    input: Any
+    result: Optional[T] = None
+    error: Optional[Exception] = None
+    elapsed: Optional[float] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item completed without error."""
+        return self.error is None
+
+
+def _call_timed(func: Callable[[Any], T], result: BatchResult) -> T:
+    """Call ``func`` on the item of ``result``, recording the elapsed time."""
+    start = time.perf_counter()
+    try:
+        return func(result.input)
+    finally:
+        result.elapsed = time.perf_counter() - start
+
+
+def _prepare(
+    items: Iterable[Any], errors: Optional[List[Optional[Exception]]]
+) -> List[BatchResult]:
+    results = [BatchResult(index=i, input=item) for i, item in enumerate(items)]
+    if errors is not None:
+        for result, error in zip(results, errors):
+            result.error = error
+    return results
+
+
+async def run_batch(
+    func: Callable[[Any], Awaitable[T]],
+    items: Iterable[Any],
+    *,
+    concurrency: int = 8,
+    fail_fast: bool = False,
+    errors: Optional[List[Optional[Exception]]] = None,
+) -> List[BatchResult[T]]:
+    """
+    Await ``func(item)`` for every item with at most ``concurrency`` in flight.
+
+    Args:
+        func: Coroutine function called once per item
+        items: The batch inputs
+        concurrency: Maximum number of concurrent calls
+        fail_fast: Cancel outstanding calls and raise on the first error
+            instead of collecting every error
+        errors: Per-item errors found before dispatch; those items are skipped
+
+    Returns:
+        One BatchResult per item, in input order
+    """
+    results = _prepare(items, errors)
+    if fail_fast:
+        for result in results:
+            if result.error is not None:
+                raise result.error
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(result: BatchResult) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result.result = await func(result.input)
+            except Exception as e:
+                result.error = e
+                if fail_fast:
+                    raise
+            finally:
+                result.elapsed = time.perf_counter() - start
+
+    tasks = [asyncio.ensure_future(run(r)) for r in results if r.error is None]
+    try:
+        await asyncio.gather(*tasks)
+    except Exception:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return results
+
+
+def run_batch_sync(
+    func: Callable[[Any], T],
+    items: Iterable[Any],
+    *,
+    concurrency: int = 8,
+    fail_fast: bool = False,
+    errors: Optional[List[Optional[Exception]]] = None,
+) -> List[BatchResult[T]]:
+    """
+    Call ``func(item)`` for every item on a pool of ``concurrency`` threads.
+    Each call runs in a copy of the caller's context, so an enclosing
+    ``deadline`` bounds it.
+
+    Args:
+        func: Function called once per item
+        items: The batch inputs
+        concurrency: Maximum number of concurrent calls
+        fail_fast: Cancel pending calls and raise on the first error instead
+            of collecting every error
+        errors: Per-item errors found before dispatch; those items are skipped
+
+    Returns:
+        One BatchResult per item, in input order
+    """
+    results = _prepare(items, errors)
+    if fail_fast:
+        for result in results:
+            if result.error is not None:
+                raise result.error
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        futures = {
+            pool.submit(copy_context().run, _call_timed, func, result): result
+            for result in results
+            if result.error is None
+        }
+        for future in as_completed(futures):
+            result = futures[future]
+            try:
+                result.result = future.result()
+            except Exception as e:
+                result.error = e
+                if fail_fast:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+    return results
+
+
+async def iter_batch(
+    func: Callable[[Any], Awaitable[T]],
+    items: Iterable[Any],
+    *,
+    concurrency: int = 8,
+    ordered: bool = True,
+) -> AsyncIterator[BatchResult[T]]:
+    """
+    Await ``func(item)`` for every item, yielding results as they finish.
+
+    Items are pulled from ``items`` only as slots free up, so arbitrarily
+    large inputs are dispatched with at most ``concurrency`` calls in flight.
+    Failures are reported on their BatchResult and never stop the batch.
+    Closing the iterator early cancels the calls still in flight.
+
+    Args:
+        func: Coroutine function called once per item
+        items: The batch inputs
+        concurrency: Maximum number of concurrent calls
+        ordered: Yield results in input order instead of completion order
+
+    Yields:
+        One BatchResult per item, with ``elapsed`` set to the call's latency
+    """
+    limit = max(1, concurrency)
+    inputs = enumerate(items)
+    pending: Set[asyncio.Future] = set()
+    finished: Dict[int, BatchResult[T]] = {}
+    next_index = 0
+
+    async def run(result: BatchResult) -> BatchResult:
+        start = time.perf_counter()
+        try:
+            result.result = await func(result.input)
+        except Exception as e:
+            result.error = e
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    def fill() -> None:
+        while len(pending) < limit:
+            try:
+                index, item = next(inputs)
+            except StopIteration:
+                return
+            pending.add(asyncio.ensure_future(run(BatchResult(index, item))))
+
+    try:
+        fill()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            pending.difference_update(done)
+            fill()
+            for task in done:
+                result = task.result()
+                if not ordered:
+                    yield result
+                else:
+                    finished[result.index] = result
+            while next_index in finished:
+                yield finished.pop(next_index)
+                next_index += 1
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+def iter_batch_sync(
+    func: Callable[[Any], T],
+    items: Iterable[Any],
+    *,
+    concurrency: int = 8,
+    ordered: bool = True,
+) -> Iterator[BatchResult[T]]:
+    """
+    Call ``func(item)`` for every item on a thread pool, yielding results as
+    they finish.
+
+    Items are pulled from ``items`` only as workers free up. Failures are
+    reported on their BatchResult and never stop the batch. Closing the
+    iterator early cancels the calls that have not started.
+
+    Args:
+        func: Function called once per item
+        items: The batch inputs
+        concurrency: Maximum number of concurrent calls
+        ordered: Yield results in input order instead of completion order
+
+    Yields:
+        One BatchResult per item, with ``elapsed`` set to the call's latency
+    """
+    limit = max(1, concurrency)
+    inputs = enumerate(items)
+    pending: Dict[Future, BatchResult[T]] = {}
+    finished: Dict[int, BatchResult[T]] = {}
+    next_index = 0
+    pool = ThreadPoolExecutor(max_workers=limit)
+
+    def fill() -> None:
+        while len(pending) < limit:
+            try:
+                index, item = next(inputs)
+            except StopIteration:
+                return
+            result = BatchResult(index, item)
+            pending[pool.submit(copy_context().run, _call_timed, func, result)] = result
+
+    try:
+        fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            completed = [(future, pending.pop(future)) for future in done]
+            fill()
+            for future, result in completed:
+                try:
+                    result.result = future.result()
+                except Exception as e:
+                    result.error = e
+                if not ordered:
+                    yield result
+                else:
+                    finished[result.index] = result
+            while next_index in finished:
+                yield finished.pop(next_index)
+                next_index += 1
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
@@ -0,0 +1,133 @@
+"""
+Client-level cache for catalog responses such as tool references and models.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+import threading
+import time
+
+T = TypeVar("T")
+
+
+class CatalogCache:
+    """
+    A thread-safe TTL + LRU cache for catalog responses.
+
+    Entries expire ``ttl`` seconds after they are stored and the least recently
+    used entry is evicted once more than ``max_entries`` are held. A ``ttl`` of
+    0 disables caching entirely. Values derived from an entry with ``derive``
+    are kept with it and dropped when it expires, is evicted or replaced.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_entries: int = 64,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays fresh
+            max_entries: Maximum number of entries before LRU eviction
+            clock: Monotonic time source, overridable for testing
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        # key -> (expires_at, value, values derived from it)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key`` or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value, _ = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entries if full."""
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+
+        with self._lock:
+            old = self._entries.get(key)
+            # Storing the same value again (e.g. after a 304) keeps its
+            # derived values
+            derived = old[2] if old is not None and old[1] is value else {}
+            self._entries[key] = (self._clock() + self.ttl, value, derived)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def derive(
+        self, key: Hashable, value: Any, name: str, compute: Callable[[Any], T]
+    ) -> T:
+        """
+        Return ``compute(value)``, computed once per cached entry.
+
+        The result is stored with the entry cached under ``key`` as long as
+        that entry still holds ``value``; otherwise it is computed afresh.
+
+        Args:
+            key: Key of the entry ``value`` was cached under
+            value: The cached value to derive from
+            name: Name of the derived value
+            compute: Builds the derived value from ``value``
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            derived = entry[2] if entry is not None and entry[1] is value else None
+            if derived is not None and name in derived:
+                return derived[name]
+        result = compute(value)
+        if derived is not None:
+            with self._lock:
+                derived[name] = result
+        return result
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            key: The entry to drop, or None to clear the whole cache
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and the current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
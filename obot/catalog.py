@@ -0,0 +1,189 @@
+"""
+Indexed in-memory view of the ``/api/tool-references`` catalog.
+"""
+
+from typing import Any, Callable, Dict, Iterable, KeysView, List, Optional, Tuple
+import threading
+from .models.tool import Tool
+
+
+class ToolCatalog:
+    """
+    Tool references indexed by id, name, category and ``toolType``.
+
+    Lookups are O(1) dictionary accesses and ``Tool`` objects are built lazily
+    on first access. ``refresh`` compares each item's ``revision`` with the one
+    already held: unchanged references keep their built ``Tool``, and the
+    indexes are only rebuilt when something was added, changed or removed.
+    Rebuilt indexes replace the old ones whole, so readers never see a
+    partially applied refresh and views returned earlier stay valid.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Dict[str, Any]] = (),
+        factory: Callable[[Dict[str, Any]], Tool] = Tool.model_validate,
+    ):
+        """
+        Initialize the catalog.
+
+        Args:
+            items: Raw tool reference items as returned by the API
+            factory: Builds a ``Tool`` from a raw item
+        """
+        self._factory = factory
+        self._lock = threading.RLock()
+        self._source: Optional[Dict[str, Any]] = None
+        self._items: Dict[str, Dict[str, Any]] = {}
+        self._tools: Dict[str, Tool] = {}
+        # toolType -> ordered set of ids
+        self._by_type: Dict[str, Dict[str, None]] = {}
+        # toolType -> name -> id
+        self._by_name: Dict[str, Dict[str, str]] = {}
+        # toolType -> category -> ordered set of ids
+        self._by_category: Dict[str, Dict[str, Dict[str, None]]] = {}
+        self._apply(items)
+
+    @classmethod
+    def from_response(cls, resp: Dict[str, Any]) -> "ToolCatalog":
+        """Build a catalog from a ``/api/tool-references`` response."""
+        catalog = cls()
+        catalog.refresh(resp)
+        return catalog
+
+    def refresh(self, resp: Dict[str, Any]) -> Tuple[int, int, int]:
+        """
+        Bring the catalog up to date with a ``/api/tool-references`` response.
+
+        Passing the same response object twice is a no-op.
+
+        Args:
+            resp: The decoded response containing an ``items`` list
+
+        Returns:
+            A tuple of (added, updated, removed) counts
+        """
+        with self._lock:
+            if resp is self._source:
+                return 0, 0, 0
+            counts = self._apply(resp.get("items", []))
+            self._source = resp
+            return counts
+
+    def _apply(self, items: Iterable[Dict[str, Any]]) -> Tuple[int, int, int]:
+        """Apply a full item listing, diffing by id and revision."""
+        with self._lock:
+            added = updated = 0
+            latest: Dict[str, Dict[str, Any]] = {}
+
+            for item in items:
+                tool_id = item.get("id")
+                if tool_id is None:
+                    continue
+                current = self._items.get(tool_id)
+                if current is None:
+                    added += 1
+                elif current.get("revision") != item.get("revision"):
+                    updated += 1
+                else:
+                    item = current
+                latest[tool_id] = item
+
+            removed = len(self._items.keys() - latest.keys())
+            if added or updated or removed:
+                self._index(latest)
+            return added, updated, removed
+
+    def _index(self, items: Dict[str, Dict[str, Any]]) -> None:
+        """Build the indexes of ``items`` and swap them in."""
+        by_type: Dict[str, Dict[str, None]] = {}
+        by_name: Dict[str, Dict[str, str]] = {}
+        by_category: Dict[str, Dict[str, Dict[str, None]]] = {}
+        for tool_id, item in items.items():
+            tool_type = item.get("toolType") or ""
+            by_type.setdefault(tool_type, {})[tool_id] = None
+
+            name = item.get("name")
+            if name is not None:
+                by_name.setdefault(tool_type, {})[name] = tool_id
+
+            category = (item.get("metadata") or {}).get("category")
+            if category:
+                categories = by_category.setdefault(tool_type, {})
+                categories.setdefault(category, {})[tool_id] = None
+
+        self._tools = {
+            tool_id: tool
+            for tool_id, tool in self._tools.items()
+            if items.get(tool_id) is self._items[tool_id]
+        }
+        self._items = items
+        self._by_type = by_type
+        self._by_name = by_name
+        self._by_category = by_category
+
+    def _tool(self, tool_id: str) -> Tool:
+        tool = self._tools.get(tool_id)
+        if tool is None:
+            tool = self._factory(self._items[tool_id])
+            self._tools[tool_id] = tool
+        return tool
+
+    def get(self, tool_id: str) -> Optional[Tool]:
+        """Return the tool with the given ID, or None."""
+        with self._lock:
+            return self._tool(tool_id) if tool_id in self._items else None
+
+    def by_name(self, name: str, tool_type: str = "tool") -> Optional[Tool]:
+        """Return the tool with the given name and type, or None."""
+        tool_id = self.id_for_name(name, tool_type)
+        return self.get(tool_id) if tool_id is not None else None
+
+    def id_for_name(self, name: str, tool_type: str = "tool") -> Optional[str]:
+        """Return the ID of the tool with the given name and type, or None."""
+        return self._by_name.get(tool_type, {}).get(name)
+
+    def ids(self, tool_type: str = "tool") -> KeysView[str]:
+        """
+        Return a set-like view of the IDs of the given type.
+
+        The view reflects the catalog when it was taken; later refreshes
+        don't change it.
+        """
+        return self._by_type.get(tool_type, {}).keys()
+
+    def names(self, tool_type: str = "tool") -> KeysView[str]:
+        """
+        Return a set-like view of the names of the given type.
+
+        The view reflects the catalog when it was taken; later refreshes
+        don't change it.
+        """
+        return self._by_name.get(tool_type, {}).keys()
+
+    def tools(
+        self, category: Optional[str] = None, tool_type: str = "tool"
+    ) -> List[Tool]:
+        """
+        List tools of the given type, optionally restricted to a category.
+
+        Args:
+            category: Optional category to filter tools by
+            tool_type: The ``toolType`` to list (defaults to "tool")
+        """
+        with self._lock:
+            if category:
+                ids = self._by_category.get(tool_type, {}).get(category, {})
+            else:
+                ids = self._by_type.get(tool_type, {})
+            return [self._tool(tool_id) for tool_id in ids]
+
+    def categories(self, tool_type: str = "tool") -> List[str]:
+        """List the categories used by tools of the given type."""
+        return sorted(self._by_category.get(tool_type, {}))
+
+    def __contains__(self, tool_id: object) -> bool:
+        return tool_id in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
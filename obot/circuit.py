@@ -0,0 +1,187 @@
+"""
+Circuit breakers that fail fast while an endpoint group is unhealthy.
+"""
+
+from typing import Callable, Dict, Optional, Union
+import threading
+import time
+from .endpoints import ENDPOINT_GROUPS
+from .exceptions import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Called with (group, old_state, new_state) on every state change
+StateListener = Callable[[str, str, str], None]
+
+
+class CircuitBreaker:
+    """
+    A closed/open/half-open circuit breaker for one endpoint group.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls fail immediately with CircuitOpenError. Once ``recovery_timeout``
+    has passed, up to ``half_open_max_calls`` trial calls are let through:
+    a success closes the circuit again and a failure reopens it.
+    """
+
+    def __init__(
+        self,
+        group: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[StateListener] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the breaker.
+
+        Args:
+            group: Endpoint group guarded by this breaker
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open before trial calls
+            half_open_max_calls: Concurrent trial calls allowed when half-open
+            on_state_change: Called with (group, old_state, new_state)
+            clock: Monotonic time source
+        """
+        self.group = group
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self.on_state_change = on_state_change
+        self._clock = clock
+        # Reentrant so state-change callbacks may inspect the breaker
+        self._lock = threading.RLock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+
+    @property
+    def state(self) -> str:
+        """The current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            if self._state == OPEN and self._recovered():
+                return HALF_OPEN
+            return self._state
+
+    def acquire(self) -> None:
+        """
+        Reserve a call through the breaker.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all
+                trial calls in flight
+        """
+        with self._lock:
+            if self._state == OPEN:
+                if not self._recovered():
+                    remaining = self._opened_at + self.recovery_timeout
+                    raise CircuitOpenError(self.group, remaining - self._clock())
+                self._transition(HALF_OPEN)
+            if self._state == HALF_OPEN:
+                if self._trials >= self.half_open_max_calls:
+                    raise CircuitOpenError(self.group, 0.0)
+                self._trials += 1
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        with self._lock:
+            self._failures = 0
+            if self._state == HALF_OPEN:
+                self._trials = 0
+                self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._trials = 0
+                self._opened_at = self._clock()
+                self._transition(OPEN)
+
+    def release(self) -> None:
+        """Release a call that ended without an outcome (e.g. cancelled)."""
+        with self._lock:
+            if self._state == HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+
+    def _recovered(self) -> bool:
+        return self._clock() - self._opened_at >= self.recovery_timeout
+
+    def _transition(self, state: str) -> None:
+        old, self._state = self._state, state
+        if old != state and self.on_state_change is not None:
+            self.on_state_change(self.group, old, state)
+
+
+class CircuitBreakers:
+    """
+    The circuit breakers of a client, one per endpoint group.
+
+    Breakers are created on first use with the shared settings unless one is
+    supplied for the group in ``breakers``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[StateListener] = None,
+        breakers: Optional[Dict[str, CircuitBreaker]] = None,
+    ):
+        """
+        Initialize the breakers.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit
+            recovery_timeout: Seconds a circuit stays open before trial calls
+            half_open_max_calls: Concurrent trial calls allowed when half-open
+            on_state_change: Called with (group, old_state, new_state)
+            breakers: Breakers with custom settings, keyed by endpoint group
+                ("invoke", "catalog" or "crud")
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.on_state_change = on_state_change
+        self._breakers: Dict[str, CircuitBreaker] = dict(breakers or {})
+        self._lock = threading.Lock()
+
+    def __getitem__(self, group: str) -> CircuitBreaker:
+        breaker = self._breakers.get(group)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(group)
+                if breaker is None:
+                    breaker = self._breakers[group] = CircuitBreaker(
+                        group,
+                        failure_threshold=self.failure_threshold,
+                        recovery_timeout=self.recovery_timeout,
+                        half_open_max_calls=self.half_open_max_calls,
+                        on_state_change=self.on_state_change,
+                    )
+        return breaker
+
+    def states(self) -> Dict[str, str]:
+        """Return the state of every endpoint group's circuit."""
+        return {group: self[group].state for group in ENDPOINT_GROUPS}
+
+
+def get_circuit_breakers(
+    circuit_breaker: Union[CircuitBreakers, bool, None],
+) -> Optional[CircuitBreakers]:
+    """
+    Resolve the ``circuit_breaker`` client option.
+
+    Args:
+        circuit_breaker: CircuitBreakers, True for the default settings, or
+            False/None to disable circuit breaking
+    """
+    if isinstance(circuit_breaker, CircuitBreakers):
+        return circuit_breaker
+    return CircuitBreakers() if circuit_breaker else None
@@ -2,14 +2,20 @@
 Main AsyncObotClient that composes resource-specific APIs.
 """
 
-from typing import Optional
-from .api.agents import AgentsAPI
-from .api.workflows import WorkflowsAPI
-from .api.threads import ThreadsAPI
-from .api.runs import RunsAPI
-from .api.tools import ToolsAPI
-from .api.credentials import CredentialsAPI
-from .api.webhooks import WebhooksAPI
+from typing import Optional, Union
+import httpx
+from .cache import CatalogCache
+from .hedge import HedgePolicy
+from .httpcache import ResponseCache
+from .circuit import CircuitBreakers, get_circuit_breakers
+from .codec import JSONCodec, get_codec
+from .transport import Transport, create_http_client
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, get_retry_policy
+from .singleflight import SingleFlight
+from .snapshot import CatalogSnapshot
+from .validation import ModelBuilder
+from .lazy import LazyAPI
 
 
 class AsyncObotClient:
@@ -18,33 +24,79 @@ class AsyncObotClient:
     Composes multiple resource-specific APIs.
     """
 
+    # Sub-APIs are imported and created on first access
+    agents = LazyAPI(".api.agents", "AgentsAPI")
+    workflows = LazyAPI(".api.workflows", "WorkflowsAPI")
+    threads = LazyAPI(".api.threads", "ThreadsAPI")
+    runs = LazyAPI(".api.runs", "RunsAPI")
+    tools = LazyAPI(".api.tools", "ToolsAPI")
+    credentials = LazyAPI(".api.credentials", "CredentialsAPI")
+    webhooks = LazyAPI(".api.webhooks", "WebhooksAPI")
+
     def __init__(
         self,
         base_url: str,
         token: Optional[str] = None,
         timeout: float = 60.0,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        uds: Optional[str] = None,
+        transport: Optional[Transport] = None,
+        catalog_cache: Optional[CatalogCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        catalog_snapshot: Optional[CatalogSnapshot] = None,
+        json_codec: Union[str, JSONCodec, None] = "auto",
+        validation: str = "default",
+        records: bool = False,
+        retry: Union[RetryPolicy, bool] = True,
+        circuit_breaker: Union[CircuitBreakers, bool] = False,
+        rate_limit: Optional[RateLimiter] = None,
+        coalesce: bool = True,
+        hedge: Optional[HedgePolicy] = None,
     ):
         # Ensure base_url ends with /api
         if not base_url.endswith("/api"):
             base_url = f"{base_url.rstrip('/')}/api"
 
-        self.agents = AgentsAPI(base_url, token=token, timeout=timeout)
-        self.workflows = WorkflowsAPI(base_url, token=token, timeout=timeout)
-        self.threads = ThreadsAPI(base_url, token=token, timeout=timeout)
-        self.runs = RunsAPI(base_url, token=token, timeout=timeout)
-        self.tools = ToolsAPI(base_url, token=token, timeout=timeout)
-        self.credentials = CredentialsAPI(base_url, token=token, timeout=timeout)
-        self.webhooks = WebhooksAPI(base_url, token=token, timeout=timeout)
+        # Single keep-alive pool shared by every sub-API
+        self._http = create_http_client(
+            is_async=True,
+            base_url=base_url,
+            timeout=timeout,
+            limits=limits,
+            http2=http2,
+            uds=uds,
+            transport=transport,
+        )
+        self.catalog_cache = (
+            catalog_cache if catalog_cache is not None else CatalogCache()
+        )
+        self.response_cache = (
+            response_cache if response_cache is not None else ResponseCache()
+        )
+        self.catalog_snapshot = catalog_snapshot
+        self.json_codec = get_codec(json_codec)
+        self.model_builder = ModelBuilder(validation, records=records)
+        self.retry_policy = get_retry_policy(retry)
+        self.circuit_breakers = get_circuit_breakers(circuit_breaker)
+        self.rate_limiter = rate_limit
+        self.single_flight = SingleFlight() if coalesce else None
+        self.hedge_policy = hedge
+        self._base_url = base_url
+        self._token = token
+        self._timeout = timeout
+
+    def _make_api(self, api_class):
+        """Create a sub-API sharing this client's pool and settings."""
+        return api_class(
+            self._base_url, token=self._token, timeout=self._timeout, client=self
+        )
 
     async def close(self) -> None:
-        """Close all underlying session clients."""
-        await self.agents.close()
-        await self.workflows.close()
-        await self.threads.close()
-        await self.runs.close()
-        await self.tools.close()
-        await self.credentials.close()
-        await self.webhooks.close()
+        """Close the shared connection pool and hedging threads."""
+        await self._http.aclose()
+        if self.hedge_policy is not None:
+            self.hedge_policy.close()
 
     async def __aenter__(self):
         return self
@@ -0,0 +1,100 @@
+"""
+Pluggable JSON codecs for request and response bodies.
+"""
+
+from typing import Any, Callable, Dict, Union
+import json
+from .exceptions import ObotConfigError
+
+
+class JSONCodec:
+    """Encodes request bodies and decodes response bodies using the stdlib."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object to UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decode JSON text or bytes, raising ValueError if it is malformed."""
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by ``orjson``."""
+
+    name = "orjson"
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError as e:
+            raise ObotConfigError(
+                "The 'orjson' codec requires the orjson package: pip install orjson"
+            ) from e
+        self.dumps = orjson.dumps
+        self.loads = orjson.loads
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec backed by ``msgspec``."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        try:
+            import msgspec
+        except ImportError as e:
+            raise ObotConfigError(
+                "The 'msgspec' codec requires the msgspec package: pip install msgspec"
+            ) from e
+        self.dumps = msgspec.json.Encoder().encode
+        self._decode = msgspec.json.Decoder().decode
+        self._decode_error = msgspec.DecodeError
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decode JSON text or bytes, raising ValueError if it is malformed."""
+        try:
+            return self._decode(data)
+        except self._decode_error as e:
+            raise ValueError(str(e)) from e
+
+
+CODECS: Dict[str, Callable[[], JSONCodec]] = {
+    "json": JSONCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+# Order in which "auto" picks an installed backend
+_AUTO_ORDER = ("orjson", "msgspec", "json")
+
+
+def get_codec(codec: Union[str, JSONCodec, None] = "auto") -> JSONCodec:
+    """
+    Resolve a codec name or instance.
+
+    Args:
+        codec: "auto" (fastest installed backend), "json", "orjson", "msgspec",
+            a ``JSONCodec`` instance, or None for the stdlib codec
+
+    Raises:
+        ObotConfigError: If the codec is unknown or its package isn't installed
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None:
+        return JSONCodec()
+    if codec == "auto":
+        for name in _AUTO_ORDER:
+            try:
+                return CODECS[name]()
+            except ObotConfigError:
+                continue
+    if codec not in CODECS:
+        raise ObotConfigError(
+            f"Unknown JSON codec '{codec}'. Available codecs: "
+            f"auto, {', '.join(CODECS)}"
+        )
+    return CODECS[codec]()
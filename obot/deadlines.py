@@ -0,0 +1,82 @@
+"""
+Deadlines bounding the total time of operations made of several requests.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional, Tuple
+import time
+import httpx
+from .exceptions import DeadlineExceededError
+
+# (absolute monotonic deadline, budget in seconds) of the innermost deadline
+_DEADLINE: ContextVar[Optional[Tuple[float, float]]] = ContextVar(
+    "obot_deadline", default=None
+)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Bound every request made inside the block by a shared time budget.
+
+    Each request's timeout is shrunk to the time remaining, retries and rate
+    limiting stop once it runs out, and ``DeadlineExceededError`` is raised.
+    The deadline follows the current thread or asyncio task into tasks and
+    batch workers started from it. Nested deadlines can only shorten it.
+
+    Example:
+        with deadline(10):
+            client.agents.update("a1-agent-id", model="gpt-4o", tools=["..."])
+    """
+    current = _DEADLINE.get()
+    expires = time.monotonic() + seconds
+    if current is not None and current[0] <= expires:
+        yield
+        return
+    token = _DEADLINE.set((expires, seconds))
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def current_deadline() -> Optional[Tuple[float, float]]:
+    """Return the current deadline as (monotonic expiry, budget), or None."""
+    return _DEADLINE.get()
+
+
+def remaining() -> Optional[float]:
+    """Return the seconds left before the current deadline, or None."""
+    current = _DEADLINE.get()
+    return None if current is None else current[0] - time.monotonic()
+
+
+def check_deadline() -> Optional[float]:
+    """
+    Return the seconds left before the current deadline, or None.
+
+    Raises:
+        DeadlineExceededError: If the deadline has passed
+    """
+    current = _DEADLINE.get()
+    if current is None:
+        return None
+    left = current[0] - time.monotonic()
+    if left <= 0:
+        raise DeadlineExceededError(current[1])
+    return left
+
+
+def deadline_exceeded() -> DeadlineExceededError:
+    """Return the error for the current deadline."""
+    current = _DEADLINE.get()
+    return DeadlineExceededError(current[1] if current is not None else None)
+
+
+def bounded_timeout(timeout: httpx.Timeout, left: float) -> Dict[str, float]:
+    """Return ``timeout`` as request extensions with every phase capped at ``left``."""
+    return {
+        phase: left if value is None else min(value, left)
+        for phase, value in timeout.as_dict().items()
+    }
@@ -0,0 +1,30 @@
+"""
+Classification of API paths into endpoint groups.
+
+Resilience and traffic controls (circuit breakers, rate limits) are applied
+per group, so a degraded agent runtime doesn't block catalog or CRUD calls.
+"""
+
+INVOKE = "invoke"
+CATALOG = "catalog"
+CRUD = "crud"
+
+ENDPOINT_GROUPS = (INVOKE, CATALOG, CRUD)
+
+_CATALOG_PREFIXES = ("api/tool-references", "api/models", "api/model-providers")
+
+
+def endpoint_group(path: str) -> str:
+    """
+    Return the endpoint group of a request path.
+
+    Returns:
+        "invoke" for agent invocations, "catalog" for tool reference and
+        model catalogs, and "crud" for everything else
+    """
+    path = path.lstrip("/")
+    if path.startswith("api/invoke"):
+        return INVOKE
+    if path.startswith(_CATALOG_PREFIXES):
+        return CATALOG
+    return CRUD
@@ -27,6 +27,41 @@ class ObotAPIError(ObotError):
         super().__init__(f"{message} (Status: {status_code})")
 
 
+class AgentConflictError(ObotAPIError):
+    """Raised when an agent update is rejected because its revision is stale."""
+
+    def __init__(
+        self,
+        agent_id: str,
+        expected_revision: Optional[str],
+        actual_revision: Optional[str] = None,
+        response_text: Optional[str] = None,
+    ):
+        self.agent_id = agent_id
+        self.expected_revision = expected_revision
+        self.actual_revision = actual_revision
+        message = (
+            f"Agent '{agent_id}' was modified concurrently "
+            f"(expected revision {expected_revision}"
+        )
+        if actual_revision is not None:
+            message += f", found {actual_revision}"
+        super().__init__(message + ")", 409, response_text)
+
+
+class CircuitOpenError(ObotAPIError):
+    """Raised without sending a request while an endpoint group's circuit is open."""
+
+    def __init__(self, group: str, retry_after: float):
+        self.group = group
+        self.retry_after = max(0.0, retry_after)
+        super().__init__(
+            f"Circuit open for '{group}' endpoints "
+            f"(retry in {self.retry_after:.1f}s)",
+            503,
+        )
+
+
 class ObotAuthError(ObotError):
     """Raised when there are authentication/authorization issues."""
 
@@ -37,3 +72,14 @@ class ObotConfigError(ObotError):
     """Raised when there are configuration issues."""
 
     pass
+
+
+class DeadlineExceededError(ObotAPIError, TimeoutError):
+    """Raised when an operation's deadline passes before it completes."""
+
+    def __init__(self, budget: Optional[float] = None):
+        self.budget = budget
+        message = "Deadline exceeded"
+        if budget is not None:
+            message += f" ({budget:.1f}s budget)"
+        super().__init__(message, 0)
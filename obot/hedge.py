@@ -0,0 +1,233 @@
+"""
+Hedged requests for latency-sensitive reads.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Awaitable, Callable, Deque, Dict, Optional, TypeVar
+import asyncio
+import contextvars
+import threading
+import time
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """
+    When to send a second copy of a slow idempotent request.
+
+    If a GET hasn't completed after ``delay`` seconds (or, without a fixed
+    delay, after the ``percentile`` latency observed for its endpoint group),
+    an identical request is sent and whichever finishes first wins; the other
+    is cancelled. Hedges are paid for from a budget that earns ``max_ratio``
+    of a hedge per request, so they add at most that fraction of extra load.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = 95.0,
+        min_delay: float = 0.01,
+        max_ratio: float = 0.1,
+        burst: float = 10.0,
+        window: int = 200,
+        min_samples: int = 20,
+        max_workers: int = 64,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            delay: Fixed seconds to wait before hedging, or None to use the
+                observed ``percentile`` latency
+            percentile: Latency percentile after which to hedge
+            min_delay: Lower bound of the hedging delay
+            max_ratio: Maximum hedges per request, on average
+            burst: Hedges that may be sent back to back from a full budget
+            window: Latencies kept per endpoint group for the percentile
+            min_samples: Latencies needed before percentile hedging starts
+            max_workers: Threads available to hedged requests of sync clients
+        """
+        self.delay = delay
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_ratio = max_ratio
+        self.burst = burst
+        self.window = window
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self._tokens = burst
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.requests = 0
+        self.hedged = 0
+
+    def hedge_delay(self, group: str) -> Optional[float]:
+        """
+        Return how long a request to ``group`` may run before it is hedged.
+
+        Returns:
+            Seconds, or None while too few latencies have been observed
+        """
+        if self.delay is not None:
+            return max(self.delay, self.min_delay)
+        with self._lock:
+            samples = self._latencies.get(group)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(ordered[index], self.min_delay)
+
+    def record(self, group: str, latency: float) -> None:
+        """Record the latency of a completed request."""
+        with self._lock:
+            samples = self._latencies.get(group)
+            if samples is None:
+                samples = self._latencies[group] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def _start(self) -> None:
+        """Count a request, earning its share of a hedge."""
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self.burst, self._tokens + self.max_ratio)
+
+    def _affordable(self) -> bool:
+        """Whether the budget currently holds a hedge."""
+        with self._lock:
+            return self._tokens >= 1
+
+    def _allow(self) -> bool:
+        """Spend a hedge from the budget, if one is available."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedged += 1
+            return True
+
+    def run_sync(self, group: str, func: Callable[[], T]) -> T:
+        """
+        Call ``func``, hedging it with a second call if it is slow.
+
+        When no hedge could be sent the call runs on the calling thread.
+        Otherwise both calls run on the policy's threads, since a sync request
+        can't be interrupted: the losing call completes in the background and
+        its result is discarded. The hedging delay counts from when the first
+        call starts running, so time queued for a thread doesn't trigger a
+        hedge. If the policy is closed before the first call gets a thread,
+        the call runs on the calling thread instead.
+        """
+        self._start()
+        delay = self.hedge_delay(group)
+        if delay is None or not self._affordable():
+            return self._timed(group, func)
+        executor = self._threads()
+        context = contextvars.copy_context()
+        running = threading.Event()
+
+        def first() -> T:
+            running.set()
+            return self._timed(group, func)
+
+        try:
+            primary = executor.submit(context.copy().run, first)
+        except RuntimeError:
+            # Closed since the executor was looked up
+            return self._timed(group, func)
+        # close() cancels queued calls, which must end the wait as well
+        primary.add_done_callback(lambda _: running.set())
+        calls = {primary}
+        try:
+            running.wait()
+            if primary.cancelled():
+                return self._timed(group, func)
+            done, _ = wait(calls, timeout=delay)
+            if not done and self._allow():
+                try:
+                    calls.add(
+                        executor.submit(context.copy().run, self._timed, group, func)
+                    )
+                except RuntimeError:
+                    # Closed meanwhile: the first call alone decides
+                    pass
+            return _first_result(calls)
+        finally:
+            for call in calls:
+                call.cancel()
+
+    async def run(self, group: str, func: Callable[[], Awaitable[T]]) -> T:
+        """Await ``func()``, hedging it with a second call if it is slow."""
+        self._start()
+        delay = self.hedge_delay(group)
+        if delay is None:
+            return await self._timed_async(group, func)
+        calls = {asyncio.ensure_future(self._timed_async(group, func))}
+        try:
+            done, _ = await asyncio.wait(calls, timeout=delay)
+            if not done and self._allow():
+                calls.add(asyncio.ensure_future(self._timed_async(group, func)))
+            pending = set(calls)
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for call in done:
+                    if call.exception() is None or not pending:
+                        return call.result()
+        finally:
+            for call in calls:
+                call.cancel()
+
+    def _timed(self, group: str, func: Callable[[], T]) -> T:
+        started = time.perf_counter()
+        result = func()
+        self.record(group, time.perf_counter() - started)
+        return result
+
+    async def _timed_async(self, group: str, func: Callable[[], Awaitable[T]]) -> T:
+        started = time.perf_counter()
+        result = await func()
+        self.record(group, time.perf_counter() - started)
+        return result
+
+    def _threads(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="obot-hedge"
+                    )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the threads of sync hedged requests, if any were started."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of requests made and of hedges sent."""
+        with self._lock:
+            return {"requests": self.requests, "hedged": self.hedged}
+
+
+def _first_result(calls: "set[Future[T]]") -> T:
+    """
+    Return the first successful result, or raise the last failure.
+
+    Calls cancelled by ``close()`` before they started are skipped; the
+    first call is always running, so at least one result arrives.
+    """
+    pending = set(calls)
+    while True:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for call in done:
+            if call.cancelled():
+                continue
+            if call.exception() is None or not pending:
+                return call.result()
@@ -0,0 +1,182 @@
+"""
+Conditional GET cache revalidated with ETag and Last-Modified.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+import threading
+import httpx
+
+
+class CachedResponse:
+    """A parsed response body and the validators needed to revalidate it."""
+
+    __slots__ = ("etag", "last_modified", "value", "size")
+
+    def __init__(
+        self,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        value: Any,
+        size: int,
+    ):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.value = value
+        self.size = size
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Return the headers asking the server to revalidate this response."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def fresh_value(self) -> Any:
+        """Return the cached value for a new caller."""
+        return copy_value(self.value)
+
+
+def copy_value(value: Any) -> Any:
+    """
+    Return a cached value that is safe to hand to a caller.
+
+    Models are mutable, so each caller gets its own deep copy rather than the
+    instance held by the cache. Decoded bodies are shared as they are, like
+    the catalog cache does.
+    """
+    # Imported here so a client without cached models never loads pydantic
+    from pydantic import BaseModel
+
+    if isinstance(value, BaseModel):
+        return value.model_copy(deep=True)
+    return value
+
+
+class ResponseCache:
+    """
+    A thread-safe LRU cache of GET responses revalidated by the server.
+
+    Responses carrying an ``ETag`` or ``Last-Modified`` header are stored with
+    their parsed body. The next GET for the same URL sends ``If-None-Match`` /
+    ``If-Modified-Since``, and a ``304 Not Modified`` is answered from the
+    cache without transferring or parsing the body again. Memory is bounded
+    by ``max_entries`` and by ``max_bytes`` of response bodies; the least
+    recently used entries are evicted first. Setting either limit to 0
+    disables the cache.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 16 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses held
+            max_bytes: Maximum total size of the response bodies held
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        """Return the entry to revalidate for ``key``, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def update(
+        self,
+        key: Hashable,
+        entry: Optional[CachedResponse],
+        resp: httpx.Response,
+        value: Any,
+    ) -> bool:
+        """
+        Record the outcome of a (possibly conditional) GET.
+
+        Args:
+            key: The request's cache key
+            entry: The entry that was revalidated, if any
+            resp: The response received
+            value: The parsed body of a 2xx response
+
+        Returns:
+            Whether ``value`` was stored in the cache
+        """
+        if resp.status_code == 304:
+            with self._lock:
+                self.hits += 1
+            return False
+
+        with self._lock:
+            self.misses += 1
+        cache_control = resp.headers.get("cache-control", "").lower()
+        etag = resp.headers.get("etag")
+        last_modified = resp.headers.get("last-modified")
+        if "no-store" in cache_control or (etag is None and last_modified is None):
+            if entry is not None:
+                self.invalidate(key)
+            return False
+        return self.put(
+            key, CachedResponse(etag, last_modified, value, len(resp.content))
+        )
+
+    def put(self, key: Hashable, entry: CachedResponse) -> bool:
+        """
+        Store an entry, evicting the least recently used ones if full.
+
+        Returns:
+            Whether the entry was stored
+        """
+        if entry.size > self.max_bytes or self.max_entries <= 0:
+            return False
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self.evictions += 1
+            return key in self._entries
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop cached responses.
+
+        Args:
+            key: The entry to drop, or None to clear the whole cache
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._bytes = 0
+            else:
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self._bytes -= entry.size
+
+    def stats(self) -> Dict[str, int]:
+        """Return revalidation hit/miss/eviction counters and the current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,70 @@
+"""
+Deferred imports for fast client startup.
+
+Only the modules a caller actually touches are imported: packages resolve
+their public names on first access and clients create sub-APIs on first use.
+"""
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` functions (PEP 562).
+
+    Args:
+        package: ``__name__`` of the package exporting the names
+        exports: Mapping of exported name to the relative module defining it
+
+    Returns:
+        The ``(__getattr__, __dir__)`` pair for the package
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(import_module(package), name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(import_module(package))) | set(exports))
+
+    return __getattr__, __dir__
+
+
+class LazyAPI:
+    """
+    Client attribute creating a sub-API on first access.
+
+    The API module is imported and the instance built with the owning
+    client's ``_make_api``, then stored on the client so later accesses are
+    plain attribute lookups.
+    """
+
+    def __init__(self, module: str, name: str):
+        """
+        Initialize the descriptor.
+
+        Args:
+            module: Module defining the API class, relative to ``obot``
+            name: Name of the API class
+        """
+        self._module = module
+        self._name = name
+        self._attr = name
+
+    def __set_name__(self, owner: type, attr: str) -> None:
+        self._attr = attr
+
+    def __get__(self, client: Any, owner: type = None) -> Any:
+        if client is None:
+            return self
+        api_class = getattr(import_module(self._module, "obot"), self._name)
+        api = client.__dict__.setdefault(self._attr, client._make_api(api_class))
+        return api
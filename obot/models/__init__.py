@@ -1,11 +1,30 @@
 """Models for the Obot API."""
 
-from .agent import Agent, AgentLinks, AgentIcons
-from .tool import Tool
-from .workflow import Workflow
-from .thread import Thread, ThreadMessage
-from .model_provider import ModelProvider
-from .model import Model
+from typing import TYPE_CHECKING
+from ..lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .agent import Agent, AgentLinks, AgentIcons
+    from .tool import Tool
+    from .workflow import Workflow
+    from .thread import Thread, ThreadMessage
+    from .model_provider import ModelProvider
+    from .model import Model
+
+# Model modules are imported on first use of their names
+_EXPORTS = {
+    "Agent": ".agent",
+    "AgentLinks": ".agent",
+    "AgentIcons": ".agent",
+    "Tool": ".tool",
+    "Workflow": ".workflow",
+    "Thread": ".thread",
+    "ThreadMessage": ".thread",
+    "ModelProvider": ".model_provider",
+    "Model": ".model",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "Agent",
@@ -1,5 +1,6 @@
 from typing import Optional, Union, Iterator, AsyncIterator
 from dataclasses import dataclass
+from ..response import ResponseMeta, last_response
 
 
 @dataclass
@@ -10,6 +11,9 @@ class Conversation:
     thread_id: str
     _client: Union["ObotClient", "AsyncObotClient"]  # type: ignore
     last_response: str
+    # Status, headers and timing of the latest invoke in this conversation;
+    # for a streamed turn, set once its response headers arrive
+    response: Optional[ResponseMeta] = None
 
     async def achat(
         self, message: str, stream: bool = False
@@ -27,16 +31,19 @@ class Conversation:
         if not hasattr(self._client.chat, "__call__"):
             raise RuntimeError("Async chat not available")
 
-        response = await self._client.chat(
-            self.agent_id, message, thread_id=self.thread_id, stream=stream
-        )
-
-        if not stream:
-            self.last_response = response
-            return response
+        self.response = None
+        if stream:
+            chunks = await self._client.chat(
+                self.agent_id, message, thread_id=self.thread_id, stream=True
+            )
+            return self._atrack(chunks)
 
-        # For streaming responses, we need to await the async iterator
-        return response
+        turn = await self._client.chat(
+            self.agent_id, message, thread_id=self.thread_id, return_conversation=True
+        )
+        self.last_response = turn.last_response
+        self.response = turn.response
+        return turn.last_response
 
     def chat(self, message: str, stream: bool = False) -> Union[str, Iterator[str]]:
         """
@@ -52,13 +59,32 @@ class Conversation:
         if not hasattr(self._client.chat, "__call__"):
             raise RuntimeError("Sync chat not available")
 
-        response = self._client.chat(
-            self.agent_id, message, thread_id=self.thread_id, stream=stream
+        self.response = None
+        if stream:
+            chunks = self._client.chat(
+                self.agent_id, message, thread_id=self.thread_id, stream=True
+            )
+            return self._track(chunks)
+
+        turn = self._client.chat(
+            self.agent_id, message, thread_id=self.thread_id, return_conversation=True
         )
+        self.last_response = turn.last_response
+        self.response = turn.response
+        return turn.last_response
+
+    def _track(self, chunks: Iterator[str]) -> Iterator[str]:
+        # The stream records its response when its headers arrive
+        for chunk in chunks:
+            if self.response is None:
+                self.response = last_response()
+            yield chunk
 
-        if not stream:
-            self.last_response = response
-        return response
+    async def _atrack(self, chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+        async for chunk in chunks:
+            if self.response is None:
+                self.response = last_response()
+            yield chunk
 
     def __str__(self) -> str:
         """Return the last response when converting to string."""
@@ -0,0 +1,431 @@
+"""
+Client-side rate limiting and concurrency caps.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    A token bucket refilled at ``rate`` tokens per second up to ``burst``.
+
+    Tokens are reserved ahead: ``reserve`` always takes a token and returns
+    how long the caller must wait for it, so waiting callers are served in
+    order and sync and async callers can share one bucket.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket size (defaults to one second of tokens, at least 1)
+            clock: Monotonic time source
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def refund(self) -> None:
+        """Return a reserved token that won't be used."""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+
+
+class _Slots:
+    """
+    A concurrency cap shared by threads and by asyncio tasks on any event
+    loop.
+
+    Async waiters park on futures of their own loop and are woken through
+    ``call_soon_threadsafe``, so no asyncio primitive is tied to the loop that
+    first used the cap.
+    """
+
+    def __init__(self, limit: float):
+        self._limit = limit
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._threads = threading.Condition(self._lock)
+        self._tasks: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a slot."""
+        return self._in_flight
+
+    def acquire_sync(self, timeout: Optional[float] = None) -> bool:
+        with self._threads:
+            if not self._threads.wait_for(
+                lambda: self._in_flight < int(self._limit), timeout
+            ):
+                return False
+            self._in_flight += 1
+            return True
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return
+                waiter = loop.create_future()
+                self._tasks.append(waiter)
+            await waiter
+
+    def release(self, is_async: bool) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._wake()
+
+    def record(self, latency: float, overloaded: bool) -> None:
+        pass
+
+    def _wake(self) -> None:
+        # Every waiter re-checks the limit, so waking all of them never
+        # strands a free slot behind a cancelled waiter
+        self._threads.notify_all()
+        while self._tasks:
+            waiter = self._tasks.popleft()
+            if not waiter.done():
+                waiter.get_loop().call_soon_threadsafe(_resolve, waiter)
+
+
+def _resolve(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AdaptiveLimit(_Slots):
+    """
+    A concurrency limit tuned by AIMD (additive increase, multiplicative
+    decrease).
+
+    While requests succeed with healthy latency and the limit is in use, each
+    success adds ``increase / limit``, so the limit grows by about
+    ``increase`` per window of ``limit`` requests. A 429, 5xx or transport
+    error multiplies it by ``backoff``, and so does a smoothed latency above
+    ``latency_threshold`` when one is set; without it latency never causes a
+    backoff. Only one decrease is applied per window: requests that started
+    before the last decrease don't cut it again, so a burst of errors doesn't
+    collapse it.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        backoff: float = 0.5,
+        latency_threshold: Optional[float] = None,
+        smoothing: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the limit.
+
+        Args:
+            initial: Starting concurrency
+            min_limit: Lowest concurrency the limit backs off to
+            max_limit: Highest concurrency the limit grows to
+            increase: Added to the limit per window of healthy responses
+            backoff: Factor applied to the limit on overload
+            latency_threshold: Smoothed latency in seconds treated as
+                overload, or None to back off on errors only
+            smoothing: Weight of each new sample in the latency average
+            clock: Monotonic time source
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        super().__init__(float(min(max(initial, self.min_limit), self.max_limit)))
+        self.increase = increase
+        self.backoff = backoff
+        self.latency_threshold = latency_threshold
+        self.smoothing = smoothing
+        self._clock = clock
+        self._latency: Optional[float] = None
+        self._decreased_at = float("-inf")
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Smoothed latency of recent responses, in seconds."""
+        return self._latency
+
+    def record(self, latency: float, overloaded: bool) -> None:
+        """
+        Adjust the limit from one response.
+
+        Args:
+            latency: Seconds the request took
+            overloaded: Whether the server signalled overload (429, 5xx or a
+                transport error)
+        """
+        with self._lock:
+            if self._latency is None:
+                self._latency = latency
+            else:
+                self._latency += self.smoothing * (latency - self._latency)
+
+            if self.latency_threshold is not None:
+                overloaded = overloaded or self._latency > self.latency_threshold
+            now = self._clock()
+            if overloaded:
+                if now - latency >= self._decreased_at:
+                    self._limit = max(self.min_limit, self._limit * self.backoff)
+                    self._decreased_at = now
+            elif self._in_flight * 2 >= int(self._limit):
+                self._limit = min(
+                    self.max_limit, self._limit + self.increase / self._limit
+                )
+                self._wake()
+
+
+@dataclass
+class Limit:
+    """
+    Rate and concurrency limits for one scope.
+
+    Attributes:
+        rate: Maximum requests per second, or None for no rate limit
+        burst: Requests allowed at once before the rate applies
+        max_concurrency: Maximum requests in flight, an AdaptiveLimit that
+            tunes it from responses, or None for no cap
+    """
+
+    rate: Optional[float] = None
+    burst: Optional[float] = None
+    max_concurrency: Union[int, AdaptiveLimit, None] = None
+
+
+class _Scope:
+    """The bucket and concurrency cap enforcing one Limit."""
+
+    def __init__(self, limit: Limit):
+        self.bucket = (
+            TokenBucket(limit.rate, limit.burst) if limit.rate is not None else None
+        )
+        concurrency = limit.max_concurrency
+        if isinstance(concurrency, int):
+            concurrency = _Slots(concurrency)
+        self.concurrency: Union[_Slots, None] = concurrency
+
+    def acquire_sync(self, timeout: Optional[float] = None) -> bool:
+        if self.concurrency is None:
+            return True
+        return self.concurrency.acquire_sync(timeout)
+
+    async def acquire(self) -> None:
+        if self.concurrency is not None:
+            await self.concurrency.acquire()
+
+    def release(self, is_async: bool) -> None:
+        if self.concurrency is not None:
+            self.concurrency.release(is_async)
+
+    def record(self, latency: float, overloaded: bool) -> None:
+        if self.concurrency is not None:
+            self.concurrency.record(latency, overloaded)
+
+    def reserve(self) -> float:
+        return self.bucket.reserve() if self.bucket is not None else 0.0
+
+    def refund(self) -> None:
+        if self.bucket is not None:
+            self.bucket.refund()
+
+
+class RateLimiter:
+    """
+    Rate and concurrency limits shared by every sub-API of a client.
+
+    A client-wide limit applies to all requests, and each endpoint group
+    ("invoke", "catalog", "crud") may have its own limit on top of it. A
+    request first takes a concurrency slot (group, then client) and then
+    waits for a rate token, so sends are paced by the rate limit. The time
+    spent waiting is reported as ``queue_wait`` on each response's metadata
+    and aggregated in ``stats()``.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        groups: Optional[Dict[str, Limit]] = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Client-wide maximum requests per second
+            burst: Client-wide requests allowed at once before the rate applies
+            max_concurrency: Client-wide maximum requests in flight
+            groups: Additional limits keyed by endpoint group
+        """
+        self._client = _Scope(Limit(rate, burst, max_concurrency))
+        self._groups = {group: _Scope(limit) for group, limit in (groups or {}).items()}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def _scopes(self, group: str) -> List[_Scope]:
+        scope = self._groups.get(group)
+        return [scope, self._client] if scope is not None else [self._client]
+
+    def acquire_sync(self, group: str, timeout: Optional[float] = None) -> float:
+        """
+        Block until a request to ``group`` may be sent.
+
+        Args:
+            group: Endpoint group of the request
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            TimeoutError: If the request can't be sent within ``timeout``
+        """
+        started = time.perf_counter()
+        acquired: List[_Scope] = []
+        reserved = False
+        try:
+            for scope in self._scopes(group):
+                left = None
+                if timeout is not None:
+                    left = max(0.0, timeout - (time.perf_counter() - started))
+                if not scope.acquire_sync(left):
+                    raise TimeoutError(f"No {group} request slot within {timeout}s")
+                acquired.append(scope)
+            delay = max(scope.reserve() for scope in acquired)
+            reserved = True
+            if timeout is not None and delay > timeout - (
+                time.perf_counter() - started
+            ):
+                raise TimeoutError(f"No {group} rate token within {timeout}s")
+            if delay > 0:
+                time.sleep(delay)
+        except BaseException:
+            for scope in acquired:
+                if reserved:
+                    scope.refund()
+                scope.release(is_async=False)
+            raise
+        return self._waited(group, time.perf_counter() - started)
+
+    async def acquire(self, group: str, timeout: Optional[float] = None) -> float:
+        """
+        Wait until a request to ``group`` may be sent.
+
+        Args:
+            group: Endpoint group of the request
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            TimeoutError: If the request can't be sent within ``timeout``
+        """
+        if timeout is None:
+            return await self._acquire(group)
+        try:
+            return await asyncio.wait_for(self._acquire(group), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"No {group} request slot within {timeout}s") from None
+
+    async def _acquire(self, group: str) -> float:
+        started = time.perf_counter()
+        acquired: List[_Scope] = []
+        reserved = False
+        try:
+            for scope in self._scopes(group):
+                await scope.acquire()
+                acquired.append(scope)
+            delay = max(scope.reserve() for scope in acquired)
+            reserved = True
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            # A caller that times out or is cancelled gives back its slots
+            # and its rate tokens, so abandoned waits don't drain the bucket
+            for scope in acquired:
+                if reserved:
+                    scope.refund()
+                scope.release(is_async=True)
+            raise
+        return self._waited(group, time.perf_counter() - started)
+
+    def record(self, group: str, latency: float, overloaded: bool) -> None:
+        """Feed a response to the adaptive limits applying to ``group``."""
+        for scope in self._scopes(group):
+            scope.record(latency, overloaded)
+
+    def limits(self) -> Dict[str, int]:
+        """Return the current concurrency limit of each capped scope."""
+        scopes = dict(self._groups, client=self._client)
+        return {
+            name: scope.concurrency.limit
+            for name, scope in scopes.items()
+            if scope.concurrency is not None
+        }
+
+    def release(self, group: str, is_async: bool) -> None:
+        """Release the concurrency slots taken for a request to ``group``."""
+        for scope in self._scopes(group):
+            scope.release(is_async)
+        with self._lock:
+            self._stats[group]["in_flight"] -= 1
+
+    def _waited(self, group: str, wait: float) -> float:
+        with self._lock:
+            stats = self._stats.setdefault(
+                group,
+                {"requests": 0, "in_flight": 0, "queue_wait": 0.0, "max_wait": 0.0},
+            )
+            stats["requests"] += 1
+            stats["in_flight"] += 1
+            stats["queue_wait"] += wait
+            stats["max_wait"] = max(stats["max_wait"], wait)
+        return wait
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return per-group counters.
+
+        Returns:
+            For each endpoint group used so far: "requests", "in_flight",
+            total "queue_wait" and "max_wait" in seconds
+        """
+        with self._lock:
+            return {group: dict(stats) for group, stats in self._stats.items()}
@@ -0,0 +1,151 @@
+"""
+Compact, immutable records mirroring the pydantic API models.
+
+Records keep their values in ``__slots__`` instead of a per-instance dict and
+skip validation, which makes them much smaller than the pydantic models when
+holding whole catalogs or agent fleets in memory. They expose the same
+attribute names and convert back to the pydantic model with ``to_model()``.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Tuple, Type
+from pydantic import BaseModel
+from .models import Agent, Model, ModelProvider, Tool
+from .validation import _nested_fields
+
+
+class Record:
+    """Base class for compact records of API objects."""
+
+    __slots__ = ()
+    _model: Type[BaseModel]
+    _defaults: Tuple[Tuple[str, Any], ...]
+    _nested: Dict[str, Tuple[Type["Record"], bool]]
+    _fields: FrozenSet[str]
+    # Sets of present fields, shared by records built from same-shaped items
+    _present_sets: Dict[FrozenSet[str], FrozenSet[str]]
+    _present: FrozenSet[str]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Record":
+        """Build a record from a raw API item without validation."""
+        record = cls.__new__(cls)
+        set_value = object.__setattr__
+        for name, default in cls._defaults:
+            set_value(record, name, data.get(name, default))
+        present = cls._fields.intersection(data)
+        set_value(record, "_present", cls._present_sets.setdefault(present, present))
+        for name, (record_type, many) in cls._nested.items():
+            value = data.get(name)
+            if many and isinstance(value, list):
+                value = tuple(
+                    record_type.from_dict(v) if isinstance(v, dict) else v
+                    for v in value
+                )
+                set_value(record, name, value)
+            elif isinstance(value, dict):
+                set_value(record, name, record_type.from_dict(value))
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record's fields as a plain dict."""
+        data = {}
+        for name, _ in self._defaults:
+            value = getattr(self, name)
+            if isinstance(value, Record):
+                value = value.to_dict()
+            elif isinstance(value, tuple) and name in self._nested:
+                value = [v.to_dict() if isinstance(v, Record) else v for v in value]
+            data[name] = value
+        return data
+
+    def _present_dict(self) -> Dict[str, Any]:
+        """Return only the fields the source item carried, nested ones too."""
+        data = {}
+        for name, _ in self._defaults:
+            if name not in self._present:
+                continue
+            value = getattr(self, name)
+            if isinstance(value, Record):
+                value = value._present_dict()
+            elif isinstance(value, tuple) and name in self._nested:
+                value = [
+                    v._present_dict() if isinstance(v, Record) else v for v in value
+                ]
+            data[name] = value
+        return data
+
+    def to_model(self) -> BaseModel:
+        """
+        Convert the record to its pydantic model.
+
+        Exactly the fields present in the source item are set, so the model's
+        ``exclude_unset`` dump matches the response the record came from.
+        """
+        return self._model.model_validate(self._present_dict())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name, _ in self._defaults
+        )
+
+    __hash__ = None  # type: ignore
+
+    def __reduce__(self):
+        # Rebuilt through the model, since generated classes aren't importable
+        return (_rebuild, (self._model, self._present_dict()))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name, _ in self._defaults
+        )
+        return f"{type(self).__name__}({fields})"
+
+
+def _rebuild(model: Type[BaseModel], data: Dict[str, Any]) -> Record:
+    """Unpickle a record of ``model``."""
+    return record_type(model).from_dict(data)
+
+
+@lru_cache(maxsize=None)
+def record_type(model: Type[BaseModel]) -> Type[Record]:
+    """Return the record class mirroring a pydantic model, created once."""
+    fields = tuple(model.model_fields)
+    defaults = tuple(
+        (
+            name,
+            None if field.is_required() or field.default_factory else field.default,
+        )
+        for name, field in model.model_fields.items()
+    )
+    nested = {
+        name: (record_type(sub_model), many)
+        for name, (sub_model, many) in _nested_fields(model).items()
+    }
+    return type(
+        f"{model.__name__}Record",
+        (Record,),
+        {
+            "__slots__": fields + ("_present",),
+            "__module__": __name__,
+            "_model": model,
+            "_defaults": defaults,
+            "_nested": nested,
+            "_fields": frozenset(fields),
+            "_present_sets": {},
+        },
+    )
+
+
+AgentRecord = record_type(Agent)
+ToolRecord = record_type(Tool)
+ModelRecord = record_type(Model)
+ModelProviderRecord = record_type(ModelProvider)
@@ -0,0 +1,72 @@
+"""
+Per-request response metadata.
+"""
+
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+import httpx
+
+
+@dataclass(frozen=True)
+class ResponseMeta:
+    """Status, headers and timing of a single API response."""
+
+    method: str
+    url: str
+    status_code: int
+    headers: httpx.Headers = field(repr=False)
+    # Seconds from sending the request to receiving the response (for
+    # streams, to receiving the response headers)
+    elapsed: float = 0.0
+    # Seconds spent waiting for the client's rate and concurrency limits
+    queue_wait: float = 0.0
+
+    @classmethod
+    def from_response(
+        cls, resp: httpx.Response, elapsed: float, queue_wait: float = 0.0
+    ) -> "ResponseMeta":
+        """Capture the metadata of an httpx response."""
+        return cls(
+            method=resp.request.method,
+            url=str(resp.request.url),
+            status_code=resp.status_code,
+            headers=resp.headers,
+            elapsed=elapsed,
+            queue_wait=queue_wait,
+        )
+
+    @property
+    def thread_id(self) -> Optional[str]:
+        """The ``X-Obot-Thread-Id`` header, if present."""
+        return self.headers.get("x-obot-thread-id")
+
+
+# Each asyncio task and thread sees only the responses it received itself
+_LAST_RESPONSE: ContextVar[Optional[ResponseMeta]] = ContextVar(
+    "obot_last_response", default=None
+)
+
+
+def last_response() -> Optional[ResponseMeta]:
+    """
+    Return the metadata of the last response received in the current context.
+
+    The value is tracked per asyncio task and per thread, so concurrent
+    requests on one client never see each other's responses.
+    """
+    return _LAST_RESPONSE.get()
+
+
+def _record(
+    resp: httpx.Response, elapsed: float, queue_wait: float = 0.0
+) -> ResponseMeta:
+    """Record a response as the current context's last response."""
+    meta = ResponseMeta.from_response(resp, elapsed, queue_wait)
+    _LAST_RESPONSE.set(meta)
+    return meta
+
+
+def _share(meta: ResponseMeta) -> None:
+    """Record a response received on behalf of the current context."""
+    _LAST_RESPONSE.set(meta)
@@ -0,0 +1,178 @@
+"""
+Retry policy for transient API failures.
+"""
+
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional, Union
+import random
+import threading
+import time
+import httpx
+
+# Statuses worth retrying: rate limiting and gateway/availability errors
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Failures raised before the request reached the server; safe for any method
+_NOT_SENT = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class RetryBudget:
+    """
+    Client-wide budget limiting retries during an outage.
+
+    A token bucket in the style of gRPC retry throttling: every retryable
+    failure takes a token, every success returns ``token_ratio`` tokens, and
+    retries are only allowed while more than half of ``max_tokens`` remain.
+    Retries therefore stop once most requests are failing instead of
+    multiplying the load on a struggling server.
+    """
+
+    def __init__(self, max_tokens: float = 10.0, token_ratio: float = 0.1):
+        """
+        Initialize the budget.
+
+        Args:
+            max_tokens: Size of the bucket
+            token_ratio: Tokens returned by each successful request
+        """
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        return self._tokens
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+    def on_failure(self) -> bool:
+        """Record a retryable failure; return whether a retry is allowed."""
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+            return self._tokens > self.max_tokens / 2
+
+
+@dataclass
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed request.
+
+    GET, PUT and other idempotent requests are retried on transport errors
+    and on ``statuses``. POST requests to ``/api/invoke`` are retried the same
+    way as long as no response bytes have been streamed to the caller; other
+    POST requests are only retried when they were never sent or were rejected
+    with 429. Delays use exponential backoff with full jitter, and a
+    ``Retry-After`` header on 429/503 responses takes precedence.
+
+    Attributes:
+        max_attempts: Total attempts per request, including the first
+        backoff: Base delay in seconds, doubled on each retry
+        max_backoff: Upper bound of the backoff delay
+        max_retry_after: Upper bound honored for ``Retry-After``
+        statuses: Response statuses considered transient
+        budget: Shared retry budget, or None for no limit
+    """
+
+    max_attempts: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    max_retry_after: float = 60.0
+    statuses: FrozenSet[int] = RETRY_STATUSES
+    budget: Optional[RetryBudget] = field(default_factory=RetryBudget)
+
+    def retry_delay(
+        self,
+        method: str,
+        path: str,
+        attempt: int,
+        *,
+        status: Optional[int] = None,
+        error: Optional[Exception] = None,
+        retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry a failed attempt.
+
+        Args:
+            method: HTTP method of the request
+            path: Request path
+            attempt: Number of attempts made so far
+            status: Response status, for error responses
+            error: Transport error, for requests that got no response
+            retry_after: The response's ``Retry-After`` header
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        if not self._retryable(method, path, status, error):
+            return None
+        if self.budget is not None and not self.budget.on_failure():
+            return None
+        if attempt >= self.max_attempts:
+            return None
+
+        delay = random.uniform(
+            0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        )
+        if retry_after is not None and status in (429, 503):
+            wait = _parse_retry_after(retry_after)
+            if wait is not None:
+                delay = min(max(wait, 0.0), self.max_retry_after)
+        return delay
+
+    def on_success(self) -> None:
+        """Record a successful request with the retry budget."""
+        if self.budget is not None:
+            self.budget.on_success()
+
+    def _retryable(
+        self,
+        method: str,
+        path: str,
+        status: Optional[int],
+        error: Optional[Exception],
+    ) -> bool:
+        if error is not None:
+            if isinstance(error, _NOT_SENT):
+                return True
+            if not isinstance(error, httpx.TransportError):
+                return False
+        elif status not in self.statuses:
+            return False
+        elif status == 429:
+            return True
+        return method in IDEMPOTENT_METHODS or (
+            method == "POST" and "api/invoke/" in path
+        )
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    """Parse a ``Retry-After`` value in seconds or as an HTTP date."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def get_retry_policy(retry: Union[RetryPolicy, bool, None]) -> Optional[RetryPolicy]:
+    """
+    Resolve the ``retry`` client option.
+
+    Args:
+        retry: A RetryPolicy, True for the default policy, or False/None to
+            disable retries
+    """
+    if isinstance(retry, RetryPolicy):
+        return retry
+    return RetryPolicy() if retry else None
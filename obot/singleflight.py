@@ -0,0 +1,159 @@
+"""
+Coalescing of identical concurrent requests.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+import asyncio
+import threading
+
+T = TypeVar("T")
+
+
+class _Call:
+    """A call in flight, shared by the thread running it and its waiters."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _Flight:
+    """A task in flight and the number of coroutines awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Shares one execution of a call among concurrent callers with the same key.
+
+    While a call for a key is in flight, further callers with that key wait
+    for it and receive its result or exception instead of starting their own.
+    Once it finishes the key is forgotten, so nothing is cached: the next
+    caller starts a new call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._flights: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], _Flight] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def do_sync(
+        self,
+        key: Hashable,
+        func: Callable[[], T],
+        copy: Optional[Callable[[T], T]] = None,
+    ) -> T:
+        """
+        Run ``func`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key: Identifies calls that may be shared
+            func: The call to run
+            copy: Applied to the result handed to each waiting caller, so
+                callers don't share a mutable result
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Any exception raised by the shared call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result if copy is None else copy(call.result)
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[T]],
+        copy: Optional[Callable[[T], T]] = None,
+    ) -> T:
+        """
+        Await ``func()`` unless a call for ``key`` is already in flight.
+
+        The call runs in its own task, so a cancelled caller doesn't cancel
+        it for the others; it is only cancelled once every caller is gone.
+
+        Args:
+            key: Identifies calls that may be shared
+            func: The call to run
+            copy: Applied to the result handed to each waiting caller, so
+                callers don't share a mutable result
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Any exception raised by the shared call
+        """
+        flight_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            flight = self._flights.get(flight_key)
+            # A flight without waiters was cancelled when its last caller left
+            leader = flight is None or flight.waiters == 0
+            if leader:
+                flight = self._flights[flight_key] = _Flight(
+                    asyncio.ensure_future(func())
+                )
+                flight.task.add_done_callback(
+                    lambda task: self._forget(flight_key, task)
+                )
+                self.calls += 1
+            else:
+                self.coalesced += 1
+            flight.waiters += 1
+
+        try:
+            result = await asyncio.shield(flight.task)
+            return result if leader or copy is None else copy(result)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+
+    def _forget(self, flight_key: Hashable, task: "asyncio.Future[Any]") -> None:
+        with self._lock:
+            flight = self._flights.get(flight_key)
+            if flight is not None and flight.task is task:
+                del self._flights[flight_key]
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of calls made, callers coalesced and calls in flight."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls) + len(self._flights),
+            }
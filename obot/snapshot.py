@@ -0,0 +1,197 @@
+"""
+On-disk snapshot of catalog responses shared by processes on one host.
+"""
+
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional, TypeVar
+import logging
+import os
+import time
+
+if TYPE_CHECKING:
+    import sqlite3
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalogs (
+    base_url TEXT NOT NULL,
+    path TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    updated REAL NOT NULL,
+    checked REAL NOT NULL,
+    PRIMARY KEY (base_url, path)
+)
+"""
+
+
+def _default_path() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "obot", "catalogs.sqlite3")
+
+
+class SnapshotEntry(NamedTuple):
+    """A stored catalog response."""
+
+    body: bytes
+    etag: Optional[str]
+    # Seconds since the server last confirmed the body
+    age: float
+
+
+class CatalogSnapshot:
+    """
+    A SQLite store of catalog responses keyed by base URL and path.
+
+    A new process loads the tool reference, model and model provider catalogs
+    from the snapshot instead of downloading them, then revalidates them in
+    the background with the stored ``ETag``. The database runs in WAL mode
+    and every operation uses its own connection, so pre-forked workers can
+    share one file; ``claim`` lets only one of them revalidate a catalog per
+    ``refresh_interval``.
+
+    The snapshot is only a warm-start cache: if the database is locked,
+    corrupt or can't be written, the error is logged, catalogs are downloaded
+    as if it were empty, and it is bypassed for ``refresh_interval``.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_age: float = 24 * 60 * 60,
+        refresh_interval: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the snapshot.
+
+        Args:
+            path: SQLite database file (defaults to
+                ``$XDG_CACHE_HOME/obot/catalogs.sqlite3``)
+            max_age: Seconds after which a snapshot that could not be
+                revalidated is no longer served
+            refresh_interval: Minimum seconds between revalidations of a
+                catalog across all processes sharing the file
+            clock: Wall clock time source, shared across processes
+        """
+        self.path = path or _default_path()
+        self.max_age = max_age
+        self.refresh_interval = refresh_interval
+        self._clock = clock
+        self._initialized = False
+        self._failed_at: Optional[float] = None
+
+    def _connect(self) -> "sqlite3.Connection":
+        # Imported here so clients without a snapshot don't pay for it
+        import sqlite3
+
+        if not self._initialized:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10.0, isolation_level=None)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    def _safely(self, default: T, func: Callable[..., T], *args: object) -> T:
+        """Run a database operation, returning ``default`` if storage fails."""
+        import sqlite3
+
+        if self._failed_at is not None:
+            if self._clock() - self._failed_at < self.refresh_interval:
+                return default
+            self._failed_at = None
+        try:
+            return func(*args)
+        except (sqlite3.Error, OSError):
+            logger.debug("Catalog snapshot %s unavailable", self.path, exc_info=True)
+            self._failed_at = self._clock()
+            return default
+
+    def load(self, base_url: str, path: str) -> Optional[SnapshotEntry]:
+        """Return the stored response for a catalog, unless missing or too old."""
+        return self._safely(None, self._load, base_url, path)
+
+    def _load(self, base_url: str, path: str) -> Optional[SnapshotEntry]:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT body, etag, updated FROM catalogs"
+                " WHERE base_url = ? AND path = ?",
+                (base_url, path),
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        age = self._clock() - row[2]
+        return SnapshotEntry(row[0], row[1], age) if age <= self.max_age else None
+
+    def store(self, base_url: str, path: str, body: bytes, etag: Optional[str]) -> None:
+        """Store a freshly downloaded catalog response."""
+        self._safely(None, self._store, base_url, path, body, etag)
+
+    def _store(
+        self, base_url: str, path: str, body: bytes, etag: Optional[str]
+    ) -> None:
+        now = self._clock()
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO catalogs"
+                " (base_url, path, body, etag, updated, checked)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (base_url, path, body, etag, now, now),
+            )
+        finally:
+            conn.close()
+
+    def touch(self, base_url: str, path: str) -> None:
+        """Mark a stored catalog as confirmed unchanged by the server."""
+        self._safely(None, self._touch, base_url, path)
+
+    def _touch(self, base_url: str, path: str) -> None:
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE catalogs SET updated = ? WHERE base_url = ? AND path = ?",
+                (self._clock(), base_url, path),
+            )
+        finally:
+            conn.close()
+
+    def claim(self, base_url: str, path: str) -> bool:
+        """
+        Claim the revalidation of a catalog.
+
+        Returns:
+            True for exactly one caller, across processes, per
+            ``refresh_interval``
+        """
+        return self._safely(False, self._claim, base_url, path)
+
+    def _claim(self, base_url: str, path: str) -> bool:
+        now = self._clock()
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                "UPDATE catalogs SET checked = ?"
+                " WHERE base_url = ? AND path = ? AND checked <= ?",
+                (now, base_url, path, now - self.refresh_interval),
+            )
+            return cursor.rowcount == 1
+        finally:
+            conn.close()
+
+    def clear(self) -> None:
+        """Delete every stored catalog."""
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM catalogs")
+        finally:
+            conn.close()
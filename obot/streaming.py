@@ -0,0 +1,219 @@
+"""
+Incremental parsing of streamed ``/api/invoke`` responses into typed events.
+"""
+
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+import json
+
+
+@dataclass
+class StreamEvent:
+    """Base class for events parsed from an invoke stream."""
+
+    raw: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+
+@dataclass
+class ContentEvent(StreamEvent):
+    """A chunk of the agent's reply."""
+
+    content: str = ""
+    content_id: Optional[str] = None
+    run_id: Optional[str] = None
+
+
+@dataclass
+class ToolCallEvent(StreamEvent):
+    """The agent is calling a tool."""
+
+    name: str = ""
+    input: Optional[str] = None
+    run_id: Optional[str] = None
+
+
+@dataclass
+class RunStatusEvent(StreamEvent):
+    """A change in the state of the run ("waiting", "complete" or "error")."""
+
+    status: str = ""
+    run_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class DoneEvent(StreamEvent):
+    """The stream has ended."""
+
+
+def _progress_events(data: Dict[str, Any]) -> List[StreamEvent]:
+    """Convert one decoded progress object into events."""
+    events: List[StreamEvent] = []
+    run_id = data.get("runID")
+
+    if data.get("content") and "contentID" in data:
+        events.append(
+            ContentEvent(
+                raw=data,
+                content=data["content"],
+                content_id=data["contentID"],
+                run_id=run_id,
+            )
+        )
+
+    tool_call = data.get("toolCall")
+    if tool_call:
+        events.append(
+            ToolCallEvent(
+                raw=data,
+                name=tool_call.get("name", ""),
+                input=tool_call.get("input"),
+                run_id=run_id,
+            )
+        )
+
+    if data.get("error"):
+        events.append(
+            RunStatusEvent(raw=data, status="error", run_id=run_id, error=data["error"])
+        )
+    elif data.get("runComplete"):
+        events.append(RunStatusEvent(raw=data, status="complete", run_id=run_id))
+    elif data.get("waitingOnModel"):
+        events.append(RunStatusEvent(raw=data, status="waiting", run_id=run_id))
+
+    return events
+
+
+class InvokeStreamParser:
+    """
+    Frames an invoke stream into events as chunks arrive.
+
+    Both server-sent events (``data:`` lines separated by blank lines) and
+    newline-delimited JSON are understood. Every character is scanned once:
+    only the trailing partial line of a chunk is held back until the next one.
+    """
+
+    def __init__(self, loads: Callable[[str], Any] = json.loads):
+        """
+        Initialize the parser.
+
+        Args:
+            loads: JSON decoder for event payloads
+        """
+        self._loads = loads
+        self._partial: List[str] = []
+        self._data: List[str] = []
+        self._event: Optional[str] = None
+        self._done = False
+
+    def feed(self, chunk: str) -> List[StreamEvent]:
+        """
+        Consume a chunk of the stream.
+
+        Args:
+            chunk: The next piece of decoded response text
+
+        Returns:
+            The events completed by this chunk
+        """
+        events: List[StreamEvent] = []
+        start = 0
+        while True:
+            end = chunk.find("\n", start)
+            if end == -1:
+                if start < len(chunk):
+                    self._partial.append(chunk[start:])
+                return events
+
+            line = chunk[start:end]
+            if self._partial:
+                self._partial.append(line)
+                line = "".join(self._partial)
+                self._partial.clear()
+            start = end + 1
+            self._line(line.rstrip("\r"), events)
+
+    def close(self) -> List[StreamEvent]:
+        """Flush any buffered data and return the final events."""
+        events: List[StreamEvent] = []
+        if self._partial:
+            line = "".join(self._partial)
+            self._partial.clear()
+            self._line(line.rstrip("\r"), events)
+        self._dispatch(events)
+        if not self._done:
+            self._done = True
+            events.append(DoneEvent())
+        return events
+
+    def _line(self, line: str, events: List[StreamEvent]) -> None:
+        if not line:
+            self._dispatch(events)
+        elif line.startswith("data:"):
+            value = line[5:]
+            self._data.append(value[1:] if value.startswith(" ") else value)
+        elif line.startswith("event:"):
+            self._event = line[6:].strip()
+        elif line.startswith(("{", "[")) and not self._data:
+            # Newline-delimited JSON
+            self._decode(line, events)
+        # Comments (":") and "id:"/"retry:" fields carry nothing we need
+
+    def _dispatch(self, events: List[StreamEvent]) -> None:
+        event, self._event = self._event, None
+        if not self._data:
+            if event in ("close", "done") and not self._done:
+                self._done = True
+                events.append(DoneEvent())
+            return
+
+        payload = "\n".join(self._data)
+        self._data.clear()
+        if payload == "[DONE]" or event in ("close", "done"):
+            if not self._done:
+                self._done = True
+                events.append(DoneEvent())
+            return
+        self._decode(payload, events)
+
+    def _decode(self, payload: str, events: List[StreamEvent]) -> None:
+        try:
+            data = self._loads(payload)
+        except ValueError:
+            events.append(ContentEvent(content=payload))
+            return
+
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict):
+                events.extend(_progress_events(item))
+
+
+def parse_stream(
+    chunks: Iterable[str], loads: Callable[[str], Any] = json.loads
+) -> Iterator[StreamEvent]:
+    """Parse an iterable of text chunks into events."""
+    parser = InvokeStreamParser(loads)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aparse_stream(
+    chunks: AsyncIterator[str], loads: Callable[[str], Any] = json.loads
+) -> AsyncIterator[StreamEvent]:
+    """Parse an async iterable of text chunks into events."""
+    parser = InvokeStreamParser(loads)
+    async for chunk in chunks:
+        for event in parser.feed(chunk):
+            yield event
+    for event in parser.close():
+        yield event
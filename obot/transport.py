@@ -0,0 +1,98 @@
+"""
+Construction of the pooled HTTP clients shared by every sub-API of a client.
+"""
+
+from typing import Optional, Union
+import httpx
+from .exceptions import ObotConfigError
+
+Transport = Union[httpx.BaseTransport, httpx.AsyncBaseTransport]
+
+# Keep-alive pool used when the caller does not pass explicit limits.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# With HTTP/2 each connection multiplexes as many concurrent streams as the
+# server allows (SETTINGS_MAX_CONCURRENT_STREAMS, commonly 100-250), and a new
+# connection is only opened once those are in use, so a few connections carry
+# hundreds of concurrent requests.
+HTTP2_LIMITS = httpx.Limits(
+    max_connections=10,
+    max_keepalive_connections=10,
+    keepalive_expiry=30.0,
+)
+
+
+def create_http_client(
+    *,
+    is_async: bool,
+    base_url: Optional[str] = None,
+    timeout: Optional[float] = None,
+    limits: Optional[httpx.Limits] = None,
+    http2: bool = False,
+    uds: Optional[str] = None,
+    transport: Optional[Transport] = None,
+) -> Union[httpx.Client, httpx.AsyncClient]:
+    """
+    Create a long-lived HTTP client backed by a keep-alive connection pool.
+
+    Args:
+        is_async: Whether to create an ``httpx.AsyncClient`` or ``httpx.Client``
+        base_url: URL of the server, used to tell whether HTTP/2 can be
+            negotiated
+        timeout: Default timeout applied to every request
+        limits: Connection pool limits (defaults to ``HTTP2_LIMITS`` when
+            HTTP/2 will be negotiated, else ``DEFAULT_LIMITS``)
+        http2: Negotiate HTTP/2 with https servers so concurrent requests and
+            streams share connections; requires the ``h2`` package. Over
+            http, a Unix socket or a custom transport HTTP/1.1 is used
+        uds: Path of a Unix domain socket to connect through instead of TCP
+        transport: A custom httpx transport, such as ``httpx.ASGITransport``
+            or ``httpx.WSGITransport`` serving an app in-process; it must be
+            an async transport for async clients and a sync one otherwise
+
+    Raises:
+        ObotConfigError: If ``http2`` is requested without ``h2`` installed,
+            or the transport options are inconsistent
+    """
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError as e:
+            raise ObotConfigError(
+                "HTTP/2 requires the h2 package: pip install 'httpx[http2]'"
+            ) from e
+    # HTTP/2 is only negotiated with ALPN over TLS; anything else stays on
+    # HTTP/1.1 and needs a connection per concurrent request
+    multiplexed = (
+        http2
+        and uds is None
+        and transport is None
+        and base_url is not None
+        and base_url.startswith("https://")
+    )
+    limits = limits or (HTTP2_LIMITS if multiplexed else DEFAULT_LIMITS)
+
+    if transport is not None:
+        if uds is not None:
+            raise ObotConfigError("Pass either a transport or a uds path, not both")
+        expected = httpx.AsyncBaseTransport if is_async else httpx.BaseTransport
+        if not isinstance(transport, expected):
+            raise ObotConfigError(
+                f"{'Async' if is_async else 'Sync'} clients need an "
+                f"httpx.{expected.__name__}, got {type(transport).__name__}"
+            )
+    elif uds is not None:
+        transport_class = httpx.AsyncHTTPTransport if is_async else httpx.HTTPTransport
+        transport = transport_class(uds=uds, limits=limits, http2=http2)
+
+    if is_async:
+        return httpx.AsyncClient(
+            timeout=timeout, limits=limits, http2=http2, transport=transport
+        )
+    return httpx.Client(
+        timeout=timeout, limits=limits, http2=http2, transport=transport
+    )
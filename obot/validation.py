@@ -0,0 +1,108 @@
+"""
+Construction of pydantic models from API responses with selectable validation.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Tuple, Type
+from typing import TypeVar, get_args, get_origin
+from .exceptions import ObotConfigError
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel, TypeAdapter
+
+# pydantic is imported on first validation, not when a client is created
+M = TypeVar("M", bound="BaseModel")
+
+# "default" validates with coercion and "strict" validates without coercion
+# to surface server/schema mismatches.
+VALIDATION_MODES = ("default", "strict")
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[M]) -> "TypeAdapter":
+    """Return a TypeAdapter for ``List[model]``, built once per model."""
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(List[model])
+
+
+@lru_cache(maxsize=None)
+def _nested_fields(
+    model: Type["BaseModel"],
+) -> Dict[str, Tuple[Type["BaseModel"], bool]]:
+    """
+    Find the fields of a model that hold other models.
+
+    Returns:
+        A mapping of field name to (nested model, is_list)
+    """
+    from pydantic import BaseModel
+
+    nested = {}
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        for candidate in (annotation, *get_args(annotation)):
+            many = get_origin(candidate) in (list, List)
+            if many:
+                candidate = (get_args(candidate) or (None,))[0]
+            if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+                nested[name] = (candidate, many)
+                break
+    return nested
+
+
+class ModelBuilder:
+    """
+    Builds response models according to a validation mode.
+
+    Lists are validated in one call through a cached ``TypeAdapter``, which
+    runs in pydantic-core and is faster than building models without
+    validation in Python.
+
+    With ``records`` enabled, list results are returned as compact slotted
+    records (see ``obot.records``) built without validation.
+    """
+
+    def __init__(self, mode: str = "default", records: bool = False):
+        """
+        Initialize the builder.
+
+        Args:
+            mode: "default" to validate, or "strict" to validate without type
+                coercion
+            records: Return list results as compact records instead of models
+
+        Raises:
+            ObotConfigError: If the mode is unknown
+        """
+        if mode not in VALIDATION_MODES:
+            raise ObotConfigError(
+                f"Unknown validation mode '{mode}'. "
+                f"Available modes: {', '.join(VALIDATION_MODES)}"
+            )
+        self.mode = mode
+        self.records = records
+
+    def build(self, model: Type[M], data: Dict[str, Any]) -> M:
+        """Build a single model from a raw item."""
+        return model.model_validate(data, strict=self.mode == "strict" or None)
+
+    def build_list(self, model: Type[M], items: Iterable[Dict[str, Any]]) -> List[M]:
+        """Build a list of models (or records) from raw items."""
+        if self.records:
+            from .records import record_type
+
+            from_dict = record_type(model).from_dict
+            return [from_dict(item) for item in items]
+        return _list_adapter(model).validate_python(
+            items if isinstance(items, list) else list(items),
+            strict=self.mode == "strict" or None,
+        )
+
+    def factory(self, model: Type[M]) -> Callable[[Dict[str, Any]], M]:
+        """Return a callable building ``model`` (or its record) from a raw item."""
+        if self.records:
+            from .records import record_type
+
+            return record_type(model).from_dict
+        return lambda data: self.build(model, data)
@@ -0,0 +1,101 @@
+import json
+
+import httpx
+import pytest
+
+from obot import AgentConflictError, AsyncObotClient, ObotClient
+from obot.models import Agent
+
+AGENT = {"id": "a1", "name": "Agent", "description": "Old", "revision": "7"}
+
+
+def agent_server(requests, agent=AGENT, put_status=200):
+    """A server holding one agent and echoing PUT bodies back."""
+
+    def handler(request):
+        requests.append(request)
+        if request.method == "PUT":
+            if put_status != 200:
+                return httpx.Response(put_status, text="stale revision")
+            body = json.loads(request.content)
+            return httpx.Response(200, json=dict(body, revision="8"))
+        return httpx.Response(200, json=agent)
+
+    return handler
+
+
+def client_for(requests, **kwargs):
+    return ObotClient(
+        "http://obot", transport=httpx.MockTransport(agent_server(requests, **kwargs))
+    )
+
+
+def test_update_of_held_agent_is_a_single_put():
+    requests = []
+    client = client_for(requests)
+    agent = Agent.model_validate(AGENT)
+    updated = client.agents.update(agent, description="New")
+    assert [r.method for r in requests] == ["PUT"]
+    assert json.loads(requests[0].content) == dict(AGENT, description="New")
+    assert updated.description == "New"
+    assert updated.revision == "8"
+
+
+def test_update_by_id_reads_then_writes():
+    requests = []
+    client = client_for(requests)
+    client.agents.update("a1", description="New")
+    assert [r.method for r in requests] == ["GET", "PUT"]
+    assert json.loads(requests[1].content)["revision"] == "7"
+
+
+def test_no_op_update_sends_nothing():
+    requests = []
+    client = client_for(requests)
+    agent = Agent.model_validate(AGENT)
+    assert client.agents.update(agent, description="Old") is agent
+    assert requests == []
+
+
+def test_revision_checked_before_writing_by_id():
+    requests = []
+    client = client_for(requests)
+    with pytest.raises(AgentConflictError) as info:
+        client.agents.update("a1", revision="6", description="New")
+    assert info.value.expected_revision == "6"
+    assert info.value.actual_revision == "7"
+    assert [r.method for r in requests] == ["GET"]
+
+
+def test_explicit_revision_overrides_held_one():
+    requests = []
+    client = client_for(requests)
+    client.agents.update(Agent.model_validate(AGENT), revision="9", description="New")
+    assert json.loads(requests[0].content)["revision"] == "9"
+
+
+def test_409_raises_conflict():
+    requests = []
+    client = client_for(requests, put_status=409)
+    with pytest.raises(AgentConflictError) as info:
+        client.agents.update(Agent.model_validate(AGENT), description="New")
+    assert info.value.status_code == 409
+    assert info.value.agent_id == "a1"
+    assert info.value.expected_revision == "7"
+    assert info.value.response_text == "stale revision"
+
+
+@pytest.mark.asyncio
+async def test_async_update_and_conflict():
+    requests = []
+    async with AsyncObotClient(
+        "http://obot",
+        transport=httpx.MockTransport(agent_server(requests, put_status=409)),
+    ) as client:
+        agent = Agent.model_validate(AGENT)
+        assert await client.agents.update(agent, description="Old") is agent
+        with pytest.raises(AgentConflictError):
+            await client.agents.update(agent, description="New")
+        with pytest.raises(AgentConflictError):
+            await client.agents.update("a1", revision="6", description="New")
+    assert [r.method for r in requests] == ["PUT", "GET"]
@@ -0,0 +1,242 @@
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from obot import AsyncObotClient, ObotClient
+from obot.batch import iter_batch, iter_batch_sync, run_batch, run_batch_sync
+from obot.models import Agent
+
+
+def model(model_id, name):
+    return {
+        "id": model_id,
+        "name": name,
+        "type": "model",
+        "created": "2026-01-01T00:00:00Z",
+        "revision": "1",
+        "targetModel": name,
+        "modelProvider": "openai",
+        "active": True,
+        "usage": "llm",
+        "aliasAssigned": False,
+    }
+
+
+MODELS = {"items": [model("m1", "gpt")]}
+TOOLS = {"items": [{"id": "t1", "name": "search", "toolType": "tool"}]}
+
+
+def catalog_server(requests):
+    """A server with one model and one tool that echoes agent writes."""
+
+    def handler(request):
+        requests.append((request.method, request.url.path))
+        if request.url.path == "/api/models":
+            return httpx.Response(200, json=MODELS)
+        if request.url.path == "/api/tool-references":
+            return httpx.Response(200, json=TOOLS)
+        if request.method == "GET":
+            return httpx.Response(200, json={"id": "a1", "name": "Agent"})
+        body = json.loads(request.content)
+        return httpx.Response(200, json=dict(body, id=body.get("id", "new")))
+
+    return handler
+
+
+def slow_square(delays):
+    def func(n):
+        time.sleep(delays.get(n, 0))
+        if n < 0:
+            raise ValueError(n)
+        return n * n
+
+    return func
+
+
+def test_results_in_input_order():
+    results = run_batch_sync(slow_square({1: 0.05}), [1, 2, 3], concurrency=3)
+    assert [(r.index, r.input, r.result) for r in results] == [
+        (0, 1, 1),
+        (1, 2, 4),
+        (2, 3, 9),
+    ]
+    assert all(r.ok and r.elapsed is not None for r in results)
+
+
+def test_errors_are_collected_per_item():
+    results = run_batch_sync(slow_square({}), [1, -1, 2])
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[1].error, ValueError)
+
+
+def test_fail_fast_raises_and_cancels_pending():
+    started = []
+
+    def func(n):
+        started.append(n)
+        if n == 0:
+            raise ValueError(n)
+        time.sleep(0.05)
+        return n
+
+    with pytest.raises(ValueError):
+        run_batch_sync(func, range(20), concurrency=1, fail_fast=True)
+    assert len(started) < 20
+
+
+def test_pre_dispatch_errors_skip_items():
+    calls = []
+    results = run_batch_sync(
+        lambda n: calls.append(n) or n, [1, 2], errors=[None, ValueError("bad")]
+    )
+    assert calls == [1]
+    assert isinstance(results[1].error, ValueError)
+    with pytest.raises(ValueError):
+        run_batch_sync(lambda n: n, [1, 2], errors=[None, ValueError()], fail_fast=True)
+
+
+@pytest.mark.asyncio
+async def test_async_batch_order_errors_and_fail_fast():
+    cancelled = []
+
+    async def func(n):
+        try:
+            await asyncio.sleep(0.01 * (3 - n) if n >= 0 else 0)
+        except asyncio.CancelledError:
+            cancelled.append(n)
+            raise
+        if n < 0:
+            raise ValueError(n)
+        return n
+
+    results = await run_batch(func, [1, -1, 2])
+    assert [r.result for r in results] == [1, None, 2]
+    assert isinstance(results[1].error, ValueError)
+
+    with pytest.raises(ValueError):
+        await run_batch(func, [1, 2, -1], fail_fast=True)
+    assert sorted(cancelled) == [1, 2]
+
+
+class InFlight:
+    """Counts concurrent calls and remembers the peak."""
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def __exit__(self, *exc_info):
+        with self._lock:
+            self.current -= 1
+
+
+def test_iter_batch_sync_order_errors_and_cap():
+    in_flight = InFlight()
+    square = slow_square({0: 0.05, 1: 0.02})
+
+    def func(n):
+        with in_flight:
+            return square(n)
+
+    items = [0, 1, -1, 3, 4, 5]
+    results = list(iter_batch_sync(func, items, concurrency=2))
+    assert [r.input for r in results] == items
+    assert [r.ok for r in results] == [True, True, False, True, True, True]
+    assert isinstance(results[2].error, ValueError)
+    assert all(r.elapsed is not None for r in results)
+    assert results[0].elapsed >= 0.05
+    assert in_flight.peak == 2
+
+
+def test_iter_batch_sync_unordered_yields_as_completed():
+    results = iter_batch_sync(slow_square({0: 0.1}), [0, 1, 2], ordered=False)
+    assert [r.input for r in results][-1] == 0
+
+
+@pytest.mark.asyncio
+async def test_iter_batch_order_errors_and_cap():
+    in_flight = InFlight()
+
+    async def func(n):
+        with in_flight:
+            await asyncio.sleep(0.01 * (5 - n) if n >= 0 else 0)
+        if n < 0:
+            raise ValueError(n)
+        return n
+
+    items = [0, 1, -1, 3, 4, 5]
+    ordered = [r async for r in iter_batch(func, items, concurrency=3)]
+    assert [r.input for r in ordered] == items
+    assert [r.result for r in ordered] == [0, 1, None, 3, 4, 5]
+    assert isinstance(ordered[2].error, ValueError)
+    assert all(r.elapsed is not None for r in ordered)
+    assert in_flight.peak == 3
+
+    unordered = [r async for r in iter_batch(func, [0, 4], ordered=False)]
+    assert [r.input for r in unordered] == [4, 0]
+
+
+def test_create_many_fetches_catalogs_once():
+    requests = []
+    client = ObotClient(
+        "http://obot", transport=httpx.MockTransport(catalog_server(requests))
+    )
+    specs = [
+        {"name": "A", "model": "gpt", "tools": ["t1"]},
+        {"name": "B", "model": "missing"},
+        {"name": "C", "tools": ["t2"]},
+        {"name": "D", "model": "gpt"},
+    ]
+    results = client.agents.create_many(specs)
+    assert [r.ok for r in results] == [True, False, False, True]
+    assert [r.input for r in results] == specs
+    assert results[0].result.model == "m1"
+    assert "missing" in str(results[1].error)
+    assert "t2" in str(results[2].error)
+    assert requests.count(("GET", "/api/models")) == 1
+    assert requests.count(("GET", "/api/tool-references")) == 1
+    assert requests.count(("POST", "/api/agents")) == 2
+
+
+def test_update_many_resolves_once_and_keeps_inputs():
+    requests = []
+    client = ObotClient(
+        "http://obot", transport=httpx.MockTransport(catalog_server(requests))
+    )
+    held = Agent(id="a2", name="Held", revision="3")
+    updates = [("a1", {"model": "gpt"}), (held, {"description": "x", "revision": "3"})]
+    results = client.agents.update_many(updates)
+    assert all(r.ok for r in results)
+    assert [r.input for r in results] == updates
+    assert results[1].result.description == "x"
+    assert requests.count(("GET", "/api/models")) == 1
+    # Only the update by ID reads the agent first
+    assert requests.count(("GET", "/api/agents/a1")) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_create_many_fail_fast():
+    requests = []
+    async with AsyncObotClient(
+        "http://obot", transport=httpx.MockTransport(catalog_server(requests))
+    ) as client:
+        with pytest.raises(ValueError):
+            await client.agents.create_many(
+                [{"name": "A", "model": "gpt"}, {"name": "B", "model": "missing"}],
+                fail_fast=True,
+            )
+        results = await client.agents.update_many([("a1", {"model": "gpt"})])
+    assert results[0].result.model == "m1"
+    # Nothing is created when an item fails to resolve
+    assert ("POST", "/api/agents") not in requests
+    assert requests.count(("GET", "/api/models")) == 1
@@ -0,0 +1,139 @@
+import httpx
+
+from obot import ObotClient
+from obot.api import agents
+from obot.cache import CatalogCache
+
+
+def model(model_id, name, active):
+    return {
+        "id": model_id,
+        "name": name,
+        "type": "model",
+        "created": "2026-01-01T00:00:00Z",
+        "revision": "1",
+        "targetModel": name,
+        "modelProvider": "openai",
+        "active": active,
+        "usage": "llm",
+        "aliasAssigned": False,
+    }
+
+
+MODELS = {"items": [model("m1", "gpt", True), model("m2", "old", False)]}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = Clock()
+    cache = CatalogCache(ttl=10, clock=clock)
+    cache.set("a", 1)
+    clock.now = 9.9
+    assert cache.get("a") == 1
+    clock.now = 10
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = CatalogCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_invalidate_one_or_all():
+    cache = CatalogCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_counters():
+    clock = Clock()
+    cache = CatalogCache(ttl=1, max_entries=1, clock=clock)
+    cache.get("a")
+    cache.set("a", 1)
+    cache.get("a")
+    cache.set("b", 2)
+    clock.now = 1
+    cache.get("b")
+    assert cache.stats() == {"hits": 1, "misses": 2, "evictions": 1, "size": 0}
+
+
+def test_zero_ttl_disables_cache():
+    cache = CatalogCache(ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_derived_values_follow_their_entry():
+    cache = CatalogCache()
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return len(value)
+
+    value = [1, 2]
+    cache.set("a", value)
+    assert cache.derive("a", value, "len", compute) == 2
+    assert cache.derive("a", value, "len", compute) == 2
+    assert len(calls) == 1
+
+    # Storing the same value again keeps what was derived from it
+    cache.set("a", value)
+    cache.derive("a", value, "len", compute)
+    assert len(calls) == 1
+
+    cache.set("a", [1, 2, 3])
+    cache.derive("a", cache.get("a"), "len", compute)
+    assert len(calls) == 2
+    cache.invalidate("a")
+    # A value no longer cached is derived every time
+    cache.derive("a", value, "len", compute)
+    cache.derive("a", value, "len", compute)
+    assert len(calls) == 4
+
+
+def test_model_ids_derived_once_per_catalog(monkeypatch):
+    requests = []
+    derived = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path == "/api/models":
+            return httpx.Response(200, json=MODELS)
+        return httpx.Response(200, json={"id": "a1", "name": "Agent", "model": "m1"})
+
+    original = agents._active_model_ids
+
+    def active_model_ids(resp, builder):
+        derived.append(resp)
+        return original(resp, builder)
+
+    monkeypatch.setattr(agents, "_active_model_ids", active_model_ids)
+    client = ObotClient("http://obot", transport=httpx.MockTransport(handler))
+    for _ in range(3):
+        assert client.agents.create(name="Agent", model="gpt").model == "m1"
+    assert requests.count("/api/models") == 1
+    assert len(derived) == 1
+
+    client.catalog_cache.invalidate("/api/models")
+    client.agents.create(name="Agent", model="gpt")
+    assert len(derived) == 2
@@ -0,0 +1,75 @@
+import threading
+import time
+
+from obot.catalog import ToolCatalog
+
+
+def tool(i, revision="1", category=None, tool_type="tool"):
+    return {
+        "id": f"t{i}",
+        "name": f"tool-{i}",
+        "description": "",
+        "type": "toolreference",
+        "toolType": tool_type,
+        "reference": f"github.com/obot-platform/tools/tool-{i}",
+        "active": True,
+        "resolved": True,
+        "builtin": False,
+        "created": "2024-01-01T00:00:00Z",
+        "revision": revision,
+        "metadata": {"category": category or f"Category {i % 2}"},
+    }
+
+
+def test_lookups():
+    catalog = ToolCatalog([tool(1), tool(2), tool(3, tool_type="modelProvider")])
+    assert len(catalog) == 3 and "t1" in catalog
+    assert catalog.get("t1").name == "tool-1"
+    assert catalog.get("missing") is None
+    assert catalog.by_name("tool-2").id == "t2"
+    assert catalog.id_for_name("tool-3") is None
+    assert catalog.id_for_name("tool-3", "modelProvider") == "t3"
+    assert list(catalog.ids()) == ["t1", "t2"]
+    assert set(catalog.names()) == {"tool-1", "tool-2"}
+    assert catalog.categories() == ["Category 0", "Category 1"]
+    assert [t.id for t in catalog.tools("Category 1")] == ["t1"]
+
+
+def test_refresh_diffs_by_revision():
+    catalog = ToolCatalog([tool(1), tool(2), tool(3)])
+    unchanged = catalog.get("t1")
+    resp = {"items": [tool(1), tool(2, revision="2", category="New"), tool(4)]}
+    assert catalog.refresh(resp) == (1, 1, 1)
+    assert catalog.refresh(resp) == (0, 0, 0)
+    assert catalog.get("t1") is unchanged
+    assert catalog.get("t2").metadata["category"] == "New"
+    assert "t3" not in catalog
+    assert list(catalog.ids()) == ["t1", "t2", "t4"]
+    # An updated tool keeps its place
+    catalog.refresh({"items": [tool(1, revision="2"), tool(2, revision="2"), tool(4)]})
+    assert list(catalog.ids()) == ["t1", "t2", "t4"]
+    assert catalog.categories() == ["Category 0", "Category 1", "New"]
+
+
+def test_views_survive_concurrent_refresh():
+    catalog = ToolCatalog([tool(i) for i in range(200)])
+    stop = threading.Event()
+
+    def refresh():
+        revision = 0
+        while not stop.is_set():
+            revision += 1
+            size = 100 + revision % 100
+            catalog.refresh({"items": [tool(i, str(revision)) for i in range(size)]})
+
+    thread = threading.Thread(target=refresh)
+    thread.start()
+    try:
+        for _ in range(2):
+            for tool_id in catalog.ids():
+                time.sleep(0)
+            for name in catalog.names():
+                time.sleep(0)
+    finally:
+        stop.set()
+        thread.join()
@@ -0,0 +1,246 @@
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from obot import AsyncObotClient, ObotClient
+from obot.api import chat
+from obot.api.chat import _extract_message, _extract_segments, _iter_items
+from obot.codec import JSONCodec
+
+REPLY = {
+    "items": [
+        {"time": "t0", "runID": "r1"},
+        {"content": "Hello", "contentID": "c1"},
+        {"content": ", world", "contentID": "c1"},
+        {"content": "Second", "contentID": "c2"},
+        {"content": "no content ID"},
+    ],
+    "done": True,
+}
+
+
+def invoke_server(body, calls=None):
+    def handler(request):
+        if calls is not None:
+            calls.append(request)
+        return httpx.Response(200, text=body, headers={"X-Obot-Thread-Id": "t1"})
+
+    return handler
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_items_matches_json_loads(indent):
+    body = json.dumps(REPLY, indent=indent)
+    assert list(_iter_items(body)) == REPLY["items"]
+
+
+def test_iter_items_rejects_malformed_documents():
+    for body in ["[]", '{"items": [1 2]}', '{"items": []', "not json"]:
+        with pytest.raises(ValueError):
+            list(_iter_items(body))
+
+
+def test_extract_message_joins_content_in_order():
+    assert _extract_message(json.dumps(REPLY)) == "Hello, worldSecond"
+    assert _extract_message('{"items": []}') == ""
+    assert _extract_message("  plain text reply ") == "plain text reply"
+
+
+def test_large_replies_are_decoded_item_by_item(monkeypatch):
+    def loads(text):
+        raise AssertionError("codec used for a large reply")
+
+    body = json.dumps(REPLY)
+    monkeypatch.setattr(chat, "_STREAM_THRESHOLD", len(body) - 1)
+    assert _extract_message(body, loads) == "Hello, worldSecond"
+    assert _extract_segments(body, loads) == {"c1": "Hello, world", "c2": "Second"}
+
+
+def test_small_replies_use_the_codec():
+    decoded = []
+
+    def loads(text):
+        decoded.append(text)
+        return json.loads(text)
+
+    body = json.dumps(REPLY)
+    assert _extract_message(body, loads) == "Hello, worldSecond"
+    assert decoded == [body]
+    assert _extract_message("[1, 2]", loads) == "[1, 2]"
+
+
+def test_chat_returns_reply_and_thread():
+    calls = []
+    client = ObotClient(
+        "http://obot",
+        transport=httpx.MockTransport(invoke_server(json.dumps(REPLY), calls)),
+    )
+    conv = client.chat("a1", "Hi")
+    assert str(conv) == "Hello, worldSecond"
+    assert conv.thread_id == "t1"
+    assert calls[0].content == b"Hi"
+
+
+def test_segments_group_content_by_id():
+    client = ObotClient(
+        "http://obot", transport=httpx.MockTransport(invoke_server(json.dumps(REPLY)))
+    )
+    assert client.chat.segments("a1", "Hi") == {"c1": "Hello, world", "c2": "Second"}
+
+
+@pytest.mark.asyncio
+async def test_async_segments_group_content_by_id():
+    client = AsyncObotClient(
+        "http://obot", transport=httpx.MockTransport(invoke_server(json.dumps(REPLY)))
+    )
+    segments = await client.chat.segments("a1", "Hi", thread_id="t1")
+    assert list(segments) == ["c1", "c2"]
+    assert segments["c1"] == "Hello, world"
+
+
+def numbered_replies():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        body = json.dumps(
+            {"items": [{"content": f"reply {len(calls)}", "contentID": "c1"}]}
+        )
+        return httpx.Response(
+            200,
+            text=body,
+            headers={"X-Obot-Thread-Id": "t1", "X-Turn": str(len(calls))},
+        )
+
+    return handler, calls
+
+
+def test_conversation_turns_update_response():
+    handler, calls = numbered_replies()
+    client = ObotClient("http://obot", transport=httpx.MockTransport(handler))
+    conv = client.chat("a1", "Hi")
+    assert conv.response.headers["x-turn"] == "1"
+
+    assert conv.chat("Again") == "reply 2"
+    assert conv.last_response == "reply 2"
+    assert conv.response.headers["x-turn"] == "2"
+    assert calls[1].headers["x-obot-thread-id"] == "t1"
+
+    assert "".join(conv.chat("Stream", stream=True))
+    assert conv.response.headers["x-turn"] == "3"
+
+
+@pytest.mark.asyncio
+async def test_async_conversation_turns_update_response():
+    handler, _ = numbered_replies()
+    async with AsyncObotClient(
+        "http://obot", transport=httpx.MockTransport(handler)
+    ) as client:
+        conv = await client.chat("a1", "Hi")
+        assert await conv.achat("Again") == "reply 2"
+        assert conv.response.headers["x-turn"] == "2"
+
+        async for _ in await conv.achat("Stream", stream=True):
+            pass
+        assert conv.response.headers["x-turn"] == "3"
+
+
+def test_chat_decodes_reply_with_client_codec():
+    class CountingCodec(JSONCodec):
+        decoded = 0
+
+        def loads(self, data):
+            CountingCodec.decoded += 1
+            return super().loads(data)
+
+    client = ObotClient(
+        "http://obot",
+        transport=httpx.MockTransport(invoke_server(json.dumps(REPLY))),
+        json_codec=CountingCodec(),
+    )
+    assert client.chat("a1", "Hi", return_conversation=False) == "Hello, worldSecond"
+    assert client.chat.segments("a1", "Hi") == {"c1": "Hello, world", "c2": "Second"}
+    assert CountingCodec.decoded == 2
+
+
+def echo_server(delays, in_flight):
+    """Replies with the message after a per-message delay, failing agent "bad"."""
+    lock = threading.Lock()
+
+    def reply(request):
+        if request.url.path.endswith("/bad"):
+            return httpx.Response(400, text="bad agent")
+        body = {"items": [{"content": request.content.decode(), "contentID": "c1"}]}
+        return httpx.Response(200, json=body, headers={"X-Obot-Thread-Id": "t1"})
+
+    def enter():
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+
+    def leave():
+        with lock:
+            in_flight[0] -= 1
+
+    def handler(request):
+        enter()
+        time.sleep(delays.get(request.content.decode(), 0))
+        leave()
+        return reply(request)
+
+    async def ahandler(request):
+        enter()
+        await asyncio.sleep(delays.get(request.content.decode(), 0))
+        leave()
+        return reply(request)
+
+    return handler, ahandler
+
+
+MAP_REQUESTS = [
+    ("a1", "slow"),
+    {"agent_id": "a1", "message": "one", "thread_id": "t1"},
+    ("bad", "two"),
+    ("a1", "three"),
+]
+
+
+def test_map_isolates_failures_and_caps_concurrency():
+    in_flight = [0, 0]
+    handler, _ = echo_server({"slow": 0.1, "one": 0.02, "three": 0.02}, in_flight)
+    client = ObotClient("http://obot", transport=httpx.MockTransport(handler))
+    results = list(client.chat.map(MAP_REQUESTS, concurrency=2))
+    assert [r.result for r in results] == ["slow", "one", None, "three"]
+    assert results[2].error is not None
+    assert all(r.elapsed is not None for r in results)
+    assert in_flight[1] == 2
+
+    unordered = client.chat.map(MAP_REQUESTS, concurrency=4, ordered=False)
+    assert [r.result for r in unordered][-1] == "slow"
+
+
+@pytest.mark.asyncio
+async def test_async_map_isolates_failures_and_caps_concurrency():
+    in_flight = [0, 0]
+    _, handler = echo_server({"slow": 0.1, "one": 0.02, "three": 0.02}, in_flight)
+    async with AsyncObotClient(
+        "http://obot", transport=httpx.MockTransport(handler)
+    ) as client:
+        results = [r async for r in client.chat.map(MAP_REQUESTS, concurrency=2)]
+        assert in_flight[1] == 2
+        unordered = [
+            r async for r in client.chat.map(MAP_REQUESTS, concurrency=4, ordered=False)
+        ]
+        conversations = [
+            r.result
+            async for r in client.chat.map(MAP_REQUESTS[:1], return_conversation=True)
+        ]
+    assert [r.result for r in results] == ["slow", "one", None, "three"]
+    assert results[2].error is not None
+    assert all(r.elapsed is not None for r in results)
+    assert unordered[-1].result == "slow"
+    assert conversations[0].thread_id == "t1"
@@ -0,0 +1,148 @@
+import httpx
+import pytest
+
+from obot import AsyncObotClient, CircuitOpenError, ObotAPIError, ObotClient
+from obot.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakers
+
+AGENT = {"id": "a1", "name": "Agent"}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def breaker(**kwargs):
+    clock = Clock()
+    changes = []
+    b = CircuitBreaker(
+        "crud",
+        clock=clock,
+        on_state_change=lambda *change: changes.append(change[1:]),
+        **kwargs,
+    )
+    return b, clock, changes
+
+
+def test_opens_after_consecutive_failures():
+    b, _, changes = breaker(failure_threshold=3)
+    for _ in range(2):
+        b.acquire()
+        b.record_failure()
+    b.acquire()
+    b.record_success()
+    for _ in range(2):
+        b.acquire()
+        b.record_failure()
+    # A success reset the count
+    assert b.state == CLOSED
+    b.acquire()
+    b.record_failure()
+    assert b.state == OPEN
+    assert changes == [(CLOSED, OPEN)]
+
+
+def test_open_circuit_fails_fast_until_recovery():
+    b, clock, _ = breaker(failure_threshold=1, recovery_timeout=10)
+    b.acquire()
+    b.record_failure()
+    clock.now = 4
+    with pytest.raises(CircuitOpenError) as info:
+        b.acquire()
+    assert info.value.retry_after == pytest.approx(6)
+    assert info.value.status_code == 503
+    clock.now = 10
+    assert b.state == HALF_OPEN
+
+
+def test_half_open_trial_closes_or_reopens():
+    b, clock, changes = breaker(failure_threshold=1, recovery_timeout=10)
+    b.acquire()
+    b.record_failure()
+
+    clock.now = 10
+    b.acquire()
+    # Only one trial call at a time
+    with pytest.raises(CircuitOpenError):
+        b.acquire()
+    b.record_failure()
+    assert b.state == OPEN
+
+    clock.now = 20
+    b.acquire()
+    b.record_success()
+    assert b.state == CLOSED
+    assert changes == [
+        (CLOSED, OPEN),
+        (OPEN, HALF_OPEN),
+        (HALF_OPEN, OPEN),
+        (OPEN, HALF_OPEN),
+        (HALF_OPEN, CLOSED),
+    ]
+
+
+def test_release_frees_a_trial_slot():
+    b, clock, _ = breaker(
+        failure_threshold=1, recovery_timeout=1, half_open_max_calls=2
+    )
+    b.acquire()
+    b.record_failure()
+    clock.now = 1
+    b.acquire()
+    b.acquire()
+    with pytest.raises(CircuitOpenError):
+        b.acquire()
+    b.release()
+    b.acquire()
+
+
+def test_breakers_are_per_group():
+    custom = CircuitBreaker("invoke", failure_threshold=1)
+    breakers = CircuitBreakers(failure_threshold=2, breakers={"invoke": custom})
+    assert breakers["invoke"] is custom
+    assert breakers["crud"] is breakers["crud"]
+    assert breakers["crud"].failure_threshold == 2
+    custom.record_failure()
+    assert breakers.states() == {"invoke": OPEN, "catalog": CLOSED, "crud": CLOSED}
+
+
+def test_client_stops_sending_while_open():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(500)
+
+    breakers = CircuitBreakers(failure_threshold=2, recovery_timeout=60)
+    client = ObotClient(
+        "http://obot",
+        transport=httpx.MockTransport(handler),
+        retry=False,
+        circuit_breaker=breakers,
+    )
+    for _ in range(2):
+        with pytest.raises(ObotAPIError):
+            client.agents.get("a1")
+    with pytest.raises(CircuitOpenError):
+        client.agents.get("a1")
+    assert len(calls) == 2
+    assert breakers.states()["crud"] == OPEN
+    # Other endpoint groups are unaffected
+    assert breakers.states()["invoke"] == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_async_client_errors_keep_circuit_closed():
+    breakers = CircuitBreakers(failure_threshold=1)
+    async with AsyncObotClient(
+        "http://obot",
+        transport=httpx.MockTransport(lambda request: httpx.Response(404)),
+        circuit_breaker=breakers,
+    ) as client:
+        for _ in range(3):
+            with pytest.raises(ObotAPIError):
+                await client.agents.get("a1")
+    assert breakers.states()["crud"] == CLOSED
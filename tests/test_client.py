@@ -0,0 +1,76 @@
+import httpx
+import pytest
+
+from obot import AsyncObotClient, ObotClient
+from obot.api.agents import SyncAgentsAPI
+
+AGENT = {"id": "a1", "name": "Agent"}
+
+
+def agent_server(requests):
+    def handler(request):
+        requests.append(request)
+        if request.url.path == "/api/tool-references":
+            return httpx.Response(200, json={"items": []})
+        return httpx.Response(200, json=AGENT)
+
+    return handler
+
+
+def test_sub_apis_share_one_pool():
+    requests = []
+    client = ObotClient(
+        "http://obot", transport=httpx.MockTransport(agent_server(requests))
+    )
+    pool = client._http
+    assert client.agents._http() is pool
+    assert client.tools._http() is pool
+    assert client.agents is client.agents
+
+    client.agents.get("a1")
+    client.tools()
+    assert len(requests) == 2
+    # No sub-API created a pool of its own
+    assert client.agents._own_http is None
+    assert client.tools._own_http is None
+
+
+def test_close_releases_the_shared_pool():
+    with ObotClient(
+        "http://obot", transport=httpx.MockTransport(agent_server([]))
+    ) as client:
+        client.agents.get("a1")
+        pool = client._http
+        assert not pool.is_closed
+    assert pool.is_closed
+
+
+def test_standalone_api_owns_its_pool():
+    api = SyncAgentsAPI("http://obot")
+    pool = api._http()
+    assert api._http() is pool
+    api.close_sync()
+    assert pool.is_closed
+    assert api._own_http is None
+
+
+def test_sub_api_close_leaves_the_shared_pool_open():
+    client = ObotClient("http://obot", transport=httpx.MockTransport(agent_server([])))
+    client.agents.close_sync()
+    assert not client._http.is_closed
+    assert client.agents.get("a1").id == "a1"
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_and_closes_its_pool():
+    requests = []
+    async with AsyncObotClient(
+        "http://obot", transport=httpx.MockTransport(agent_server(requests))
+    ) as client:
+        pool = client._http
+        assert client.agents._http() is pool
+        assert client.workflows._http() is pool
+        await client.agents.get("a1")
+    assert pool.is_closed
+    assert len(requests) == 1
@@ -0,0 +1,106 @@
+import json
+import sys
+
+import httpx
+import pytest
+
+from obot import AsyncObotClient, ObotClient, ObotConfigError
+from obot.codec import CODECS, JSONCodec, MsgspecCodec, OrjsonCodec, get_codec
+
+AGENT = {"id": "a1", "name": "Agent", "description": "Ünïcode ✓"}
+
+
+def installed_codecs():
+    names = []
+    for name, factory in CODECS.items():
+        try:
+            factory()
+        except ObotConfigError:
+            continue
+        names.append(name)
+    return names
+
+
+def test_resolution():
+    codec = JSONCodec()
+    assert get_codec(codec) is codec
+    assert type(get_codec(None)) is JSONCodec
+    assert get_codec("json").name == "json"
+    installed = installed_codecs()
+    expected = next(name for name in ("orjson", "msgspec", "json") if name in installed)
+    assert get_codec("auto").name == expected
+
+
+def test_auto_prefers_fastest_installed(monkeypatch):
+    def missing():
+        raise ObotConfigError("not installed")
+
+    monkeypatch.setitem(CODECS, "orjson", missing)
+    monkeypatch.setitem(CODECS, "msgspec", missing)
+    assert get_codec("auto").name == "json"
+
+
+def test_unknown_codec():
+    with pytest.raises(ObotConfigError, match="Unknown JSON codec 'yaml'"):
+        get_codec("yaml")
+
+
+@pytest.mark.parametrize("name", installed_codecs())
+def test_round_trip(name):
+    codec = get_codec(name)
+    encoded = codec.dumps(AGENT)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == AGENT
+    assert codec.loads(encoded) == AGENT
+    assert codec.loads(encoded.decode()) == AGENT
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+@pytest.mark.parametrize("codec", [OrjsonCodec, MsgspecCodec])
+def test_missing_backend_is_a_config_error(codec, monkeypatch):
+    monkeypatch.setitem(sys.modules, codec.name, None)
+    with pytest.raises(ObotConfigError, match=codec.name):
+        codec()
+
+
+@pytest.mark.parametrize("name", installed_codecs())
+def test_client_encodes_and_decodes_with_codec(name):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=request.content or json.dumps(AGENT))
+
+    client = ObotClient(
+        "http://obot", transport=httpx.MockTransport(handler), json_codec=name
+    )
+    assert client.json_codec.name == name
+    agent = client.agents.create(name="Agent", description="Ünïcode ✓")
+    assert agent.description == "Ünïcode ✓"
+    assert requests[0].headers["content-type"] == "application/json"
+    assert json.loads(requests[0].content) == {
+        "name": "Agent",
+        "description": "Ünïcode ✓",
+    }
+    assert client.agents.get("a1") == agent.model_copy(update={"id": "a1"})
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_codec_instance():
+    class CountingCodec(JSONCodec):
+        def __init__(self):
+            self.calls = 0
+
+        def loads(self, data):
+            self.calls += 1
+            return super().loads(data)
+
+    codec = CountingCodec()
+    async with AsyncObotClient(
+        "http://obot",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=AGENT)),
+        json_codec=codec,
+    ) as client:
+        await client.agents.get("a1")
+    assert codec.calls == 1
@@ -0,0 +1,162 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from obot import AsyncObotClient, DeadlineExceededError, ObotClient, deadline, remaining
+from obot.batch import run_batch_sync
+
+AGENT = {"id": "a1", "name": "Agent"}
+
+
+def slow_handler(delay, calls):
+    """A server taking ``delay`` seconds, honoring the request's read timeout."""
+
+    def handler(request):
+        calls.append(request.url.path)
+        read = request.extensions["timeout"].get("read")
+        if read is not None and read < delay:
+            time.sleep(read)
+            raise httpx.ReadTimeout("timed out", request=request)
+        time.sleep(delay)
+        return httpx.Response(200, json=AGENT)
+
+    return handler
+
+
+def async_slow_handler(delay, calls):
+    async def handler(request):
+        calls.append(request.url.path)
+        read = request.extensions["timeout"].get("read")
+        if read is not None and read < delay:
+            await asyncio.sleep(read)
+            raise httpx.ReadTimeout("timed out", request=request)
+        await asyncio.sleep(delay)
+        return httpx.Response(200, json=AGENT)
+
+    return handler
+
+
+def test_deadline_bounds_slow_request():
+    client = ObotClient(
+        "http://obot", timeout=30, transport=httpx.MockTransport(slow_handler(1, []))
+    )
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError) as info:
+        with deadline(0.1):
+            client.agents.get("a1")
+    assert time.monotonic() - started < 0.5
+    assert info.value.budget == 0.1
+    assert isinstance(info.value, TimeoutError)
+
+
+def test_no_retry_past_deadline():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503, headers={"Retry-After": "1"})
+
+    client = ObotClient("http://obot", transport=httpx.MockTransport(handler))
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        with deadline(0.2):
+            client.agents.get("a1")
+    assert time.monotonic() - started < 0.25
+    assert len(calls) < client.retry_policy.max_attempts
+
+
+def test_nested_deadline_only_shortens():
+    assert remaining() is None
+    with deadline(5):
+        with deadline(0.5):
+            assert remaining() <= 0.5
+        with deadline(60):
+            assert remaining() <= 5
+        assert remaining() > 4
+    assert remaining() is None
+
+
+def test_deadline_follows_batch_workers():
+    calls = []
+    client = ObotClient(
+        "http://obot", timeout=30, transport=httpx.MockTransport(slow_handler(1, calls))
+    )
+    with deadline(0.1):
+        results = run_batch_sync(client.agents.get, ["a1", "a2", "a3"])
+    assert all(isinstance(r.error, DeadlineExceededError) for r in results)
+
+
+def test_coalesced_caller_keeps_its_own_deadline():
+    calls = []
+    client = ObotClient(
+        "http://obot",
+        timeout=30,
+        transport=httpx.MockTransport(slow_handler(0.3, calls)),
+    )
+    errors = []
+
+    def leader():
+        try:
+            with deadline(0.1):
+                client.agents.get("a1")
+        except DeadlineExceededError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=leader)
+    thread.start()
+    time.sleep(0.02)
+    # Not coalesced with the leader, so the leader's deadline doesn't apply
+    assert client.agents.get("a1").id == "a1"
+    thread.join()
+    assert len(errors) == 1
+    assert len(calls) >= 2
+
+
+def test_callers_under_one_deadline_share_a_request():
+    calls = []
+    client = ObotClient(
+        "http://obot", transport=httpx.MockTransport(slow_handler(0.2, calls))
+    )
+    with deadline(5):
+        results = run_batch_sync(client.agents.get, ["a1", "a1"])
+    assert [r.result.id for r in results] == ["a1", "a1"]
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_deadline_bounds_slow_request():
+    client = AsyncObotClient(
+        "http://obot",
+        timeout=30,
+        transport=httpx.MockTransport(async_slow_handler(1, [])),
+    )
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        with deadline(0.1):
+            await client.agents.get("a1")
+    assert time.monotonic() - started < 0.5
+
+
+@pytest.mark.asyncio
+async def test_async_coalesced_caller_keeps_its_own_deadline():
+    calls = []
+    client = AsyncObotClient(
+        "http://obot",
+        timeout=30,
+        transport=httpx.MockTransport(async_slow_handler(0.3, calls)),
+    )
+
+    async def leader():
+        with deadline(0.1):
+            return await client.agents.get("a1")
+
+    async def follower():
+        await asyncio.sleep(0.02)
+        return await client.agents.get("a1")
+
+    led, followed = await asyncio.gather(leader(), follower(), return_exceptions=True)
+    assert isinstance(led, DeadlineExceededError)
+    assert followed.id == "a1"
@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from obot import ObotClient
+from obot.hedge import HedgePolicy
+
+
+def slow_then_fast():
+    """A call that is slow the first time and fast afterwards."""
+    calls = []
+
+    def func():
+        calls.append(threading.current_thread())
+        time.sleep(0.3 if len(calls) == 1 else 0.0)
+        return len(calls)
+
+    return func, calls
+
+
+def test_percentile_delay_needs_samples():
+    policy = HedgePolicy(percentile=50, min_samples=4, min_delay=0)
+    assert policy.hedge_delay("crud") is None
+    for latency in (0.1, 0.2, 0.3, 0.4):
+        policy.record("crud", latency)
+    assert policy.hedge_delay("crud") == 0.3
+    assert HedgePolicy(delay=0.001, min_delay=0.01).hedge_delay("crud") == 0.01
+
+
+def test_slow_call_is_hedged():
+    func, calls = slow_then_fast()
+    policy = HedgePolicy(delay=0.02)
+    started = time.perf_counter()
+    assert policy.run_sync("crud", func) == 2
+    assert time.perf_counter() - started < 0.2
+    assert policy.stats() == {"requests": 1, "hedged": 1}
+    policy.close()
+
+
+def test_call_runs_inline_without_a_hedge():
+    func, calls = slow_then_fast()
+    assert HedgePolicy().run_sync("crud", func) == 1
+    assert calls == [threading.current_thread()]
+
+    func, calls = slow_then_fast()
+    policy = HedgePolicy(delay=0.02, burst=0)
+    assert policy.run_sync("crud", func) == 1
+    assert calls == [threading.current_thread()]
+    assert policy._executor is None
+
+
+def test_close_while_queued_runs_inline():
+    policy = HedgePolicy(delay=0.01, max_workers=1)
+    release = threading.Event()
+    policy._threads().submit(release.wait)
+    results = []
+    caller = threading.Thread(
+        target=lambda: results.append(
+            policy.run_sync("crud", threading.current_thread)
+        ),
+        daemon=True,
+    )
+    caller.start()
+    time.sleep(0.05)
+    # The first call is still queued behind the blocked worker
+    assert not results
+    policy.close()
+    caller.join(1)
+    release.set()
+    assert results == [caller]
+
+
+def test_closed_executor_runs_inline(monkeypatch):
+    policy = HedgePolicy(delay=0.01)
+    executor = policy._threads()
+    policy.close()
+    # A request that looked up the executor just before close()
+    monkeypatch.setattr(policy, "_threads", lambda: executor)
+    assert policy.run_sync("crud", threading.current_thread) is (
+        threading.current_thread()
+    )
+
+
+def test_cancelled_hedge_waits_for_first_call():
+    policy = HedgePolicy(delay=0.01, max_workers=1)
+    func, calls = slow_then_fast()
+    started = time.perf_counter()
+    closer = threading.Timer(0.1, policy.close)
+    closer.start()
+    # The hedge queues behind the slow first call until close() cancels it
+    assert policy.run_sync("crud", func) == 1
+    assert time.perf_counter() - started >= 0.3
+    assert len(calls) == 1
+    closer.join()
+
+
+def test_budget_limits_hedges():
+    policy = HedgePolicy(delay=0.01, burst=1, max_ratio=0)
+    for _ in range(3):
+        func, _ = slow_then_fast()
+        policy.run_sync("crud", func)
+    assert policy.stats() == {"requests": 3, "hedged": 1}
+    policy.close()
+
+
+def test_client_close_shuts_down_threads():
+    policy = HedgePolicy(delay=0.01)
+
+    def handler(request):
+        time.sleep(0.05)
+        return httpx.Response(200, json={"id": "a1", "name": "Agent"})
+
+    client = ObotClient(
+        "http://obot", transport=httpx.MockTransport(handler), hedge=policy
+    )
+    assert client.agents.get("a1").id == "a1"
+    executor = policy._executor
+    assert executor is not None
+    client.close()
+    assert policy._executor is None
+    assert executor._shutdown
+
+
+@pytest.mark.asyncio
+async def test_async_slow_call_is_hedged():
+    calls = []
+
+    async def func():
+        calls.append(None)
+        await asyncio.sleep(0.3 if len(calls) == 1 else 0.0)
+        return len(calls)
+
+    policy = HedgePolicy(delay=0.02)
+    started = time.perf_counter()
+    assert await policy.run("crud", func) == 2
+    assert time.perf_counter() - started < 0.2
+    assert policy.stats()["hedged"] == 1
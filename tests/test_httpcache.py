@@ -0,0 +1,119 @@
+import httpx
+import pytest
+
+from obot import AsyncObotClient, ObotClient
+from obot.httpcache import CachedResponse, ResponseCache
+
+AGENT = {"id": "a1", "name": "Agent"}
+
+
+def etag_server(requests, etag='"v1"', body=AGENT, headers=None):
+    """A server answering 304 when the client already holds ``etag``."""
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json=body, headers={"ETag": etag, **(headers or {})})
+
+    return handler
+
+
+def test_not_modified_is_served_from_cache():
+    requests = []
+    cache = ResponseCache()
+    client = ObotClient(
+        "http://obot",
+        transport=httpx.MockTransport(etag_server(requests)),
+        response_cache=cache,
+    )
+    first = client.agents.get("a1")
+    second = client.agents.get("a1")
+    assert "if-none-match" not in requests[0].headers
+    assert requests[1].headers["if-none-match"] == '"v1"'
+    assert second == first
+    # Callers get their own copies of the cached model
+    second.name = "changed"
+    assert client.agents.get("a1").name == "Agent"
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_changed_resource_replaces_entry():
+    requests = []
+    etags = iter(['"v1"', '"v2"'])
+
+    def handler(request):
+        requests.append(request)
+        etag = next(etags)
+        return httpx.Response(200, json=dict(AGENT, name=etag), headers={"ETag": etag})
+
+    client = ObotClient("http://obot", transport=httpx.MockTransport(handler))
+    assert client.agents.get("a1").name == '"v1"'
+    assert client.agents.get("a1").name == '"v2"'
+    assert requests[1].headers["if-none-match"] == '"v1"'
+
+
+def test_last_modified_is_revalidated():
+    requests = []
+    stamp = "Wed, 21 Oct 2026 07:28:00 GMT"
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("if-modified-since") == stamp:
+            return httpx.Response(304)
+        return httpx.Response(200, json=AGENT, headers={"Last-Modified": stamp})
+
+    client = ObotClient("http://obot", transport=httpx.MockTransport(handler))
+    client.agents.get("a1")
+    assert client.agents.get("a1").id == "a1"
+    assert requests[1].headers["if-modified-since"] == stamp
+
+
+def test_no_store_is_not_cached():
+    requests = []
+    cache = ResponseCache()
+    no_store = {"Cache-Control": "no-store"}
+    client = ObotClient(
+        "http://obot",
+        transport=httpx.MockTransport(etag_server(requests, headers=no_store)),
+        response_cache=cache,
+    )
+    client.agents.get("a1")
+    client.agents.get("a1")
+    assert "if-none-match" not in requests[1].headers
+    assert len(cache) == 0
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = ResponseCache(max_entries=2, max_bytes=100)
+    for key in "abc":
+        cache.put(key, CachedResponse('"x"', None, key, 10))
+    assert cache.get("a") is None
+    assert cache.get("b").value == "b"
+    # "b" was used last, so "c" goes first
+    cache.put("d", CachedResponse('"x"', None, "d", 10))
+    assert cache.get("c") is None
+    assert not cache.put("big", CachedResponse('"x"', None, "big", 101))
+    cache.put("e", CachedResponse('"x"', None, "e", 95))
+    assert len(cache) == 1
+    assert cache.stats()["bytes"] == 95
+    assert cache.stats()["evictions"] == 4
+
+
+def test_disabled_cache_stores_nothing():
+    cache = ResponseCache(max_entries=0)
+    assert not cache.put("a", CachedResponse('"x"', None, "a", 1))
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_client_revalidates():
+    requests = []
+    async with AsyncObotClient(
+        "http://obot", transport=httpx.MockTransport(etag_server(requests))
+    ) as client:
+        await client.agents.get("a1")
+        agent = await client.agents.get("a1")
+    assert agent.id == "a1"
+    assert requests[1].headers["if-none-match"] == '"v1"'
@@ -0,0 +1,46 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that importing obot and creating clients must not load
+LAZY_MODULES = {
+    "pydantic",
+    "obot.catalog",
+    "obot.models.agent",
+    "obot.models.tool",
+    "obot.api.agents",
+    "obot.api.threads",
+}
+
+
+def loaded_modules(code):
+    """Run ``code`` in a fresh interpreter and return the modules it loaded."""
+    script = f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(json.loads(proc.stdout))
+
+
+def test_import_loads_no_client_modules():
+    modules = loaded_modules("import obot")
+    assert {m for m in modules if m.startswith("obot.")} == {"obot.lazy"}
+    assert "httpx" not in modules
+    assert "pydantic" not in modules
+
+
+def test_clients_load_models_on_first_use():
+    modules = loaded_modules(
+        "import obot\n"
+        "obot.ObotClient('http://obot').chat\n"
+        "obot.AsyncObotClient('http://obot').chat"
+    )
+    assert "obot.api.chat" in modules
+    assert not LAZY_MODULES & modules
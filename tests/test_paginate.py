@@ -0,0 +1,121 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from obot import AsyncObotClient, ObotClient
+from obot.api.base import PaginatedResponse
+
+PAGES = {
+    None: {"items": [{"id": "1"}, {"id": "2"}], "continue": "p2"},
+    "p2": {"items": [{"id": "3"}], "metadata": {"continue": "p3"}},
+    "p3": [{"id": "4"}, {"id": "5"}],
+}
+
+
+def page_server(requests, pages=PAGES):
+    def handler(request):
+        token = request.url.params.get("continue")
+        requests.append((token, request.url.params.get("limit")))
+        return httpx.Response(200, json=pages[token])
+
+    return handler
+
+
+def ids(items):
+    return [item["id"] for item in items]
+
+
+def test_continue_token_locations():
+    assert PaginatedResponse({"continue": "a"}).continue_token == "a"
+    assert PaginatedResponse({"metadata": {"continue": "b"}}).continue_token == "b"
+    assert PaginatedResponse({"items": [], "metadata": None}).continue_token is None
+    assert PaginatedResponse({"continue": ""}).continue_token is None
+
+
+def test_bare_array_pages():
+    page = PaginatedResponse.from_response([{"id": "1"}])
+    assert page.items == [{"id": "1"}]
+    assert page.continue_token is None
+    assert PaginatedResponse.from_response(None).items == []
+
+
+def test_paginate_sync_follows_tokens():
+    requests = []
+    client = ObotClient(
+        "http://obot", transport=httpx.MockTransport(page_server(requests))
+    )
+    items = client.agents.paginate_sync("/api/things", dict, page_size=2)
+    assert ids(items) == ["1", "2", "3", "4", "5"]
+    assert requests == [(None, "2"), ("p2", "2"), ("p3", "2")]
+
+
+def test_paginate_sync_filters_before_building():
+    built = []
+
+    def factory(item):
+        built.append(item)
+        return item["id"]
+
+    client = ObotClient("http://obot", transport=httpx.MockTransport(page_server([])))
+    items = client.agents.paginate_sync(
+        "/api/things", factory, where=lambda item: item["id"] in ("2", "5")
+    )
+    assert list(items) == ["2", "5"]
+    assert ids(built) == ["2", "5"]
+
+
+def test_paginate_sync_prefetches_next_page():
+    requested = threading.Event()
+    requests = []
+    serve = page_server(requests)
+
+    def handler(request):
+        if request.url.params.get("continue") == "p2":
+            requested.set()
+        return serve(request)
+
+    client = ObotClient("http://obot", transport=httpx.MockTransport(handler))
+    items = client.agents.paginate_sync("/api/things", dict)
+    assert next(items)["id"] == "1"
+    # The second page is requested while the first is still being consumed
+    assert requested.wait(1)
+    items.close()
+
+
+@pytest.mark.asyncio
+async def test_paginate_follows_tokens():
+    requests = []
+    async with AsyncObotClient(
+        "http://obot", transport=httpx.MockTransport(page_server(requests))
+    ) as client:
+        items = [item async for item in client.agents.paginate("/api/things", dict)]
+    assert ids(items) == ["1", "2", "3", "4", "5"]
+    assert [token for token, _ in requests] == [None, "p2", "p3"]
+
+
+@pytest.mark.asyncio
+async def test_early_close_cancels_prefetch():
+    requested = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def handler(request):
+        if request.url.params.get("continue") != "p2":
+            return httpx.Response(200, json=PAGES[None])
+        requested.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return httpx.Response(200, json=PAGES["p2"])
+
+    async with AsyncObotClient(
+        "http://obot", transport=httpx.MockTransport(handler)
+    ) as client:
+        items = client.agents.paginate("/api/things", dict)
+        assert (await items.__anext__())["id"] == "1"
+        await asyncio.wait_for(requested.wait(), 1)
+        await items.aclose()
+        await asyncio.wait_for(cancelled.wait(), 1)
@@ -0,0 +1,206 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from obot import AsyncObotClient, ObotAPIError, ObotClient
+from obot.ratelimit import AdaptiveLimit, Limit, RateLimiter, TokenBucket
+
+AGENT = {"id": "a1", "name": "A"}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_reserves_ahead_and_refills():
+    clock = Clock()
+    bucket = TokenBucket(rate=10, burst=2, clock=clock)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+    clock.now = 0.3
+    assert bucket.reserve() == pytest.approx(0.0)
+
+
+def test_refund_returns_token():
+    clock = Clock()
+    bucket = TokenBucket(rate=1, burst=1, clock=clock)
+    bucket.reserve()
+    bucket.refund()
+    assert bucket.reserve() == 0.0
+    bucket.refund()
+    bucket.refund()
+    # Refunds never overfill the bucket
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_sync_timeout_refunds_token():
+    limiter = RateLimiter(rate=1, burst=1)
+    limiter.acquire_sync("crud")
+    limiter.release("crud", is_async=False)
+    for _ in range(5):
+        with pytest.raises(TimeoutError):
+            limiter.acquire_sync("crud", timeout=0.01)
+    # Abandoned waits didn't push the next token further out
+    assert limiter._client.bucket.reserve() <= 1.0
+
+
+@pytest.mark.asyncio
+async def test_async_timeout_refunds_token():
+    limiter = RateLimiter(rate=2, burst=1)
+    await limiter.acquire("crud")
+    limiter.release("crud", is_async=True)
+    for _ in range(5):
+        with pytest.raises(TimeoutError):
+            await limiter.acquire("crud", timeout=0.01)
+    assert limiter._client.bucket.reserve() <= 0.5
+
+
+def test_sync_timeout_releases_slot():
+    limiter = RateLimiter(max_concurrency=1)
+    limiter.acquire_sync("crud")
+    with pytest.raises(TimeoutError):
+        limiter.acquire_sync("crud", timeout=0.01)
+    limiter.release("crud", is_async=False)
+    limiter.acquire_sync("crud", timeout=0.01)
+
+
+def test_limiter_shared_across_event_loops():
+    limiter = RateLimiter(max_concurrency=2, groups={"crud": Limit(max_concurrency=1)})
+
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": "a1", "name": "A"})
+
+    transport = httpx.MockTransport(handler)
+
+    async def main():
+        async with AsyncObotClient(
+            "http://obot", transport=transport, rate_limit=limiter
+        ) as client:
+            await asyncio.gather(*(client.agents.get(f"a{i}") for i in range(4)))
+
+    asyncio.run(main())
+    asyncio.run(main())
+    assert limiter.stats()["crud"]["requests"] == 8
+    assert limiter.stats()["crud"]["in_flight"] == 0
+
+
+def test_cap_is_shared_by_threads_and_tasks():
+    limiter = RateLimiter(max_concurrency=1)
+    limiter.acquire_sync("crud")
+    acquired = threading.Event()
+
+    async def waiter():
+        await limiter.acquire("crud")
+        acquired.set()
+        limiter.release("crud", is_async=True)
+
+    thread = threading.Thread(target=asyncio.run, args=(waiter(),))
+    thread.start()
+    assert not acquired.wait(0.05)
+    limiter.release("crud", is_async=False)
+    assert acquired.wait(1)
+    thread.join()
+
+
+def test_aimd_increases_only_while_in_use():
+    limit = AdaptiveLimit(initial=4, max_limit=6)
+    limit.record(0.1, overloaded=False)
+    assert limit.limit == 4
+    for _ in range(2):
+        limit.acquire_sync()
+    for _ in range(4):
+        limit.record(0.1, overloaded=False)
+    # About one more slot per window of four successes
+    assert limit.limit == 4
+    limit.record(0.1, overloaded=False)
+    assert limit.limit == 5
+    for _ in range(10):
+        limit.record(0.1, overloaded=False)
+    # Two requests in flight keep a limit of at most 4 in use
+    assert limit.limit == 5
+    limit.acquire_sync()
+    for _ in range(10):
+        limit.record(0.1, overloaded=False)
+    assert limit.limit == 6
+
+
+def test_aimd_backs_off_once_per_window():
+    clock = Clock()
+    limit = AdaptiveLimit(initial=16, min_limit=3, clock=clock)
+    clock.now = 10
+    limit.record(1.0, overloaded=True)
+    assert limit.limit == 8
+    # Requests that started before the decrease don't cut it again
+    limit.record(0.5, overloaded=True)
+    assert limit.limit == 8
+    clock.now = 12
+    limit.record(1.0, overloaded=True)
+    assert limit.limit == 4
+    clock.now = 14
+    limit.record(1.0, overloaded=True)
+    assert limit.limit == 3
+
+
+def test_aimd_latency_threshold_counts_as_overload():
+    limit = AdaptiveLimit(initial=8, latency_threshold=2.0, smoothing=0.5)
+    limit.record(1.0, overloaded=False)
+    # One slow response alone doesn't lift the average over the threshold
+    limit.record(3.0, overloaded=False)
+    assert limit.limit == 8
+    assert limit.latency == 2.0
+    limit.record(4.0, overloaded=False)
+    assert limit.limit == 4
+    assert limit.latency == 3.0
+
+
+def test_aimd_ignores_latency_without_threshold():
+    limit = AdaptiveLimit(initial=8)
+    for _ in range(3):
+        limit.record(60.0, overloaded=False)
+    assert limit.limit == 8
+
+
+def test_aimd_growth_wakes_waiters():
+    limit = AdaptiveLimit(initial=1, max_limit=2)
+    limit.acquire_sync()
+    assert not limit.acquire_sync(timeout=0.01)
+    acquired = threading.Event()
+    thread = threading.Thread(target=lambda: limit.acquire_sync() and acquired.set())
+    thread.start()
+    limit.record(0.1, overloaded=False)
+    assert acquired.wait(1)
+    thread.join()
+    assert limit.in_flight == 2
+
+
+def test_client_feeds_adaptive_limit():
+    statuses = iter([200, 200, 200, 503])
+    adaptive = AdaptiveLimit(initial=2, max_limit=8)
+    limiter = RateLimiter(groups={"crud": Limit(max_concurrency=adaptive)})
+    client = ObotClient(
+        "http://obot",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(next(statuses), json=AGENT)
+        ),
+        rate_limit=limiter,
+        retry=False,
+    )
+    client.agents.get("a1")
+    client.agents.get("a2")
+    assert limiter.limits() == {"crud": 2}
+    client.agents.get("a3")
+    assert limiter.limits() == {"crud": 3}
+    with pytest.raises(ObotAPIError):
+        client.agents.get("a4")
+    assert limiter.limits() == {"crud": 1}
+    assert adaptive.in_flight == 0
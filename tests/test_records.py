@@ -0,0 +1,57 @@
+import pickle
+
+import pytest
+
+from obot.models.agent import Agent
+from obot.models.credential import Credential
+from obot.models.run import Run
+from obot.models.thread import Thread
+from obot.models.webhook import Webhook
+from obot.models.workflow import Workflow
+from obot.records import AgentRecord, record_type
+
+AGENT = {
+    "id": "a1",
+    "name": "Agent",
+    "model": "m1",
+    "tools": ["time"],
+    "links": {"invoke": "http://obot/api/invoke/a1"},
+}
+
+
+def test_record_mirrors_model():
+    record = AgentRecord.from_dict(AGENT)
+    assert record.name == "Agent"
+    assert record.description == ""
+    assert record.links.invoke == "http://obot/api/invoke/a1"
+    assert record.to_model() == Agent.model_validate(AGENT)
+    assert record.to_model().model_dump(exclude_unset=True) == AGENT
+
+
+def test_fields_equal_to_defaults_survive_to_model():
+    data = dict(AGENT, default=False, description="", icons=None)
+    record = AgentRecord.from_dict(data)
+    assert record.to_model().model_dump(exclude_unset=True) == data
+    restored = pickle.loads(pickle.dumps(record))
+    assert restored.to_model().model_dump(exclude_unset=True) == data
+
+
+def test_record_is_immutable():
+    record = AgentRecord.from_dict(AGENT)
+    with pytest.raises(AttributeError):
+        record.name = "Other"
+    with pytest.raises(AttributeError):
+        record.extra = 1
+
+
+def test_pickle_round_trip():
+    record = AgentRecord.from_dict(AGENT)
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+@pytest.mark.parametrize("model", [Thread, Workflow, Run, Credential, Webhook])
+def test_pickle_round_trip_of_unexported_record(model):
+    record = record_type(model).from_dict({"id": "x1", "name": "X"})
+    restored = pickle.loads(pickle.dumps(record))
+    assert type(restored) is type(record)
+    assert restored == record
@@ -0,0 +1,128 @@
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from obot import AsyncObotClient, ObotAPIError, ObotClient
+from obot.retry import RetryBudget, RetryPolicy
+
+AGENT = {"id": "a1", "name": "Agent"}
+
+
+@pytest.mark.parametrize(
+    "method, path, status, error, retried",
+    [
+        ("GET", "/api/agents/a1", 503, None, True),
+        ("GET", "/api/agents/a1", 500, None, False),
+        ("GET", "/api/agents/a1", 404, None, False),
+        ("PUT", "/api/agents/a1", 502, None, True),
+        ("POST", "/api/agents", 503, None, False),
+        ("POST", "/api/agents", 429, None, True),
+        ("POST", "/api/invoke/a1", 504, None, True),
+        ("POST", "/api/agents", None, httpx.ConnectError("refused"), True),
+        ("POST", "/api/agents", None, httpx.ReadTimeout("slow"), False),
+        ("GET", "/api/agents/a1", None, httpx.ReadTimeout("slow"), True),
+        ("GET", "/api/agents/a1", None, ValueError("bug"), False),
+    ],
+)
+def test_classification(method, path, status, error, retried):
+    policy = RetryPolicy(budget=None)
+    delay = policy.retry_delay(method, path, 1, status=status, error=error)
+    assert (delay is not None) is retried
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(max_attempts=10, backoff=1, max_backoff=4, budget=None)
+    for attempt, bound in [(1, 1), (2, 2), (3, 4), (6, 4)]:
+        delays = [
+            policy.retry_delay("GET", "/x", attempt, status=503) for _ in range(50)
+        ]
+        assert all(0 <= d <= bound for d in delays)
+    assert policy.retry_delay("GET", "/x", 10, status=503) is None
+
+
+def test_retry_after_takes_precedence():
+    policy = RetryPolicy(max_retry_after=10, budget=None)
+    assert policy.retry_delay("GET", "/x", 1, status=429, retry_after="3") == 3
+    assert policy.retry_delay("GET", "/x", 1, status=503, retry_after="300") == 10
+    date = formatdate(time.time() + 5, usegmt=True)
+    assert 3 < policy.retry_delay("GET", "/x", 1, status=503, retry_after=date) <= 5
+    # Only 429 and 503 carry a meaningful Retry-After
+    assert policy.retry_delay("GET", "/x", 1, status=502, retry_after="3") <= 0.5
+    assert policy.retry_delay("GET", "/x", 1, status=429, retry_after="soon") <= 0.5
+
+
+def test_budget_stops_retries_and_refills():
+    budget = RetryBudget(max_tokens=4, token_ratio=0.5)
+    assert budget.on_failure()  # 3 left
+    assert not budget.on_failure()  # 2 left, not more than half
+    for _ in range(3):
+        budget.on_success()
+    assert budget.tokens == 3.5
+    assert budget.on_failure()
+
+
+def flaky(statuses, calls):
+    """A server answering with ``statuses`` in turn, then 200."""
+
+    def handler(request):
+        calls.append(request.method)
+        if len(calls) <= len(statuses):
+            return httpx.Response(statuses[len(calls) - 1])
+        return httpx.Response(200, json=AGENT)
+
+    return handler
+
+
+def test_get_is_retried_until_success():
+    calls = []
+    client = ObotClient(
+        "http://obot",
+        transport=httpx.MockTransport(flaky([503, 502], calls)),
+        retry=RetryPolicy(backoff=0),
+    )
+    assert client.agents.get("a1").id == "a1"
+    assert len(calls) == 3
+
+
+def test_gives_up_after_max_attempts():
+    calls = []
+    client = ObotClient(
+        "http://obot",
+        transport=httpx.MockTransport(flaky([503] * 5, calls)),
+        retry=RetryPolicy(backoff=0, max_attempts=2),
+    )
+    with pytest.raises(ObotAPIError) as info:
+        client.agents.get("a1")
+    assert info.value.status_code == 503
+    assert len(calls) == 2
+
+
+def test_retry_disabled():
+    calls = []
+    client = ObotClient(
+        "http://obot", transport=httpx.MockTransport(flaky([503], calls)), retry=False
+    )
+    with pytest.raises(ObotAPIError):
+        client.agents.get("a1")
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_connect_error_is_retried():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json=AGENT)
+
+    async with AsyncObotClient(
+        "http://obot",
+        transport=httpx.MockTransport(handler),
+        retry=RetryPolicy(backoff=0),
+    ) as client:
+        assert (await client.agents.get("a1")).id == "a1"
+    assert len(calls) == 2
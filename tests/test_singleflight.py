@@ -0,0 +1,180 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from obot import AsyncObotClient, ObotAPIError, ObotClient
+from obot.batch import run_batch_sync
+from obot.singleflight import SingleFlight
+
+AGENT = {"id": "a1", "name": "Agent"}
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def func():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return object()
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do_sync("k", func)))
+        for _ in range(4)
+    ]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {"calls": 1, "coalesced": 3, "in_flight": 0}
+    # Nothing is cached once the call finishes
+    flight.do_sync("k", func)
+    assert len(calls) == 2
+
+
+def test_errors_reach_every_caller():
+    flight = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def func():
+        started.set()
+        time.sleep(0.05)
+        raise ValueError("boom")
+
+    def call():
+        try:
+            flight.do_sync("k", func)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    call()
+    leader.join()
+    assert len(errors) == 2
+    assert flight.stats()["calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_doesnt_cancel_others():
+    flight = SingleFlight()
+    calls = []
+
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("k", func))
+    second = asyncio.ensure_future(flight.do("k", func))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    assert await second == "done"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_call_is_cancelled_when_every_caller_leaves():
+    flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def func():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "stale"
+
+    caller = asyncio.ensure_future(flight.do("k", func))
+    await asyncio.sleep(0.01)
+    caller.cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+    async def fresh():
+        return "fresh"
+
+    # A new caller starts a new call instead of joining the cancelled one
+    assert await flight.do("k", fresh) == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_waiters_get_copies():
+    flight = SingleFlight()
+
+    async def func():
+        await asyncio.sleep(0.01)
+        return ["shared"]
+
+    results = await asyncio.gather(*(flight.do("k", func, copy=list) for _ in range(3)))
+    assert results == [["shared"]] * 3
+    assert len({id(result) for result in results}) == 3
+
+
+def counting_server(calls, delay=0.05):
+    def handler(request):
+        calls.append(request.url.path)
+        time.sleep(delay)
+        return httpx.Response(200, json=AGENT)
+
+    return handler
+
+
+def test_client_coalesces_identical_gets():
+    calls = []
+    client = ObotClient(
+        "http://obot", transport=httpx.MockTransport(counting_server(calls))
+    )
+    results = run_batch_sync(client.agents.get, ["a1"] * 4 + ["a2"])
+    assert [r.result.id for r in results] == ["a1"] * 5
+    # Each caller gets its own copy of the model built once per request
+    agents = [r.result for r in results]
+    assert agents[0] == agents[1] == agents[2] == agents[3]
+    assert len({id(agent) for agent in agents}) == 5
+    assert sorted(calls) == ["/api/agents/a1", "/api/agents/a2"]
+
+
+def test_coalescing_can_be_disabled():
+    calls = []
+    client = ObotClient(
+        "http://obot",
+        transport=httpx.MockTransport(counting_server(calls)),
+        coalesce=False,
+    )
+    run_batch_sync(client.agents.get, ["a1"] * 3)
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_errors():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(404)
+
+    async with AsyncObotClient(
+        "http://obot", transport=httpx.MockTransport(handler)
+    ) as client:
+        results = await asyncio.gather(
+            *(client.agents.get("a1") for _ in range(3)), return_exceptions=True
+        )
+    assert all(isinstance(r, ObotAPIError) for r in results)
+    assert len(calls) == 1
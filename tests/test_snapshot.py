@@ -0,0 +1,86 @@
+import httpx
+
+from obot import ObotClient
+from obot.snapshot import CatalogSnapshot
+
+MODEL = {
+    "id": "m1",
+    "name": "gpt-4o",
+    "type": "model",
+    "created": "2024-01-01T00:00:00Z",
+    "revision": "1",
+    "targetModel": "gpt-4o",
+    "modelProvider": "openai",
+    "active": True,
+    "usage": "llm",
+    "aliasAssigned": True,
+}
+
+
+def models_server(calls):
+    def handler(request):
+        calls.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"'})
+        return httpx.Response(200, json={"items": [MODEL]}, headers={"etag": '"v1"'})
+
+    return handler
+
+
+def client(snapshot, calls):
+    return ObotClient(
+        "http://obot",
+        transport=httpx.MockTransport(models_server(calls)),
+        catalog_snapshot=snapshot,
+    )
+
+
+def test_store_load_and_claim(tmp_path):
+    now = [1000.0]
+    snapshot = CatalogSnapshot(str(tmp_path / "db.sqlite3"), clock=lambda: now[0])
+    assert snapshot.load("http://obot/", "/api/models") is None
+    snapshot.store("http://obot/", "/api/models", b"{}", '"v1"')
+    entry = snapshot.load("http://obot/", "/api/models")
+    assert entry.body == b"{}" and entry.etag == '"v1"' and entry.age == 0
+    assert not snapshot.claim("http://obot/", "/api/models")
+    now[0] += snapshot.refresh_interval
+    assert snapshot.claim("http://obot/", "/api/models")
+    assert not snapshot.claim("http://obot/", "/api/models")
+    now[0] += snapshot.max_age + 1
+    assert snapshot.load("http://obot/", "/api/models") is None
+
+
+def test_warm_start_serves_snapshot(tmp_path):
+    path = str(tmp_path / "db.sqlite3")
+    first, second = [], []
+    assert client(CatalogSnapshot(path), first).models()[0].id == "m1"
+    assert first == [None]
+    snapshot = CatalogSnapshot(path, refresh_interval=3600)
+    assert client(snapshot, second).models()[0].id == "m1"
+    assert second == []
+
+
+def test_unwritable_directory_falls_back_to_network(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    calls = []
+    snapshot = CatalogSnapshot(str(blocker / "db.sqlite3"))
+    assert client(snapshot, calls).models()[0].id == "m1"
+    assert calls == [None]
+    assert snapshot.load("http://obot/", "/api/models") is None
+
+
+def test_corrupt_database_falls_back_to_network(tmp_path):
+    path = tmp_path / "db.sqlite3"
+    path.write_bytes(b"not a database" * 100)
+    calls = []
+    assert client(CatalogSnapshot(str(path)), calls).models()[0].id == "m1"
+    assert calls == [None]
+
+
+def test_undecodable_body_falls_back_to_network(tmp_path):
+    path = str(tmp_path / "db.sqlite3")
+    CatalogSnapshot(path).store("http://obot/", "/api/models", b"{not json", None)
+    calls = []
+    assert client(CatalogSnapshot(path), calls).models()[0].id == "m1"
+    assert calls == [None]
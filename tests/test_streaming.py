@@ -0,0 +1,119 @@
+import json
+
+import httpx
+import pytest
+
+from obot import AsyncObotClient, ObotClient
+from obot.streaming import (
+    ContentEvent,
+    DoneEvent,
+    InvokeStreamParser,
+    RunStatusEvent,
+    ToolCallEvent,
+    parse_stream,
+)
+
+PROGRESS = [
+    {"runID": "r1", "waitingOnModel": True},
+    {"runID": "r1", "content": "Hel", "contentID": "c1"},
+    {"runID": "r1", "content": "lo", "contentID": "c1"},
+    {"runID": "r1", "toolCall": {"name": "search", "input": '{"q": "x"}'}},
+    {"runID": "r1", "runComplete": True},
+]
+
+NDJSON = "".join(json.dumps(p) + "\n" for p in PROGRESS)
+SSE = "".join(f"event: progress\ndata: {json.dumps(p)}\n\n" for p in PROGRESS) + (
+    "data: [DONE]\n\n"
+)
+
+
+def summarize(events):
+    summary = []
+    for event in events:
+        if isinstance(event, ContentEvent):
+            summary.append(("content", event.content, event.content_id))
+        elif isinstance(event, ToolCallEvent):
+            summary.append(("tool", event.name, event.input))
+        elif isinstance(event, RunStatusEvent):
+            summary.append(("status", event.status, event.run_id))
+        elif isinstance(event, DoneEvent):
+            summary.append(("done",))
+    return summary
+
+
+EXPECTED = [
+    ("status", "waiting", "r1"),
+    ("content", "Hel", "c1"),
+    ("content", "lo", "c1"),
+    ("tool", "search", '{"q": "x"}'),
+    ("status", "complete", "r1"),
+    ("done",),
+]
+
+
+def split(text, size):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("body", [NDJSON, SSE, SSE.replace("\n", "\r\n")])
+@pytest.mark.parametrize("size", [1, 7, 10_000])
+def test_events_independent_of_chunking(body, size):
+    assert summarize(parse_stream(split(body, size))) == EXPECTED
+
+
+def test_events_arrive_as_lines_complete():
+    parser = InvokeStreamParser()
+    line = json.dumps(PROGRESS[1]) + "\n"
+    assert parser.feed(line[:10]) == []
+    assert summarize(parser.feed(line[10:])) == [("content", "Hel", "c1")]
+
+
+def test_trailing_line_without_newline_is_flushed():
+    body = NDJSON.rstrip("\n")
+    assert summarize(parse_stream([body])) == EXPECTED
+
+
+def test_multiline_data_and_comments():
+    payload = json.dumps({"content": "x", "contentID": "c1"}, indent=1)
+    body = ": keep-alive\nid: 1\n" + "".join(
+        f"data: {line}\n" for line in payload.splitlines()
+    )
+    body += "\nevent: close\n\n"
+    assert summarize(parse_stream([body])) == [("content", "x", "c1"), ("done",)]
+
+
+def test_error_and_plain_text_payloads():
+    body = 'data: {"runID": "r1", "error": "boom"}\n\ndata: not json\n\n'
+    events = list(parse_stream([body]))
+    assert events[0].status == "error" and events[0].error == "boom"
+    assert isinstance(events[1], ContentEvent) and events[1].content == "not json"
+    assert isinstance(events[-1], DoneEvent)
+
+
+def test_done_is_emitted_once():
+    body = "data: [DONE]\n\nevent: done\n\n"
+    assert summarize(parse_stream([body])) == [("done",)]
+
+
+def test_stream_events_from_client():
+    def handler(request):
+        return httpx.Response(200, content=iter(c.encode() for c in split(SSE, 13)))
+
+    client = ObotClient("http://obot", transport=httpx.MockTransport(handler))
+    assert summarize(client.chat.stream_events("a1", "Hi")) == EXPECTED
+
+
+@pytest.mark.asyncio
+async def test_async_stream_events_from_client():
+    async def body():
+        for chunk in split(NDJSON, 5):
+            yield chunk.encode()
+
+    async with AsyncObotClient(
+        "http://obot",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=body())
+        ),
+    ) as client:
+        events = [e async for e in client.chat.stream_events("a1", "Hi")]
+    assert summarize(events) == EXPECTED
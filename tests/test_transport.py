@@ -0,0 +1,62 @@
+import httpx
+import pytest
+
+from obot import ObotConfigError
+from obot.transport import DEFAULT_LIMITS, HTTP2_LIMITS, create_http_client
+
+
+@pytest.fixture
+def client_kwargs(monkeypatch):
+    """Record the keyword arguments httpx clients are created with."""
+    created = {}
+
+    def record(**kwargs):
+        created.update(kwargs)
+        return kwargs
+
+    monkeypatch.setattr(httpx, "Client", record)
+    monkeypatch.setattr(httpx, "AsyncClient", record)
+    return created
+
+
+def test_default_limits(client_kwargs):
+    create_http_client(is_async=False, base_url="https://obot")
+    assert client_kwargs["limits"] is DEFAULT_LIMITS
+    assert client_kwargs["http2"] is False
+
+
+@pytest.mark.parametrize(
+    "base_url, uds, expected",
+    [
+        ("https://obot", None, HTTP2_LIMITS),
+        ("http://obot", None, DEFAULT_LIMITS),
+        ("https://obot", "/run/obot.sock", DEFAULT_LIMITS),
+    ],
+)
+def test_http2_limits_only_when_negotiated(client_kwargs, base_url, uds, expected):
+    pytest.importorskip("h2")
+    create_http_client(is_async=True, base_url=base_url, http2=True, uds=uds)
+    assert client_kwargs["limits"] is expected
+
+
+def test_explicit_limits_win(client_kwargs):
+    pytest.importorskip("h2")
+    limits = httpx.Limits(max_connections=3)
+    create_http_client(
+        is_async=True, base_url="https://obot", http2=True, limits=limits
+    )
+    assert client_kwargs["limits"] is limits
+
+
+def test_transport_must_match_client_kind():
+    with pytest.raises(ObotConfigError):
+        create_http_client(is_async=True, transport=httpx.HTTPTransport())
+    with pytest.raises(ObotConfigError):
+        create_http_client(is_async=False, transport=httpx.AsyncHTTPTransport())
+
+
+def test_transport_and_uds_are_exclusive():
+    with pytest.raises(ObotConfigError):
+        create_http_client(
+            is_async=False, uds="/run/obot.sock", transport=httpx.HTTPTransport()
+        )
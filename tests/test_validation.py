@@ -0,0 +1,43 @@
+import pytest
+from pydantic import ValidationError
+
+from obot import ObotConfigError
+from obot.models import Model
+from obot.validation import ModelBuilder
+
+MODEL = {
+    "id": "m1",
+    "name": "gpt-4o",
+    "type": "model",
+    "created": "2024-01-01T00:00:00Z",
+    "revision": "1",
+    "targetModel": "gpt-4o",
+    "modelProvider": "openai",
+    "active": True,
+    "usage": "llm",
+    "aliasAssigned": True,
+}
+
+
+def test_default_mode_coerces():
+    model = ModelBuilder().build(Model, dict(MODEL, active="true"))
+    assert model.active is True
+
+
+def test_strict_mode_rejects_coercion():
+    builder = ModelBuilder("strict")
+    assert builder.build(Model, MODEL).id == "m1"
+    with pytest.raises(ValidationError):
+        builder.build_list(Model, [dict(MODEL, active="true")])
+
+
+def test_build_list_accepts_iterables():
+    models = ModelBuilder().build_list(
+        Model, (dict(MODEL, id=f"m{i}") for i in range(3))
+    )
+    assert [m.id for m in models] == ["m0", "m1", "m2"]
+
+
+def test_unknown_mode():
+    with pytest.raises(ObotConfigError):
+        ModelBuilder("trusted")